@@ -18,11 +18,16 @@ Basic usage:
 
     # Process a CSV file
     weather.process_csv("input.csv", "output.csv")
+
+    # From asyncio code
+    async with AsyncWeather() as weather:
+        result = await weather.get("10001", "2024-01-15")
 """
 
 import logging
 from importlib.metadata import PackageNotFoundError, version
 
+from get_weather_data.aio import AsyncWeather
 from get_weather_data.main import Weather
 from get_weather_data.weather.columnar import query_weather
 from get_weather_data.weather.location import LocationInput
@@ -39,6 +44,7 @@ except PackageNotFoundError:
     __version__ = "0.0.0"
 
 __all__ = [
+    "AsyncWeather",
     "Coverage",
     "HourlyResult",
     "LocationInput",
@@ -0,0 +1,264 @@
+"""Asyncio interface to the weather lookups.
+
+``AsyncWeather`` answers the same queries as ``Weather`` without
+blocking the event loop, for services (FastAPI, aiohttp) that would
+otherwise push every call to a thread themselves:
+
+- Online mode talks to the CDO API over ``httpx.AsyncClient``
+  (``AsyncOnlineLookup``).
+- Local mode first fetches the data a query will read: GSOD
+  station-year files download over ``httpx.AsyncClient``, GHCN years
+  build on the executor. The SQLite and file reads then run on the
+  executor too.
+- Concurrent queries that need the same GHCN year or GSOD station-year
+  share one fetch.
+
+Example:
+    async with AsyncWeather() as weather:
+        result = await weather.get("10001", "2024-01-15")
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from functools import partial
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import httpx
+
+from get_weather_data.core.download import download_with_retry_async
+from get_weather_data.core.logging import setup_logging
+from get_weather_data.core.singleflight import AsyncSingleFlight
+from get_weather_data.main import Weather
+from get_weather_data.weather.ghcn import ensure_ghcn_year
+from get_weather_data.weather.gsod import pending_gsod_download
+from get_weather_data.weather.location import LocationInput
+from get_weather_data.weather.lookup import WeatherLookup
+from get_weather_data.weather.online import AsyncOnlineLookup
+from get_weather_data.weather.results import WeatherResult
+from get_weather_data.weather.units import Source, Units
+
+logger = logging.getLogger("get_weather_data")
+
+# Nearest candidates per query whose data is fetched before the read;
+# farther stations are only reached when these lack a value
+FETCH_STATIONS = 2
+
+
+@dataclass
+class AsyncWeather:
+    """Asyncio counterpart of ``Weather`` for ``get`` and ``get_range``.
+
+    Takes the same options as ``Weather``. Use as an async context
+    manager, or call ``aclose()`` when done.
+
+    Args:
+        database_path: Path to SQLite database (default: standard location).
+        verbose: Enable verbose logging.
+        online: Query the NOAA CDO API instead of the local database
+            (requires NCDC_TOKEN).
+        units: "metric" (default) or "imperial" output values.
+        include_flags: Populate per-element GHCN QC flags.
+        include_weather_types: Populate present-weather phenomena.
+        explain: Populate ``stations_considered`` and ``missing``.
+        interpolate: Inverse-distance-weight the nearest stations.
+        source: "station", "grid" or "auto", as for ``Weather``.
+        max_workers: Threads for database and file reads (default:
+            ``ThreadPoolExecutor``'s).
+    """
+
+    database_path: Path | str | None = None
+    verbose: bool = False
+    online: bool = False
+    units: Units = "metric"
+    include_flags: bool = False
+    include_weather_types: bool = False
+    explain: bool = False
+    interpolate: bool = False
+    source: Source = "station"
+    max_workers: int | None = None
+    _weather: Weather | None = field(default=None, repr=False)
+    _online_lookup: AsyncOnlineLookup | None = field(default=None, repr=False)
+    _executor: ThreadPoolExecutor | None = field(default=None, repr=False)
+    _http: httpx.AsyncClient | None = field(default=None, repr=False)
+    _flights: AsyncSingleFlight = field(default_factory=AsyncSingleFlight, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the online lookup or the wrapped local ``Weather``.
+
+        Raises:
+            ValueError: If online=True and no NCDC token is configured.
+        """  # noqa: DOC502 - raised by AsyncNOAAClient construction
+        if self.online:
+            setup_logging(verbose=self.verbose)
+            self._online_lookup = AsyncOnlineLookup(
+                units=self.units,
+                include_weather_types=self.include_weather_types,
+                explain=self.explain,
+            )
+        else:
+            self._weather = Weather(
+                database_path=self.database_path,
+                verbose=self.verbose,
+                units=self.units,
+                include_flags=self.include_flags,
+                include_weather_types=self.include_weather_types,
+                explain=self.explain,
+                interpolate=self.interpolate,
+                source=self.source,
+            )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="async-weather"
+        )
+
+    async def get(
+        self,
+        location: LocationInput,
+        target_date: str | date,
+        elements: list[str] | None = None,
+    ) -> WeatherResult:
+        """Get weather data for a location and date.
+
+        Args:
+            location: 5-digit US ZIP code, "lat,lon" string, or
+                (lat, lon) tuple.
+            target_date: Date as string (YYYY-MM-DD) or date object.
+            elements: List of weather elements to retrieve.
+
+        Returns:
+            WeatherResult with available weather data.
+        """
+        target_date = _as_date(target_date)
+        if self._online_lookup is not None:
+            return await self._online_lookup.get_weather(
+                location, target_date, elements
+            )
+        weather = self._local()
+        await self._fetch_inputs(location, target_date, target_date)
+        return await self._run(weather.get, location, target_date, elements)
+
+    async def get_range(
+        self,
+        location: LocationInput,
+        start_date: str | date,
+        end_date: str | date,
+        elements: list[str] | None = None,
+    ) -> list[WeatherResult]:
+        """Get weather data for a location over a date range.
+
+        Args:
+            location: 5-digit US ZIP code, "lat,lon" string, or
+                (lat, lon) tuple.
+            start_date: Start date as string (YYYY-MM-DD) or date object.
+            end_date: End date as string (YYYY-MM-DD) or date object.
+            elements: List of weather elements to retrieve.
+
+        Returns:
+            List of WeatherResult objects, one per day.
+        """
+        start_date = _as_date(start_date)
+        end_date = _as_date(end_date)
+        if self._online_lookup is not None:
+            return await self._online_lookup.get_weather_range(
+                location, start_date, end_date, elements
+            )
+        weather = self._local()
+        await self._fetch_inputs(location, start_date, end_date)
+        return await self._run(
+            weather.get_range, location, start_date, end_date, elements
+        )
+
+    def _local(self) -> Weather:
+        if self._weather is None:
+            raise RuntimeError("AsyncWeather has no local lookup (online=True)")
+        return self._weather
+
+    async def _run(self, func: Any, *args: Any) -> Any:
+        """Run a blocking call on the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def _fetch_inputs(
+        self, location: LocationInput, start_date: date, end_date: date
+    ) -> None:
+        """Fetch the GHCN years and GSOD files a query will read first.
+
+        Failures are left for the read itself to report.
+        """
+        if self.source == "grid":
+            return
+        weather = self._local()
+        # Station search and the first lookup's cache preload touch SQLite
+        lookup = await self._flights.run("lookup", partial(self._run, _lookup, weather))
+        queries = [
+            (location, max(start_date, date(year, 1, 1)))
+            for year in range(start_date.year, end_date.year + 1)
+        ]
+        station_years = await self._run(lookup.station_years, queries, FETCH_STATIONS)
+        fetches = []
+        for station_id, station_type, year in station_years:
+            if station_type == "GHCND":
+                fetches.append(
+                    self._flights.run(
+                        ("GHCND", year), partial(self._run, ensure_ghcn_year, year)
+                    )
+                )
+            elif station_type == "USAF-WBAN":
+                fetches.append(
+                    self._flights.run(
+                        ("USAF-WBAN", station_id, year),
+                        partial(self._fetch_gsod, station_id, year),
+                    )
+                )
+        for outcome in await asyncio.gather(*fetches, return_exceptions=True):
+            if isinstance(outcome, Exception):
+                logger.debug(f"Fetch ahead of lookup failed: {outcome}")
+
+    async def _fetch_gsod(self, station_id: str, year: int) -> Path | None:
+        """Download a GSOD station-year unless it is already cached."""
+        # Checking the cache stats the disk, so it runs on the executor
+        target = await self._run(pending_gsod_download, station_id, year)
+        if target is None:
+            return None
+        return await self._download(*target)
+
+    async def _download(self, url: str, path: Path) -> Path | None:
+        if self._http is None:
+            self._http = httpx.AsyncClient()
+        return await download_with_retry_async(url, path, self._http)
+
+    async def aclose(self) -> None:
+        """Close HTTP clients and the executor."""
+        if self._online_lookup is not None:
+            await self._online_lookup.aclose()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncWeather":
+        """Return self (resources open lazily)."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the instance."""
+        await self.aclose()
+
+
+def _lookup(weather: Weather) -> WeatherLookup:
+    """Create (once) and return the wrapped Weather's station lookup."""
+    return weather.lookup
+
+
+def _as_date(value: str | date) -> date:
+    return date.fromisoformat(value) if isinstance(value, str) else value
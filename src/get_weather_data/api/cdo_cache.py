@@ -0,0 +1,211 @@
+"""Persistent cache of CDO API responses, and the daily request count.
+
+Enabled by default (``Config(cdo_cache=False)`` turns it off). Each
+collection query ``NOAAClient`` pages through (``/stations`` searches,
+``/data`` for a station list or ZIP) is stored whole in a SQLite file
+under ``config.cdo_cache_dir``, keyed by a hash of its endpoint and
+normalized parameters. Re-running an online analysis then answers from
+disk instead of spending the token's 10,000 requests/day again.
+
+Expiry follows ``year_is_immutable`` on the query's end date: responses
+covering only final years never expire; ones reaching into the current
+or previous year expire after ``config.cache_max_age_days``.
+
+The same file counts the requests each token sends per UTC day, so the
+quota used survives restarts and is visible (``get-weather cache info``).
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any
+
+from get_weather_data.core.cache import year_is_immutable
+from get_weather_data.core.config import get_config
+
+logger = logging.getLogger("get_weather_data")
+
+# Bump when the stored response shape changes so old entries stop matching.
+CDO_CACHE_VERSION = 1
+
+_SECONDS_PER_DAY = 86400
+
+
+def response_key(endpoint: str, params: dict[str, Any]) -> str:
+    """Content address of a collection query.
+
+    List values (station ids, data types) are sorted, so the same query
+    in another order shares an entry; paging parameters are ignored.
+
+    Args:
+        endpoint: Path under the API base URL (e.g. "data").
+        params: Query parameters.
+
+    Returns:
+        Hex SHA-256 of the canonical JSON of the query.
+    """
+    normalized = {
+        name: sorted(value) if isinstance(value, list) else value
+        for name, value in params.items()
+        if name not in ("limit", "offset")
+    }
+    payload = json.dumps(
+        [CDO_CACHE_VERSION, endpoint, normalized],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def token_id(token: str) -> str:
+    """Stable identifier of a token that does not reveal it."""
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+def _today() -> str:
+    return datetime.now(UTC).date().isoformat()
+
+
+class CDOCache:
+    """SQLite-backed CDO response store, safe to share across threads.
+
+    Several processes may open the same file; SQLite serializes their
+    writes.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Open (creating if needed) a response cache.
+
+        Args:
+            path: SQLite file. Defaults to ``responses.sqlite`` in
+                ``config.cdo_cache_dir``.
+        """
+        self.path = (
+            get_config().cdo_cache_dir / "responses.sqlite" if path is None else path
+        )
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS requests "
+                "(token TEXT NOT NULL, day TEXT NOT NULL, count INTEGER NOT NULL, "
+                "PRIMARY KEY (token, day))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """Look up a stored response.
+
+        Args:
+            key: Content address from :func:`response_key`.
+
+        Returns:
+            The stored "results" entries, or None on a miss (including
+            an expired entry).
+        """
+        with self._lock:
+            row = (
+                self._connection()
+                .execute("SELECT value, expires FROM responses WHERE key = ?", (key,))
+                .fetchone()
+            )
+            if row is None or (row[1] is not None and row[1] <= time.time()):
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, results: list[dict[str, Any]], end: date) -> None:
+        """Store a response, with an expiry set by its last year.
+
+        Args:
+            key: Content address from :func:`response_key`.
+            results: Every "results" entry of the query.
+            end: The query's end date.
+        """
+        expires = None
+        if not year_is_immutable(end.year):
+            expires = time.time() + get_config().cache_max_age_days * _SECONDS_PER_DAY
+        value = json.dumps(results, separators=(",", ":"))
+        with self._lock:
+            conn = self._connection()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires) "
+                    "VALUES (?, ?, ?)",
+                    (key, value, expires),
+                )
+                conn.commit()
+            except sqlite3.OperationalError as exc:
+                # A locked or read-only cache must not fail the lookup
+                logger.debug("Could not store CDO response %s: %s", key, exc)
+
+    def count_request(self, token: str) -> None:
+        """Add one request to a token's count for today.
+
+        Args:
+            token: CDO API token.
+        """
+        with self._lock:
+            conn = self._connection()
+            try:
+                conn.execute(
+                    "INSERT INTO requests (token, day, count) VALUES (?, ?, 1) "
+                    "ON CONFLICT (token, day) DO UPDATE SET count = count + 1",
+                    (token_id(token), _today()),
+                )
+                conn.commit()
+            except sqlite3.OperationalError as exc:
+                logger.debug("Could not count CDO request: %s", exc)
+
+    def requests_today(self, token: str | None = None) -> int:
+        """Requests counted today (UTC).
+
+        Args:
+            token: Count one token's requests (default: all tokens).
+
+        Returns:
+            Number of requests sent today.
+        """
+        if self._conn is None and not self.path.exists():
+            return 0  # nothing sent yet; do not create the file
+        query = "SELECT COALESCE(SUM(count), 0) FROM requests WHERE day = ?"
+        args: tuple[str, ...] = (_today(),)
+        if token is not None:
+            query += " AND token = ?"
+            args += (token_id(token),)
+        with self._lock:
+            return int(self._connection().execute(query, args).fetchone()[0])
+
+    def clear(self) -> None:
+        """Delete every stored response (request counts are kept)."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+            self.hits = self.misses = 0
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
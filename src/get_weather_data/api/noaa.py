@@ -3,17 +3,32 @@
 Get a free token at https://www.ncdc.noaa.gov/cdo-web/token and set the
 NCDC_TOKEN environment variable. Tokens are limited to 5 requests per
 second and 10,000 requests per day.
+
+``NOAAClient`` is synchronous; ``AsyncNOAAClient`` offers the same
+queries over ``httpx.AsyncClient`` for asyncio applications. Both share
+the response handling, retry policy and parameter encoding below, and
+pace their requests through one ``CDORateLimiter`` per token, so the
+pages of a large result and the year chunks of a long range can be
+fetched concurrently while staying inside the API's limits. Complete
+collection responses are kept on disk (``api.cdo_cache``), so a repeated
+query costs no requests.
 """
 
+import asyncio
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import date
+from datetime import UTC, date, datetime
 from typing import Any
 
 import httpx
 
+from get_weather_data.api.cdo_cache import CDOCache, response_key
 from get_weather_data.core.config import get_config
+from get_weather_data.core.download import get_client
+from get_weather_data.core.ratelimit import TokenBucket
 
 logger = logging.getLogger("get_weather_data")
 
@@ -26,11 +41,249 @@ PAGE_LIMIT = 1000
 
 _RETRYABLE_STATUS = {429, 500, 502, 503, 504}
 
+# Per-token limits published for CDO v2
+REQUESTS_PER_SECOND = 5
+REQUESTS_PER_DAY = 10_000
+# Requests one client keeps in flight (pages and year chunks)
+DEFAULT_CONCURRENCY = 5
+
 
 class NOAAAPIError(Exception):
     """The CDO API returned an unrecoverable error or retries ran out."""
 
 
+class CDORateLimiter:
+    """Pace the requests made with one CDO token.
+
+    Spaces requests at ``per_second`` (a token bucket holding a single
+    token, so no one-second window ever sees more than the limit) and
+    counts them against ``per_day``, which resets at midnight UTC.
+    Thread-safe; shared by every client using the token in this process.
+    """
+
+    def __init__(
+        self,
+        per_second: float = REQUESTS_PER_SECOND,
+        per_day: int = REQUESTS_PER_DAY,
+        used: int = 0,
+    ) -> None:
+        """Start with a full bucket.
+
+        Args:
+            per_second: Requests per second; 0 disables spacing.
+            per_day: Requests allowed per UTC day.
+            used: Requests already sent today (e.g. by earlier runs).
+        """
+        self.per_day = per_day
+        self._bucket = TokenBucket(per_second)
+        self._lock = threading.Lock()
+        self._day = datetime.now(UTC).date()
+        self._used = used
+
+    def reserve(self) -> float:
+        """Count one request, returning the seconds to wait before sending it.
+
+        Returns:
+            Delay in seconds (0.0 when the request may go now).
+
+        Raises:
+            NOAAAPIError: If today's quota is used up.
+        """
+        with self._lock:
+            today = datetime.now(UTC).date()
+            if today != self._day:
+                self._day, self._used = today, 0
+            if self._used >= self.per_day:
+                raise NOAAAPIError(
+                    f"CDO daily quota of {self.per_day} requests is used up; "
+                    "it resets at midnight UTC"
+                )
+            self._used += 1
+        return self._bucket.reserve()
+
+    @property
+    def used_today(self) -> int:
+        """Requests counted against today's quota."""
+        with self._lock:
+            return self._used if self._day == datetime.now(UTC).date() else 0
+
+
+_limiters: dict[tuple[str, float], CDORateLimiter] = {}
+_limiters_guard = threading.Lock()
+
+
+def rate_limiter(
+    token: str, per_second: float = REQUESTS_PER_SECOND, used: int = 0
+) -> CDORateLimiter:
+    """The process-wide limiter for a token (created on first use).
+
+    Args:
+        token: CDO API token.
+        per_second: Requests per second; 0 disables spacing.
+        used: Requests already sent today, if the limiter is new.
+
+    Returns:
+        The limiter every client with this token and rate shares.
+    """
+    with _limiters_guard:
+        limiter = _limiters.get((token, per_second))
+        if limiter is None:
+            limiter = _limiters[(token, per_second)] = CDORateLimiter(
+                per_second, used=used
+            )
+        return limiter
+
+
+class _RetryableError(Exception):
+    """A rate-limit, server or transport failure worth retrying."""
+
+    def __init__(self, message: str, retry_after: str | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _resolve_token(token: str | None) -> str:
+    """The given token, or the configured one.
+
+    Raises:
+        ValueError: If no token is configured.
+    """
+    if token is None:
+        token = get_config().ncdc_token
+    if not token:
+        raise ValueError(
+            f"NCDC token required for online mode. Get one at {TOKEN_URL} "
+            "and set the NCDC_TOKEN environment variable."
+        )
+    return token
+
+
+def _parse_response(
+    response: httpx.Response, endpoint: str, ok_404: bool
+) -> dict[str, Any] | None:
+    """Parsed JSON body of a CDO response ({} when empty, None on allowed 404).
+
+    Raises:
+        _RetryableError: On rate-limit and server errors.
+        NOAAAPIError: On other client errors.
+    """
+    if response.status_code == 200:
+        if not response.content:
+            return {}
+        return response.json()
+    if response.status_code == 404 and ok_404:
+        return None
+    if response.status_code in _RETRYABLE_STATUS:
+        raise _RetryableError(
+            f"HTTP {response.status_code}", response.headers.get("Retry-After")
+        )
+    if response.status_code == 401:
+        raise NOAAAPIError(
+            f"CDO API rejected the token (HTTP 401). Check NCDC_TOKEN; "
+            f"tokens are issued at {TOKEN_URL}."
+        )
+    raise NOAAAPIError(
+        f"CDO API error for {endpoint}: HTTP {response.status_code} "
+        f"{response.text[:200]}"
+    )
+
+
+def _retry_wait(retry_delay: float, attempt: int, retry_after: str | None) -> float:
+    """Seconds to wait before retrying: Retry-After if given, else exponential."""
+    if retry_after is not None:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return retry_delay * 2**attempt
+
+
+def _page_params(params: dict[str, Any], offset: int) -> dict[str, Any]:
+    return {**params, "limit": PAGE_LIMIT, "offset": offset}
+
+
+def _remaining_offsets(first: dict[str, Any]) -> list[int]:
+    """Offsets of the pages after the first, from its result count."""
+    resultset = first.get("metadata", {}).get("resultset", {})
+    count = int(resultset.get("count", 0))
+    return list(range(1 + PAGE_LIMIT, count + 1, PAGE_LIMIT))
+
+
+def _per_second(min_request_interval: float) -> float:
+    return 1.0 / min_request_interval if min_request_interval > 0 else 0.0
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+
+def _setup_client(client: "NOAAClient | AsyncNOAAClient") -> None:
+    """Resolve a client's token, response cache and shared rate limiter.
+
+    Raises:
+        ValueError: If no token is configured or max_concurrency is
+            less than 1.
+    """  # noqa: DOC502 - raised by _resolve_token/_check_concurrency
+    client.token = _resolve_token(client.token)
+    _check_concurrency(client.max_concurrency)
+    if client.cache is None and get_config().cdo_cache:
+        client.cache = CDOCache()
+    if client.limiter is None:
+        used = client.cache.requests_today(client.token) if client.cache else 0
+        client.limiter = rate_limiter(
+            client.token, _per_second(client.min_request_interval), used
+        )
+
+
+def _cached(
+    cache: CDOCache | None, endpoint: str, params: dict[str, Any]
+) -> tuple[str | None, list[dict[str, Any]] | None]:
+    """Cache key of a collection query and its stored results, if any."""
+    if cache is None:
+        return None, None
+    key = response_key(endpoint, params)
+    return key, cache.get(key)
+
+
+def _station_params(
+    extent: tuple[float, float, float, float], start: date, end: date
+) -> dict[str, Any]:
+    south, west, north, east = extent
+    return {
+        "datasetid": "GHCND",
+        "extent": f"{south},{west},{north},{east}",
+        "startdate": start.isoformat(),
+        "enddate": end.isoformat(),
+    }
+
+
+def _station_data_params(
+    station_ids: list[str], start: date, end: date
+) -> dict[str, Any]:
+    return {
+        "datasetid": "GHCND",
+        # httpx encodes a list value as repeated stationid params
+        "stationid": station_ids,
+        "startdate": start.isoformat(),
+        "enddate": end.isoformat(),
+    }
+
+
+def _station_infos(payload: list[dict[str, Any]]) -> list["StationInfo"]:
+    return [
+        StationInfo(
+            id=entry["id"],
+            name=entry.get("name"),
+            latitude=entry.get("latitude"),
+            longitude=entry.get("longitude"),
+            elevation=entry.get("elevation"),
+        )
+        for entry in payload
+        if entry.get("id")
+    ]
+
+
 @dataclass
 class StationInfo:
     """Metadata for a CDO station."""
@@ -53,8 +306,15 @@ class NOAAClient:
         timeout: Per-request timeout in seconds.
         max_retries: Retries for rate-limit/server/transport errors.
         retry_delay: Base delay for exponential backoff, in seconds.
-        min_request_interval: Client-side throttle between requests, in
-            seconds (the API allows 5 requests per second).
+        min_request_interval: Spacing between requests made with the
+            token, in seconds (the API allows 5 requests per second);
+            0 disables spacing.
+        max_concurrency: Requests kept in flight at once when a result
+            spans several pages or year chunks.
+        limiter: Rate limiter to pace requests with (default: the one
+            shared by every client using the token).
+        cache: Response store (default: opened from config when
+            ``Config.cdo_cache`` is set).
     """
 
     token: str | None = None
@@ -62,32 +322,40 @@ class NOAAClient:
     timeout: float = 30.0
     max_retries: int = 3
     retry_delay: float = 1.0
-    min_request_interval: float = 0.25
-    _last_request: float = field(default=0.0, repr=False)
+    min_request_interval: float = 1.0 / REQUESTS_PER_SECOND
+    max_concurrency: int = DEFAULT_CONCURRENCY
+    limiter: CDORateLimiter | None = field(default=None, repr=False)
+    cache: CDOCache | None = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
-        """Fill the token from config and validate it.
+        """Fill the token, cache and limiter, and validate the settings.
 
         Raises:
-            ValueError: If no token is configured.
-        """
-        if self.token is None:
-            self.token = get_config().ncdc_token
+            ValueError: If no token is configured or max_concurrency is
+                less than 1.
+        """  # noqa: DOC502 - raised by _setup_client
+        _setup_client(self)
 
-        if not self.token:
-            raise ValueError(
-                f"NCDC token required for online mode. Get one at {TOKEN_URL} "
-                "and set the NCDC_TOKEN environment variable."
-            )
+    def requests_today(self) -> int:
+        """Requests sent with this client's token today (UTC).
+
+        Counted across runs when the response cache is on, else in
+        this process only.
+
+        Returns:
+            Requests counted against today's 10,000 quota.
+        """
+        if self.cache is not None and self.token:
+            return self.cache.requests_today(self.token)
+        return self.limiter.used_today if self.limiter is not None else 0
 
     def _throttle(self) -> None:
-        """Space requests out to respect the 5 requests/second limit."""
-        if self.min_request_interval <= 0:
-            return
-        elapsed = time.monotonic() - self._last_request
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self._last_request = time.monotonic()
+        """Wait for the token's next request slot, counting the request."""
+        delay = self.limiter.reserve() if self.limiter is not None else 0.0
+        if self.cache is not None and self.token:
+            self.cache.count_request(self.token)
+        if delay > 0:
+            time.sleep(delay)
 
     def _request(
         self,
@@ -120,34 +388,20 @@ class NOAAClient:
         for attempt in range(self.max_retries + 1):
             self._throttle()
             try:
-                with httpx.Client(timeout=self.timeout) as client:
-                    response = client.get(url, params=params, headers=headers)
+                response = get_client().get(
+                    url, params=params, headers=headers, timeout=self.timeout
+                )
             except httpx.TransportError as exc:
                 last_error = f"transport error: {exc}"
                 logger.warning("CDO request failed (%s), retrying", last_error)
                 self._backoff(attempt, None)
                 continue
-
-            if response.status_code == 200:
-                if not response.content:
-                    return {}
-                return response.json()
-            if response.status_code == 404 and ok_404:
-                return None
-            if response.status_code in _RETRYABLE_STATUS:
-                last_error = f"HTTP {response.status_code}"
+            try:
+                return _parse_response(response, endpoint, ok_404)
+            except _RetryableError as exc:
+                last_error = str(exc)
                 logger.warning("CDO request returned %s, retrying", last_error)
-                self._backoff(attempt, response.headers.get("Retry-After"))
-                continue
-            if response.status_code == 401:
-                raise NOAAAPIError(
-                    f"CDO API rejected the token (HTTP 401). Check NCDC_TOKEN; "
-                    f"tokens are issued at {TOKEN_URL}."
-                )
-            raise NOAAAPIError(
-                f"CDO API error for {endpoint}: HTTP {response.status_code} "
-                f"{response.text[:200]}"
-            )
+                self._backoff(attempt, exc.retry_after)
 
         raise NOAAAPIError(
             f"CDO API request for {endpoint} failed after "
@@ -156,40 +410,42 @@ class NOAAClient:
 
     def _backoff(self, attempt: int, retry_after: str | None) -> None:
         """Sleep before the next retry attempt."""
-        if retry_after is not None:
-            try:
-                time.sleep(float(retry_after))
-                return
-            except ValueError:
-                pass
-        time.sleep(self.retry_delay * 2**attempt)
+        time.sleep(_retry_wait(self.retry_delay, attempt, retry_after))
 
     def _request_paginated(
         self, endpoint: str, params: dict[str, Any]
     ) -> list[dict[str, Any]]:
         """GET all pages of a collection endpoint.
 
+        The first page gives the result count; the rest are then fetched
+        up to ``max_concurrency`` at a time.
+
         Args:
             endpoint: Path under the base URL.
             params: Query parameters (limit/offset are managed here).
 
         Returns:
-            Concatenated "results" entries across all pages.
+            Concatenated "results" entries across all pages, in order.
         """
-        results: list[dict[str, Any]] = []
-        offset = 1
-        while True:
-            page = self._request(
-                endpoint, {**params, "limit": PAGE_LIMIT, "offset": offset}
-            )
-            if not page:
-                break
-            results.extend(page.get("results", []))
-            resultset = page.get("metadata", {}).get("resultset", {})
-            count = int(resultset.get("count", len(results)))
-            if len(results) >= count:
-                break
-            offset += PAGE_LIMIT
+        key, results = _cached(self.cache, endpoint, params)
+        if results is not None:
+            return results
+        first = self._request(endpoint, _page_params(params, 1))
+        results = list(first.get("results", [])) if first else []
+        offsets = _remaining_offsets(first) if first else []
+        if offsets:
+            workers = min(self.max_concurrency, len(offsets))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for page in pool.map(
+                    lambda offset: self._request(
+                        endpoint, _page_params(params, offset)
+                    ),
+                    offsets,
+                ):
+                    if page:
+                        results.extend(page.get("results", []))
+        if key is not None and self.cache is not None:
+            self.cache.put(key, results, date.fromisoformat(params["enddate"]))
         return results
 
     def get_data(
@@ -241,27 +497,10 @@ class NOAAClient:
         Returns:
             List of StationInfo for matching stations.
         """
-        south, west, north, east = extent
         payload = self._request_paginated(
-            "stations",
-            {
-                "datasetid": "GHCND",
-                "extent": f"{south},{west},{north},{east}",
-                "startdate": start.isoformat(),
-                "enddate": end.isoformat(),
-            },
+            "stations", _station_params(extent, start, end)
         )
-        return [
-            StationInfo(
-                id=entry["id"],
-                name=entry.get("name"),
-                latitude=entry.get("latitude"),
-                longitude=entry.get("longitude"),
-                elevation=entry.get("elevation"),
-            )
-            for entry in payload
-            if entry.get("id")
-        ]
+        return _station_infos(payload)
 
     def get_data_for_stations(
         self,
@@ -279,14 +518,9 @@ class NOAAClient:
         Returns:
             List of record dicts with date/datatype/station/value keys.
         """
-        params: dict[str, Any] = {
-            "datasetid": "GHCND",
-            # httpx encodes a list value as repeated stationid params
-            "stationid": station_ids,
-            "startdate": start.isoformat(),
-            "enddate": end.isoformat(),
-        }
-        return self._request_paginated("data", params)
+        return self._request_paginated(
+            "data", _station_data_params(station_ids, start, end)
+        )
 
     def get_station(self, station_id: str) -> StationInfo | None:
         """Fetch metadata for a station.
@@ -307,3 +541,204 @@ class NOAAClient:
             longitude=payload.get("longitude"),
             elevation=payload.get("elevation"),
         )
+
+
+@dataclass
+class AsyncNOAAClient:
+    """Asyncio client for the CDO queries the online lookup needs.
+
+    Mirrors ``NOAAClient`` (same arguments, retries and rate limiter)
+    over one pooled ``httpx.AsyncClient``; call ``aclose()`` when done.
+
+    Args:
+        token: CDO API token. Falls back to the NCDC_TOKEN environment
+            variable (via config) when not given.
+        base_url: API base URL.
+        timeout: Per-request timeout in seconds.
+        max_retries: Retries for rate-limit/server/transport errors.
+        retry_delay: Base delay for exponential backoff, in seconds.
+        min_request_interval: Spacing between requests made with the
+            token, in seconds (the API allows 5 requests per second);
+            0 disables spacing.
+        max_concurrency: Pages fetched at once for a multi-page result.
+        limiter: Rate limiter to pace requests with (default: the one
+            shared by every client using the token).
+        cache: Response store (default: opened from config when
+            ``Config.cdo_cache`` is set).
+    """
+
+    token: str | None = None
+    base_url: str = CDO_BASE_URL
+    timeout: float = 30.0
+    max_retries: int = 3
+    retry_delay: float = 1.0
+    min_request_interval: float = 1.0 / REQUESTS_PER_SECOND
+    max_concurrency: int = DEFAULT_CONCURRENCY
+    limiter: CDORateLimiter | None = field(default=None, repr=False)
+    cache: CDOCache | None = field(default=None, repr=False)
+    _http: httpx.AsyncClient | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        """Fill the token, cache and limiter, and validate the settings.
+
+        Raises:
+            ValueError: If no token is configured or max_concurrency is
+                less than 1.
+        """  # noqa: DOC502 - raised by _setup_client
+        _setup_client(self)
+
+    def requests_today(self) -> int:
+        """Requests sent with this client's token today (UTC).
+
+        Counted across runs when the response cache is on, else in
+        this process only.
+
+        Returns:
+            Requests counted against today's 10,000 quota.
+        """
+        if self.cache is not None and self.token:
+            return self.cache.requests_today(self.token)
+        return self.limiter.used_today if self.limiter is not None else 0
+
+    async def _throttle(self) -> None:
+        """Wait for the token's next request slot, counting the request.
+
+        The cache's SQLite writes run in a worker thread, not on the
+        event loop.
+        """
+        delay = self.limiter.reserve() if self.limiter is not None else 0.0
+        due = time.monotonic() + delay
+        if self.cache is not None and self.token:
+            await asyncio.to_thread(self.cache.count_request, self.token)
+        remaining = due - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    async def _request(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        ok_404: bool = False,
+    ) -> dict[str, Any] | None:
+        """GET an endpoint and return its parsed JSON body.
+
+        Args:
+            endpoint: Path under the base URL (e.g. "data").
+            params: Query parameters.
+            ok_404: If True, a 404 returns None instead of raising.
+
+        Returns:
+            Parsed JSON dict ({} for an empty body), or None on an
+            allowed 404.
+
+        Raises:
+            NOAAAPIError: On client errors, or when retries run out on
+                rate-limit/server/transport errors.
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=self.timeout)
+        url = f"{self.base_url}/{endpoint}"
+        headers = {"token": self.token or ""}
+        last_error = ""
+
+        for attempt in range(self.max_retries + 1):
+            await self._throttle()
+            retry_after: str | None = None
+            try:
+                response = await self._http.get(url, params=params, headers=headers)
+                return _parse_response(response, endpoint, ok_404)
+            except httpx.TransportError as exc:
+                last_error = f"transport error: {exc}"
+            except _RetryableError as exc:
+                last_error = str(exc)
+                retry_after = exc.retry_after
+            logger.warning("CDO request failed (%s), retrying", last_error)
+            await asyncio.sleep(_retry_wait(self.retry_delay, attempt, retry_after))
+
+        raise NOAAAPIError(
+            f"CDO API request for {endpoint} failed after "
+            f"{self.max_retries + 1} attempts ({last_error})"
+        )
+
+    async def _request_paginated(
+        self, endpoint: str, params: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """GET all pages of a collection endpoint.
+
+        The first page gives the result count; the rest are then fetched
+        up to ``max_concurrency`` at a time.
+
+        Args:
+            endpoint: Path under the base URL.
+            params: Query parameters (limit/offset are managed here).
+
+        Returns:
+            Concatenated "results" entries across all pages, in order.
+        """
+        key, results = await asyncio.to_thread(_cached, self.cache, endpoint, params)
+        if results is not None:
+            return results
+        first = await self._request(endpoint, _page_params(params, 1))
+        results = list(first.get("results", [])) if first else []
+        slots = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(offset: int) -> dict[str, Any] | None:
+            async with slots:
+                return await self._request(endpoint, _page_params(params, offset))
+
+        offsets = _remaining_offsets(first) if first else []
+        for page in await asyncio.gather(*map(fetch, offsets)):
+            if page:
+                results.extend(page.get("results", []))
+        if key is not None and self.cache is not None:
+            await asyncio.to_thread(
+                self.cache.put, key, results, date.fromisoformat(params["enddate"])
+            )
+        return results
+
+    async def get_stations(
+        self,
+        extent: tuple[float, float, float, float],
+        start: date,
+        end: date,
+    ) -> list[StationInfo]:
+        """Find GHCND stations within a bounding box, active in a period.
+
+        Args:
+            extent: Bounding box as (south, west, north, east) degrees.
+            start: Period start; stations must have data covering it.
+            end: Period end.
+
+        Returns:
+            List of StationInfo for matching stations.
+        """
+        payload = await self._request_paginated(
+            "stations", _station_params(extent, start, end)
+        )
+        return _station_infos(payload)
+
+    async def get_data_for_stations(
+        self,
+        station_ids: list[str],
+        start: date,
+        end: date,
+    ) -> list[dict[str, Any]]:
+        """Fetch GHCND records for specific stations and a date range.
+
+        Args:
+            station_ids: CDO station ids (e.g. "GHCND:USW00094728").
+            start: Start date (inclusive).
+            end: End date (inclusive, within one year of start).
+
+        Returns:
+            List of record dicts with date/datatype/station/value keys.
+        """
+        return await self._request_paginated(
+            "data", _station_data_params(station_ids, start, end)
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
@@ -137,6 +137,7 @@ def get(
             source=source,  # type: ignore[arg-type]
             include_weather_types=weather_types,
             explain=explain,
+            preload=False,
         )
         element_list = elements.split(",") if elements else None
         result = weather.get(location, target_date, elements=element_list)
@@ -217,6 +218,7 @@ def hourly(
             database_path=ctx.obj["database"],
             verbose=ctx.obj["verbose"],
             units=units,  # type: ignore[arg-type]
+            preload=False,
         )
         results = weather.get_hourly(location, target_date, end_date)
     except Exception as e:
@@ -292,7 +294,23 @@ def hourly(
     help="Output format (default: inferred from the output file suffix)",
 )
 @click.option("--parallel/--no-parallel", default=True, help="Use parallel processing")
-@click.option("--workers", type=int, help="Number of worker threads (default: auto)")
+@click.option("--workers", type=int, help="Number of workers (default: auto)")
+@click.option(
+    "--processes",
+    is_flag=True,
+    help="Run workers as processes instead of threads (scales with cores)",
+)
+@click.option(
+    "--prefetch",
+    is_flag=True,
+    help="Scan the input and fetch the GHCN/GSOD data it needs in the background",
+)
+@click.option(
+    "--prefetch-jobs",
+    type=int,
+    default=None,
+    help="Concurrent prefetch downloads/builds (default: 4)",
+)
 @click.pass_context
 def process(
     ctx: click.Context,
@@ -311,6 +329,9 @@ def process(
     output_format: str | None,
     parallel: bool,
     workers: int | None,
+    processes: bool,
+    prefetch: bool,
+    prefetch_jobs: int | None,
 ) -> None:
     """Process a CSV file and add weather data.
 
@@ -328,7 +349,10 @@ def process(
         explain=explain,
     )
 
-    mode = "parallel" if parallel else "sequential"
+    if not parallel:
+        mode = "sequential"
+    else:
+        mode = "parallel, processes" if processes else "parallel"
     console.print(f"[bold]Processing {input_file} ({mode})...[/bold]")
 
     count = weather.process_csv(
@@ -344,6 +368,9 @@ def process(
         output_format=output_format,
         parallel=parallel,
         max_workers=workers,
+        executor="process" if processes else "thread",
+        prefetch=prefetch,
+        prefetch_jobs=prefetch_jobs,
     )
 
     console.print(f"[green]Processed {count:,} rows[/green]")
@@ -402,25 +429,108 @@ def cache_info_cmd() -> None:
         )
     console.print(table)
 
+    from get_weather_data.api.cdo_cache import CDOCache
+    from get_weather_data.api.noaa import REQUESTS_PER_DAY
+
+    cdo = CDOCache()
+    if cdo.path.exists():
+        used = cdo.requests_today()
+        console.print(f"CDO requests today (UTC): {used:,} of {REQUESTS_PER_DAY:,}")
+        cdo.close()
+
+
+@cache.command("warm")
+@click.option(
+    "--years",
+    required=True,
+    help='Years to build, e.g. "2000-2024" or "2010,2015-2020"',
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=None,
+    help="Years built at once, in worker processes (default: 4)",
+)
+@click.pass_context
+def cache_warm_cmd(ctx: click.Context, years: str, jobs: int | None) -> None:
+    """Download and build GHCN years before a run."""
+    from get_weather_data.weather.prefetch import YearPrefetch, parse_years
+
+    try:
+        wanted = parse_years(years)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+    def report(outcome: YearPrefetch, done: int, total: int) -> None:
+        if outcome.error:
+            status = f"[red]failed: {outcome.error}[/red]"
+        else:
+            status = "built" if outcome.built else "cached"
+        console.print(
+            f"[{done}/{total}] {outcome.year} {status} ({outcome.seconds:.1f}s)"
+        )
+
+    weather = Weather(database_path=ctx.obj["database"], verbose=ctx.obj["verbose"])
+    console.print(f"[bold]Warming {len(wanted)} GHCN year(s)...[/bold]")
+    try:
+        outcomes = weather.prefetch(wanted, jobs=jobs, progress=report)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+    table = Table(title="GHCN Years")
+    table.add_column("Year", style="cyan")
+    table.add_column("Status")
+    table.add_column("Time", style="green", justify="right")
+    for outcome in outcomes:
+        status = "failed" if outcome.error else "built" if outcome.built else "cached"
+        table.add_row(str(outcome.year), status, f"{outcome.seconds:.1f}s")
+    console.print(table)
+    if any(outcome.error for outcome in outcomes):
+        sys.exit(1)
+
 
 @cache.command("clear")
 @click.option("--ghcn", is_flag=True, help="Clear yearly GHCN databases")
 @click.option("--gsod", is_flag=True, help="Clear per-station GSOD files")
 @click.option("--stations", is_flag=True, help="Clear station lists and ZIP data")
+@click.option("--results", is_flag=True, help="Clear stored lookup results")
+@click.option("--cdo", is_flag=True, help="Clear stored CDO API responses")
+@click.option("--grid", is_flag=True, help="Clear stored nClimGrid cells")
 @click.option("--all", "clear_all", is_flag=True, help="Clear everything")
 @click.option("--yes", is_flag=True, help="Skip the confirmation prompt")
 def cache_clear_cmd(
-    ghcn: bool, gsod: bool, stations: bool, clear_all: bool, yes: bool
+    ghcn: bool,
+    gsod: bool,
+    stations: bool,
+    results: bool,
+    cdo: bool,
+    grid: bool,
+    clear_all: bool,
+    yes: bool,
 ) -> None:
     """Delete cached data files (they re-download on next use)."""
     from get_weather_data.core.cache import clear_cache
 
-    if not (ghcn or gsod or stations or clear_all):
-        console.print("Nothing selected; use --ghcn/--gsod/--stations/--all")
+    if not (ghcn or gsod or stations or results or cdo or grid or clear_all):
+        console.print(
+            "Nothing selected; use "
+            "--ghcn/--gsod/--stations/--results/--cdo/--grid/--all"
+        )
         sys.exit(1)
     if not yes and not click.confirm("Delete the selected caches?"):
         sys.exit(1)
-    freed = clear_cache(ghcn=ghcn, gsod=gsod, stations=stations, clear_all=clear_all)
+    freed = clear_cache(
+        ghcn=ghcn,
+        gsod=gsod,
+        stations=stations,
+        clear_all=clear_all,
+        results=results,
+        cdo=cdo,
+        grid=grid,
+    )
     console.print(f"[green]Freed {freed / 1e6:,.1f} MB[/green]")
 
 
@@ -113,13 +113,17 @@ def cache_info() -> list[CacheEntry]:
     """Disk usage per cache area.
 
     Returns:
-        One entry per cache area (ghcn, gsod, stations, database).
+        One entry per cache area (ghcn, gsod, stations, results, cdo,
+        grid, database).
     """
     config = get_config()
     entries = [
         _dir_usage("ghcn", config.ghcn_cache_dir),
         _dir_usage("gsod", config.gsod_cache_dir),
         _dir_usage("stations", config.stations_cache_dir),
+        _dir_usage("results", config.results_cache_dir),
+        _dir_usage("cdo", config.cdo_cache_dir),
+        _dir_usage("grid", config.grid_cache_dir),
     ]
     db = config.database_path
     entries.append(
@@ -138,6 +142,9 @@ def clear_cache(
     gsod: bool = False,
     stations: bool = False,
     clear_all: bool = False,
+    results: bool = False,
+    cdo: bool = False,
+    grid: bool = False,
 ) -> int:
     """Delete cached data files.
 
@@ -145,7 +152,10 @@ def clear_cache(
         ghcn: Clear the yearly GHCN databases.
         gsod: Clear the per-station GSOD CSVs.
         stations: Clear station lists and ZIP data.
-        clear_all: Clear everything above.
+        clear_all: Clear everything.
+        results: Clear stored lookup results.
+        cdo: Clear stored CDO API responses (and request counts).
+        grid: Clear stored nClimGrid cells.
 
     Returns:
         Bytes freed.
@@ -158,6 +168,12 @@ def clear_cache(
         targets.append(config.gsod_cache_dir)
     if stations or clear_all:
         targets.append(config.stations_cache_dir)
+    if results or clear_all:
+        targets.append(config.results_cache_dir)
+    if cdo or clear_all:
+        targets.append(config.cdo_cache_dir)
+    if grid or clear_all:
+        targets.append(config.grid_cache_dir)
 
     freed = 0
     for target in targets:
@@ -0,0 +1,528 @@
+"""Compact, array-backed copies of the station database tables.
+
+Batch jobs load the ``stations``, ``zipcodes`` and ``closest`` tables
+into memory. As dicts of tuples those cost hundreds of bytes per entry
+(roughly 41k ZIPs x 8 closest stations), duplicated in every worker
+process. These tables hold the same data in a few flat buffers:
+
+- keys (station ids, ZIP codes) as one sorted, fixed-width byte string,
+  found by binary search;
+- the closest table as a ZIP key array, a uint32 offset array into
+  int32 station-number and int32 distance arrays, with each distinct
+  station id stored once;
+- names as a utf-8 blob with uint32 offsets (a NULL name is the single
+  byte 0xFF, which never occurs in utf-8); coordinates as float64.
+
+Lookups return the same values as the dict caches they replace.
+
+Because every column is a flat buffer, :func:`write_tables` can save all
+three tables to one file and :func:`map_tables` can wrap a read-only
+``mmap`` of it without copying. Worker processes on a host that map the
+same file share a single copy through the page cache. The header
+records the source database's content stamp
+(``Database.content_stamp``), so readers can tell a stale file.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+
+_INT32_MAX = 2**31 - 1
+
+_MAGIC = b"GWTABLE"
+FORMAT_VERSION = 3
+
+# Stored in place of a NULL station name (0xFF is never valid utf-8)
+_NULL_NAME = b"\xff"
+
+# magic, format version, byte order (0 = little, 1 = big), content stamp
+# of the source database, key widths (station ids, ZIP codes, closest ZIP
+# codes, closest station ids)
+_HEADER = struct.Struct("<7sBBx4q4I")
+# Byte size of each section, in write order
+_SECTIONS = struct.Struct("<12Q")
+_ALIGN = 8
+_BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+
+
+def _pad(size: int) -> int:
+    """Bytes of padding that align a section end to _ALIGN."""
+    return -size % _ALIGN
+
+
+class SortedKeys:
+    """Sorted string keys packed into one fixed-width byte string."""
+
+    __slots__ = ("_data", "_len", "width")
+
+    def __init__(self, data: bytes | memoryview, width: int) -> None:
+        """Wrap packed keys.
+
+        Args:
+            data: Keys encoded as utf-8, NUL-padded to ``width`` bytes
+                and sorted.
+            width: Bytes per key.
+        """
+        self._data = data
+        self.width = width
+        self._len = len(data) // width if width else 0
+
+    @classmethod
+    def build(cls, keys: Iterable[str]) -> SortedKeys:
+        """Pack distinct keys, sorted.
+
+        Args:
+            keys: Keys to pack (duplicates are dropped).
+
+        Returns:
+            The packed keys; ``index`` of a key is its sorted position.
+        """
+        encoded = sorted({key.encode() for key in keys})
+        width = max((len(key) for key in encoded), default=0)
+        return cls(b"".join(key.ljust(width, b"\0") for key in encoded), width)
+
+    def __len__(self) -> int:
+        """Number of keys."""
+        return self._len
+
+    def __getitem__(self, i: int) -> str:
+        """Key at sorted position ``i``."""
+        start = i * self.width
+        return bytes(self._data[start : start + self.width]).rstrip(b"\0").decode()
+
+    def index(self, key: str) -> int:
+        """Position of a key, or -1 if absent.
+
+        Args:
+            key: Key to find.
+
+        Returns:
+            Sorted position of ``key``, or -1.
+        """
+        raw = key.encode()
+        if len(raw) > self.width:
+            return -1
+        raw = raw.ljust(self.width, b"\0")
+        data, width = self._data, self.width
+        lo, hi = 0, self._len
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = bytes(data[mid * width : (mid + 1) * width])
+            if probe < raw:
+                lo = mid + 1
+            elif probe > raw:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the packed keys in bytes."""
+        return len(self._data)
+
+
+class StationTable:
+    """Station id -> (name, type), as packed keys and a name blob."""
+
+    def __init__(
+        self,
+        ids: SortedKeys,
+        name_offsets: array | memoryview,
+        names: bytes | memoryview,
+        type_codes: array | memoryview,
+        types: tuple[str | None, ...],
+    ) -> None:
+        """Wrap prebuilt columns (see :meth:`from_rows`).
+
+        Args:
+            ids: Station ids.
+            name_offsets: uint32 offsets into ``names``, one per id plus
+                a final end offset.
+            names: utf-8 station names, concatenated.
+            type_codes: uint8 index into ``types`` per id.
+            types: Distinct station types.
+        """
+        self.ids = ids
+        self._name_offsets = name_offsets
+        self._names = names
+        self._type_codes = type_codes
+        self.types = types
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[tuple[str, str | None, str | None]]
+    ) -> StationTable:
+        """Build the table from (id, name, type) rows.
+
+        Args:
+            rows: Rows of the ``stations`` table.
+
+        Returns:
+            The packed table.
+
+        Raises:
+            ValueError: If there are more than 256 station types.
+        """
+        info = {station_id: (name, kind) for station_id, name, kind in rows}
+        ids = SortedKeys.build(info)
+        types: dict[str | None, int] = {}
+        name_offsets = array("I", [0])
+        type_codes = array("B")
+        names = []
+        for i in range(len(ids)):
+            name, kind = info[ids[i]]
+            encoded = _NULL_NAME if name is None else name.encode()
+            names.append(encoded)
+            name_offsets.append(name_offsets[-1] + len(encoded))
+            code = types.setdefault(kind, len(types))
+            if code > 0xFF:
+                raise ValueError("more than 256 station types")
+            type_codes.append(code)
+        return cls(ids, name_offsets, b"".join(names), type_codes, tuple(types))
+
+    def __len__(self) -> int:
+        """Number of stations."""
+        return len(self.ids)
+
+    def get(self, station_id: str) -> tuple[str | None, str | None] | None:
+        """Name and type of a station.
+
+        Args:
+            station_id: Station ID.
+
+        Returns:
+            (name, type), or None if the station is unknown.
+        """
+        i = self.ids.index(station_id)
+        if i < 0:
+            return None
+        start, end = self._name_offsets[i], self._name_offsets[i + 1]
+        encoded = bytes(self._names[start:end])
+        name = None if encoded == _NULL_NAME else encoded.decode()
+        return name, self.types[self._type_codes[i]]
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the packed columns in bytes."""
+        return (
+            self.ids.nbytes
+            + len(self._names)
+            + self._name_offsets.itemsize * len(self._name_offsets)
+            + len(self._type_codes)
+        )
+
+
+class ZipcodeTable:
+    """ZIP code -> (lat, lon), as packed keys and a float64 array."""
+
+    def __init__(self, zipcodes: SortedKeys, coords: array | memoryview) -> None:
+        """Wrap prebuilt columns (see :meth:`from_rows`).
+
+        Args:
+            zipcodes: ZIP codes.
+            coords: float64 (lat, lon) pairs, interleaved, one pair per
+                ZIP code.
+        """
+        self.zipcodes = zipcodes
+        self._coords = coords
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[tuple[str, float | None, float | None]]
+    ) -> ZipcodeTable:
+        """Build the table from (zipcode, lat, lon) rows.
+
+        Args:
+            rows: Rows of the ``zipcodes`` table; rows without
+                coordinates are skipped.
+
+        Returns:
+            The packed table.
+        """
+        located = {z: (lat, lon) for z, lat, lon in rows if None not in (lat, lon)}
+        zipcodes = SortedKeys.build(located)
+        coords = array("d")
+        for i in range(len(zipcodes)):
+            coords.extend(located[zipcodes[i]])
+        return cls(zipcodes, coords)
+
+    def __len__(self) -> int:
+        """Number of ZIP codes."""
+        return len(self.zipcodes)
+
+    def get(self, zipcode: str) -> tuple[float, float] | None:
+        """Coordinates of a ZIP code.
+
+        Args:
+            zipcode: 5-digit ZIP code.
+
+        Returns:
+            (lat, lon), or None if the ZIP code is unknown.
+        """
+        i = self.zipcodes.index(zipcode)
+        if i < 0:
+            return None
+        return self._coords[2 * i], self._coords[2 * i + 1]
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the packed columns in bytes."""
+        return self.zipcodes.nbytes + self._coords.itemsize * len(self._coords)
+
+
+class ClosestTable:
+    """ZIP code -> nearest (station_id, distance_meters), packed.
+
+    Each ZIP's stations are the slice ``offsets[i]:offsets[i + 1]`` of
+    the station-number and distance arrays, in distance order; station
+    numbers index the interned ``station_ids``.
+    """
+
+    def __init__(
+        self,
+        zipcodes: SortedKeys,
+        offsets: array | memoryview,
+        station_ids: SortedKeys,
+        stations: array | memoryview,
+        distances: array | memoryview,
+    ) -> None:
+        """Wrap prebuilt columns (see :meth:`from_rows`).
+
+        Args:
+            zipcodes: ZIP codes.
+            offsets: uint32 row offsets, one per ZIP code plus a final
+                end offset.
+            station_ids: Distinct station ids.
+            stations: int32 index into ``station_ids`` per row.
+            distances: int32 distance in meters per row.
+        """
+        self.zipcodes = zipcodes
+        self._offsets = offsets
+        self.station_ids = station_ids
+        self._stations = stations
+        self._distances = distances
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[str, str, int]]) -> ClosestTable:
+        """Build the table from (zipcode, station_id, distance) rows.
+
+        Args:
+            rows: Rows of the ``closest`` table, in any order.
+
+        Returns:
+            The packed table.
+
+        Raises:
+            ValueError: If a distance does not fit an int32.
+        """
+        by_zip: dict[str, list[tuple[int, str]]] = {}
+        for zipcode, station_id, distance in rows:
+            if not 0 <= distance <= _INT32_MAX:
+                raise ValueError(f"distance {distance} for {zipcode} out of range")
+            by_zip.setdefault(zipcode, []).append((distance, station_id))
+        zipcodes = SortedKeys.build(by_zip)
+        station_ids = SortedKeys.build(
+            station_id for pairs in by_zip.values() for _, station_id in pairs
+        )
+        number = {station_ids[i]: i for i in range(len(station_ids))}
+        offsets = array("I", [0])
+        stations = array("i")
+        distances = array("i")
+        for i in range(len(zipcodes)):
+            # Stable sort keeps the table's order among equal distances
+            pairs = sorted(by_zip[zipcodes[i]], key=lambda pair: pair[0])
+            for distance, station_id in pairs:
+                stations.append(number[station_id])
+                distances.append(distance)
+            offsets.append(len(stations))
+        return cls(zipcodes, offsets, station_ids, stations, distances)
+
+    def __len__(self) -> int:
+        """Number of ZIP codes."""
+        return len(self.zipcodes)
+
+    def get(self, zipcode: str) -> list[tuple[str, int]]:
+        """Nearest stations of a ZIP code.
+
+        Args:
+            zipcode: 5-digit ZIP code.
+
+        Returns:
+            (station_id, distance_meters) nearest first; empty if the
+            ZIP code has no entry.
+        """
+        i = self.zipcodes.index(zipcode)
+        if i < 0:
+            return []
+        station_ids = self.station_ids
+        return [
+            (station_ids[self._stations[row]], self._distances[row])
+            for row in range(self._offsets[i], self._offsets[i + 1])
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the packed columns in bytes."""
+        return (
+            self.zipcodes.nbytes
+            + self.station_ids.nbytes
+            + sum(
+                column.itemsize * len(column)
+                for column in (self._offsets, self._stations, self._distances)
+            )
+        )
+
+
+def write_tables(
+    path: Path,
+    stations: StationTable,
+    zipcodes: ZipcodeTable,
+    closest: ClosestTable,
+    stamp: tuple[int, int, int, int],
+) -> None:
+    """Save the three tables to one memory-mappable file.
+
+    The file is written to a temporary name and renamed into place, so
+    a concurrent reader never maps a partial file.
+
+    Args:
+        path: Destination file.
+        stations: Station table.
+        zipcodes: ZIP code table.
+        closest: Closest-station table.
+        stamp: Content stamp of the database the tables were read
+            from, checked by readers to detect a stale file.
+    """
+    sections = [
+        stations.ids._data,
+        stations._name_offsets,
+        stations._names,
+        stations._type_codes,
+        json.dumps(stations.types).encode(),
+        zipcodes.zipcodes._data,
+        zipcodes._coords,
+        closest.zipcodes._data,
+        closest._offsets,
+        closest.station_ids._data,
+        closest._stations,
+        closest._distances,
+    ]
+    data = [bytes(section) for section in sections]
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(
+            _HEADER.pack(
+                _MAGIC,
+                FORMAT_VERSION,
+                _BYTE_ORDER,
+                *stamp,
+                stations.ids.width,
+                zipcodes.zipcodes.width,
+                closest.zipcodes.width,
+                closest.station_ids.width,
+            )
+        )
+        f.write(_SECTIONS.pack(*(len(chunk) for chunk in data)))
+        f.write(b"\0" * _pad(_HEADER.size + _SECTIONS.size))
+        for chunk in data:
+            f.write(chunk)
+            f.write(b"\0" * _pad(len(chunk)))
+    os.replace(tmp, path)
+
+
+def read_table_stamp(path: Path) -> tuple[int, ...] | None:
+    """Source database content stamp in a tables file's header.
+
+    Args:
+        path: Tables file.
+
+    Returns:
+        The stamp passed to ``write_tables``, or None if the file is
+        missing or unreadable.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+        magic, version, byte_order, *rest = _HEADER.unpack(header)
+    except (OSError, struct.error):
+        return None
+    if magic != _MAGIC or version != FORMAT_VERSION or byte_order != _BYTE_ORDER:
+        return None
+    return tuple(rest[:4])
+
+
+def map_tables(path: Path) -> tuple[StationTable, ZipcodeTable, ClosestTable]:
+    """Map a file written by :func:`write_tables`.
+
+    The tables read straight from the shared, read-only mapping.
+
+    Args:
+        path: Tables file.
+
+    Returns:
+        (stations, zipcodes, closest) tables.
+
+    Raises:
+        ValueError: If the file is not a tables file this version can
+            read.
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    try:
+        magic, version, byte_order, *_stamp, w_ids, w_zips, w_czips, w_cids = (
+            _HEADER.unpack_from(view)
+        )
+        sizes = _SECTIONS.unpack_from(view, _HEADER.size)
+    except struct.error as exc:
+        raise ValueError(f"{path} is not a readable tables file") from exc
+    if magic != _MAGIC or version != FORMAT_VERSION or byte_order != _BYTE_ORDER:
+        raise ValueError(f"{path} is not a readable tables file")
+
+    pos = _HEADER.size + _SECTIONS.size
+    pos += _pad(pos)
+    parts = []
+    for size in sizes:
+        if pos + size > len(view):
+            raise ValueError(f"{path} is truncated")
+        parts.append(view[pos : pos + size])
+        pos += size + _pad(size)
+    (
+        ids,
+        name_offsets,
+        names,
+        type_codes,
+        types,
+        zip_keys,
+        coords,
+        closest_zips,
+        offsets,
+        station_ids,
+        station_numbers,
+        distances,
+    ) = parts
+    return (
+        StationTable(
+            SortedKeys(ids, w_ids),
+            name_offsets.cast("I"),
+            names,
+            type_codes,
+            tuple(json.loads(bytes(types))),
+        ),
+        ZipcodeTable(SortedKeys(zip_keys, w_zips), coords.cast("d")),
+        ClosestTable(
+            SortedKeys(closest_zips, w_czips),
+            offsets.cast("I"),
+            SortedKeys(station_ids, w_cids),
+            station_numbers.cast("i"),
+            distances.cast("i"),
+        ),
+    )
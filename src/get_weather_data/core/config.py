@@ -3,6 +3,9 @@
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Literal
+
+from get_weather_data.core.value_cache import CACHE_POLICIES, CachePolicy
 
 # XDG Base Directory paths
 _XDG_DATA_HOME = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share"))
@@ -11,6 +14,14 @@ _XDG_CONFIG_HOME = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config
 
 APP_NAME = "get-weather-data"
 
+# On-disk layout for the yearly GHCN caches: one SQLite table per year,
+# or the compact memory-mapped columnar store (weather/ghcn_store.py).
+GhcnEngine = Literal["sqlite", "columnar"]
+GHCN_ENGINES = ("sqlite", "columnar")
+
+# Default byte budgets of the in-memory station-day value caches
+DEFAULT_VALUE_CACHE_BYTES = {"ghcn": 64 * 2**20, "gsod": 32 * 2**20}
+
 
 @dataclass
 class Config:
@@ -34,10 +45,60 @@ class Config:
     # Cache settings
     cache_max_age_days: int = 30
 
+    # GHCN yearly storage engine
+    ghcn_engine: GhcnEngine = "sqlite"
+    # Keep only station-DB stations and the elements lookups read when
+    # building a GHCN year (an order of magnitude smaller and faster)
+    ghcn_filtered_ingest: bool = False
+    # Persist each day's lookup result on disk (weather/result_cache.py)
+    result_cache: bool = False
+    # Persist CDO API responses and request counts (api/cdo_cache.py)
+    cdo_cache: bool = True
+    # Keep nClimGrid cells read over OPeNDAP on disk (weather/grid_cache.py)
+    grid_cache: bool = True
+    # In-memory station-day value caches: approximate byte budget per
+    # source ("ghcn", "gsod"; 0 disables one, an omitted source keeps its
+    # default) and eviction policy
+    value_cache_bytes: dict[str, int] = field(
+        default_factory=lambda: dict(DEFAULT_VALUE_CACHE_BYTES)
+    )
+    value_cache_policy: CachePolicy = "lru"
+
     def __post_init__(self) -> None:
-        """Set up derived paths and load environment variables."""
+        """Set up derived paths and load environment variables.
+
+        Raises:
+            ValueError: If ghcn_engine or value_cache_policy is unknown,
+                or value_cache_bytes names an unknown source or a negative
+                budget.
+        """
         if self.ncdc_token is None:
             self.ncdc_token = os.environ.get("NCDC_TOKEN")
+        if self.ghcn_engine not in GHCN_ENGINES:
+            raise ValueError(
+                f"Unknown ghcn_engine {self.ghcn_engine!r}; "
+                f"expected one of {', '.join(GHCN_ENGINES)}"
+            )
+        if self.value_cache_policy not in CACHE_POLICIES:
+            raise ValueError(
+                f"Unknown value_cache_policy {self.value_cache_policy!r}; "
+                f"expected one of {', '.join(CACHE_POLICIES)}"
+            )
+        unknown = set(self.value_cache_bytes) - set(DEFAULT_VALUE_CACHE_BYTES)
+        if unknown:
+            raise ValueError(
+                f"Unknown value_cache_bytes source {', '.join(sorted(unknown))}; "
+                f"expected one of {', '.join(DEFAULT_VALUE_CACHE_BYTES)}"
+            )
+        for source, size in self.value_cache_bytes.items():
+            if size < 0:
+                raise ValueError(
+                    f"value_cache_bytes[{source!r}] must be >= 0, got {size}"
+                )
+        self.value_cache_bytes = {
+            **DEFAULT_VALUE_CACHE_BYTES,
+            **self.value_cache_bytes,
+        }
 
         # Ensure directories exist
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -69,6 +130,30 @@ class Config:
         path.mkdir(parents=True, exist_ok=True)
         return path
 
+    @property
+    def results_cache_dir(self) -> Path:
+        """Cache directory for stored lookup results."""
+        path = self.cache_dir / "results"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    @property
+    def cdo_cache_dir(self) -> Path:
+        """Cache directory for stored CDO API responses.
+
+        Not created here: ``CDOCache`` creates it on first write, so
+        merely building a client leaves no files behind.
+        """
+        return self.cache_dir / "cdo"
+
+    @property
+    def grid_cache_dir(self) -> Path:
+        """Cache directory for stored nClimGrid cells.
+
+        Not created here: ``GridCache`` creates it on first write.
+        """
+        return self.cache_dir / "nclimgrid"
+
     @property
     def stations_cache_dir(self) -> Path:
         """Cache directory for station data files."""
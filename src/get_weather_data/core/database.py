@@ -5,11 +5,25 @@ import sqlite3
 import threading
 from collections.abc import Generator
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from get_weather_data.core.compact import (
+    ClosestTable,
+    StationTable,
+    ZipcodeTable,
+    map_tables,
+    read_table_stamp,
+    write_tables,
+)
 from get_weather_data.core.config import get_config
-from get_weather_data.core.distance import Station
+from get_weather_data.core.distance import Station, StationIndex
+from get_weather_data.core.station_grid import (
+    StationGrid,
+    read_source_stamp,
+    write_station_grid,
+)
 
 logger = logging.getLogger("get_weather_data")
 
@@ -17,18 +31,49 @@ logger = logging.getLogger("get_weather_data")
 # KDTree distance math; older indexes carry wrong distances.
 INDEX_VERSION = 4
 
+# Station types that get a persisted spatial index (see save_station_indexes)
+INDEXED_STATION_TYPES = ("GHCND", "USAF-WBAN")
+
+# Entries per table kept by the per-key caches of a non-preloading Database
+LAZY_CACHE_SIZE = 4096
+
+# Writes to a stations table through any Database in this process, so
+# caches derived from the table notice them without stat()ing the file
+_station_writes = 0
+
+
+def station_writes() -> int:
+    """Number of station-table writes made through ``Database`` so far.
+
+    Returns:
+        A counter that changes whenever this process inserts stations.
+    """
+    return _station_writes
+
+
+def _count_station_write() -> None:
+    global _station_writes
+    _station_writes += 1
+
 
 class Database:
     """SQLite database for weather station and ZIP code data.
 
     Uses connection pooling and caches station metadata for efficiency.
+    By default the station, ZIP and closest tables are loaded into
+    compact array-backed tables (see ``core.compact``) on first use
+    (best for batch jobs); with ``preload=False`` each
+    lookup is a primary-key query behind a bounded LRU, so a one-off
+    lookup never reads the whole index.
     """
 
-    def __init__(self, path: Path | str | None = None) -> None:
+    def __init__(self, path: Path | str | None = None, preload: bool = True) -> None:
         """Initialize database.
 
         Args:
             path: Path to SQLite database. If None, uses config default.
+            preload: Load whole tables into memory on first lookup. When
+                False, lookups query SQLite by key (cached per key).
         """
         # Per-instance thread-local: a class-level one would share
         # connections across Database instances pointing at different
@@ -36,9 +81,19 @@ class Database:
         self._local = threading.local()
         db_path = get_config().database_path if path is None else Path(path)
         self.path = db_path
-        self._station_cache: dict[str, tuple[str, str]] | None = None
-        self._zipcode_cache: dict[str, tuple[float, float]] | None = None
-        self._closest_cache: dict[str, list[tuple[str, int]]] | None = None
+        self._station_cache: StationTable | None = None
+        self._zipcode_cache: ZipcodeTable | None = None
+        self._closest_cache: ClosestTable | None = None
+        self.preload = preload
+        # Per-key lookups used while a table is not preloaded
+        self._station_info_by_key = lru_cache(maxsize=LAZY_CACHE_SIZE)(
+            self._query_station_info
+        )
+        self._zipcode_by_key = lru_cache(maxsize=LAZY_CACHE_SIZE)(self._query_zipcode)
+        self._closest_by_key = lru_cache(maxsize=LAZY_CACHE_SIZE)(self._query_closest)
+        # Spatial indexes per station type, built on first coordinate query
+        self._station_indexes: dict[str, StationIndex | StationGrid] = {}
+        self._index_lock = threading.Lock()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get thread-local database connection."""
@@ -122,42 +177,148 @@ class Database:
         conn.commit()
         logger.debug("Database schema initialized")
 
+    def content_stamp(self) -> tuple[int, int, int, int]:
+        """Stamp of the database's current contents.
+
+        The (mtime_ns, size) of the database file and of its WAL file,
+        an empty or missing WAL counting as (0, 0). A committed write
+        from any process changes it, even one that keeps every row
+        count, so files derived from the tables record it and are
+        ignored once it no longer matches.
+
+        Returns:
+            The stamp.
+        """
+        stamp: list[int] = []
+        for file in (self.path, self.path.with_name(f"{self.path.name}-wal")):
+            try:
+                info = file.stat()
+            except OSError:
+                info = None
+            if info is None or info.st_size == 0:
+                stamp += [0, 0]
+            else:
+                stamp += [info.st_mtime_ns, info.st_size]
+        return stamp[0], stamp[1], stamp[2], stamp[3]
+
+    def _settled_stamp(self) -> tuple[int, int, int, int]:
+        """Fold the WAL into the database file, then stamp it.
+
+        Otherwise SQLite's own checkpoint (when the last connection
+        closes) would rewrite the file and change the stamp without
+        changing its contents.
+        """
+        self._get_connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return self.content_stamp()
+
+    def tables_path(self) -> Path:
+        """Path of the persisted compact station/ZIP/closest tables."""
+        return self.path.with_name(f"{self.path.stem}.tables")
+
+    def save_compact_tables(self) -> Path:
+        """Persist the compact caches to one memory-mappable file.
+
+        Written next to the database by ``setup()`` (and before a
+        process-pool batch starts). Every ``Database`` on the host then
+        maps that file read-only instead of loading its own copy, so N
+        worker processes share one copy through the page cache.
+
+        Returns:
+            Path of the written file.
+        """
+        # Stamped before reading, so a concurrent write marks it stale
+        stamp = self._settled_stamp()
+        self._load_station_cache()
+        self._load_zipcode_cache()
+        self._load_closest_cache()
+        path = self.tables_path()
+        write_tables(
+            path,
+            self._station_cache,
+            self._zipcode_cache,
+            self._closest_cache,
+            stamp,
+        )
+        return path
+
+    def compact_tables_current(self) -> bool:
+        """Whether the persisted compact tables match the database.
+
+        Returns:
+            True if the file exists and was written from the current
+            contents (see ``content_stamp``).
+        """
+        return read_table_stamp(self.tables_path()) == self.content_stamp()
+
+    def _drop_compact_tables(self) -> None:
+        """Delete the persisted compact tables (a source table changed)."""
+        self.tables_path().unlink(missing_ok=True)
+
+    def _map_compact_tables(self) -> None:
+        """Adopt the persisted compact tables if they match the database."""
+        path = self.tables_path()
+        stamp = read_table_stamp(path)
+        if stamp is None:
+            return
+        if stamp != self.content_stamp():
+            logger.debug("Compact tables %s are stale; loading from SQLite", path)
+            return
+        try:
+            stations, zipcodes, closest = map_tables(path)
+        except (OSError, ValueError) as exc:
+            logger.debug("Ignoring compact tables %s: %s", path, exc)
+            return
+        logger.debug(f"Mapped compact tables from {path}")
+        if self._station_cache is None:
+            self._station_cache = stations
+        if self._zipcode_cache is None:
+            self._zipcode_cache = zipcodes
+        if self._closest_cache is None:
+            self._closest_cache = closest
+
     def _load_station_cache(self) -> None:
-        """Load station metadata into memory cache."""
+        """Load station metadata into a compact memory cache."""
+        if self._station_cache is None:
+            self._map_compact_tables()
         if self._station_cache is not None:
             return
-        self._station_cache = {}
-        results = self.execute("SELECT id, name, type FROM stations")
-        for row in results:
-            self._station_cache[row[0]] = (row[1], row[2])
-        logger.debug(f"Cached {len(self._station_cache)} stations")
+        self._station_cache = StationTable.from_rows(
+            self.execute("SELECT id, name, type FROM stations")
+        )
+        logger.debug(
+            f"Cached {len(self._station_cache)} stations "
+            f"({self._station_cache.nbytes} bytes)"
+        )
 
     def _load_zipcode_cache(self) -> None:
-        """Load ZIP code coordinates into memory cache."""
+        """Load ZIP code coordinates into a compact memory cache."""
+        if self._zipcode_cache is None:
+            self._map_compact_tables()
         if self._zipcode_cache is not None:
             return
-        self._zipcode_cache = {}
-        results = self.execute("SELECT zipcode, lat, lon FROM zipcodes")
-        for row in results:
-            if row[1] is not None and row[2] is not None:
-                self._zipcode_cache[row[0]] = (row[1], row[2])
-        logger.debug(f"Cached {len(self._zipcode_cache)} ZIP codes")
+        self._zipcode_cache = ZipcodeTable.from_rows(
+            self.execute("SELECT zipcode, lat, lon FROM zipcodes")
+        )
+        logger.debug(
+            f"Cached {len(self._zipcode_cache)} ZIP codes "
+            f"({self._zipcode_cache.nbytes} bytes)"
+        )
 
     def _load_closest_cache(self) -> None:
-        """Load closest stations mapping into memory cache."""
+        """Load closest stations mapping into a compact memory cache."""
+        if self._closest_cache is None:
+            self._map_compact_tables()
         if self._closest_cache is not None:
             return
-        self._closest_cache = {}
-        results = self.execute(
-            "SELECT zipcode, station_id, distance_meters FROM closest "
-            "ORDER BY zipcode, distance_meters"
+        self._closest_cache = ClosestTable.from_rows(
+            self.execute(
+                "SELECT zipcode, station_id, distance_meters FROM closest "
+                "ORDER BY zipcode, distance_meters"
+            )
         )
-        for zipcode, station_id, distance in results:
-            if zipcode not in self._closest_cache:
-                self._closest_cache[zipcode] = []
-            self._closest_cache[zipcode].append((station_id, distance))
         logger.debug(
-            f"Cached closest stations for {len(self._closest_cache)} ZIP codes"
+            f"Cached closest stations for {len(self._closest_cache)} ZIP codes "
+            f"({self._closest_cache.nbytes} bytes)"
         )
 
     def preload_caches(self) -> None:
@@ -175,9 +336,33 @@ class Database:
         Returns:
             Tuple of (name, type) or None if not found.
         """
+        if self._station_cache is None and not self.preload:
+            return self._station_info_by_key(station_id)
         self._load_station_cache()
         return self._station_cache.get(station_id) if self._station_cache else None
 
+    def _query_station_info(self, station_id: str) -> tuple[str, str] | None:
+        rows = self.execute(
+            "SELECT name, type FROM stations WHERE id = ?", (station_id,)
+        )
+        return (rows[0][0], rows[0][1]) if rows else None
+
+    def _query_zipcode(self, zipcode: str) -> tuple[float, float] | None:
+        rows = self.execute(
+            "SELECT lat, lon FROM zipcodes WHERE zipcode = ?", (zipcode,)
+        )
+        if not rows or rows[0][0] is None or rows[0][1] is None:
+            return None
+        return (rows[0][0], rows[0][1])
+
+    def _query_closest(self, zipcode: str) -> list[tuple[str, int]]:
+        rows = self.execute(
+            "SELECT station_id, distance_meters FROM closest "
+            "WHERE zipcode = ? ORDER BY distance_meters",
+            (zipcode,),
+        )
+        return [(station_id, distance) for station_id, distance in rows]
+
     def insert_zipcode(
         self,
         zipcode: str,
@@ -197,8 +382,10 @@ class Database:
             (zipcode, city, state, lat, lon, county),
         )
         conn.commit()
-        if self._zipcode_cache is not None:
-            self._zipcode_cache[zipcode] = (lat, lon)
+        # The compact caches are immutable; reload on next use
+        self._zipcode_cache = None
+        self._zipcode_by_key.cache_clear()
+        self._drop_compact_tables()
 
     def insert_station(self, station: Station) -> None:
         """Insert or update a station."""
@@ -219,8 +406,12 @@ class Database:
             ),
         )
         conn.commit()
-        if self._station_cache is not None:
-            self._station_cache[station.id] = (station.name, station.type)
+        _count_station_write()
+        self._station_cache = None
+        self._station_info_by_key.cache_clear()
+        self._drop_compact_tables()
+        # INSERT OR REPLACE may also move the station out of another type
+        self._drop_station_indexes()
 
     def insert_stations_bulk(self, stations: list[Station]) -> None:
         """Bulk insert stations."""
@@ -236,7 +427,11 @@ class Database:
             ],
         )
         conn.commit()
+        _count_station_write()
         self._station_cache = None
+        self._station_info_by_key.cache_clear()
+        self._drop_compact_tables()
+        self._drop_station_indexes()
 
     def get_stations(
         self, station_type: str | None = None, state: str | None = None
@@ -270,19 +465,120 @@ class Database:
             for row in results
         ]
 
+    def station_index_path(self, station_type: str) -> Path:
+        """Path of the persisted spatial index for a station type."""
+        return self.path.with_name(f"{self.path.stem}.{station_type}.stations")
+
+    def save_station_indexes(self) -> dict[str, int]:
+        """Persist a memory-mappable spatial index per station type.
+
+        Written next to the database by ``setup()``; later processes map
+        it instead of reading every station row and building a tree.
+
+        Returns:
+            Station type -> number of stations written.
+        """
+        # Stamped before reading, so a concurrent write marks it stale
+        stamp = self._settled_stamp()
+        written = {}
+        for station_type in INDEXED_STATION_TYPES:
+            written[station_type] = write_station_grid(
+                self.station_index_path(station_type),
+                self.get_stations(station_type=station_type),
+                station_type,
+                stamp,
+            )
+            self._station_indexes.pop(station_type, None)
+        return written
+
+    def _drop_station_indexes(self) -> None:
+        """Forget in-memory and persisted spatial indexes (stations changed)."""
+        self._station_indexes.clear()
+        for station_type in INDEXED_STATION_TYPES:
+            self.station_index_path(station_type).unlink(missing_ok=True)
+
+    def station_indexes_current(self) -> bool:
+        """Whether every persisted spatial index matches the database.
+
+        Returns:
+            True if each file exists and was written from the current
+            contents (see ``content_stamp``).
+        """
+        stamp = self.content_stamp()
+        return all(
+            read_source_stamp(self.station_index_path(station_type)) == stamp
+            for station_type in INDEXED_STATION_TYPES
+        )
+
+    def _load_station_index(self, station_type: str) -> StationIndex | StationGrid:
+        """Map the persisted index if it is current, else build one."""
+        path = self.station_index_path(station_type)
+        stamp = read_source_stamp(path)
+        if stamp is not None:
+            if stamp == self.content_stamp():
+                try:
+                    return StationGrid(path)
+                except (OSError, ValueError) as exc:
+                    logger.debug("Ignoring station index %s: %s", path, exc)
+            else:
+                logger.debug("Station index %s is stale; building in memory", path)
+        return StationIndex(self.get_stations(station_type=station_type))
+
+    def get_station_index(self, station_type: str) -> StationIndex | StationGrid:
+        """Get the spatial index over one station type.
+
+        Maps the file ``save_station_indexes`` wrote when it matches the
+        table, otherwise builds a ``StationIndex`` from ``get_stations``.
+        Either way it is made on first use and reused by every later
+        coordinate query; inserting stations drops it.
+
+        Args:
+            station_type: Station type (e.g. "GHCND", "USAF-WBAN").
+
+        Returns:
+            The index for that type.
+        """
+        index = self._station_indexes.get(station_type)
+        if index is None:
+            with self._index_lock:
+                index = self._station_indexes.get(station_type)
+                if index is None:
+                    index = self._load_station_index(station_type)
+                    self._station_indexes[station_type] = index
+        return index
+
+    def get_station_ids(self, station_type: str | None = None) -> set[str]:
+        """Get the IDs of stations in the database.
+
+        Args:
+            station_type: Restrict to one station type (e.g. "GHCND").
+
+        Returns:
+            Set of station IDs (empty when the table is missing).
+        """
+        sql = "SELECT id FROM stations"
+        params: tuple[Any, ...] = ()
+        if station_type:
+            sql += " WHERE type = ?"
+            params = (station_type,)
+        try:
+            return {row[0] for row in self.execute(sql, params)}
+        except sqlite3.OperationalError:
+            return set()
+
     def get_zipcode(self, zipcode: str) -> tuple[float, float] | None:
         """Get lat/lon for a ZIP code (uses cache)."""
+        if self._zipcode_cache is None and not self.preload:
+            return self._zipcode_by_key(zipcode)
         self._load_zipcode_cache()
-        if self._zipcode_cache:
-            return self._zipcode_cache.get(zipcode)
-        return None
+        return self._zipcode_cache.get(zipcode) if self._zipcode_cache else None
 
     def get_closest_stations(self, zipcode: str) -> list[tuple[str, int]]:
         """Get cached closest stations for a ZIP code (uses cache)."""
+        if self._closest_cache is None and not self.preload:
+            return self._closest_by_key(zipcode)
         self._load_closest_cache()
-        if self._closest_cache:
-            return self._closest_cache.get(zipcode, [])
-        return []
+        return self._closest_cache.get(zipcode) if self._closest_cache else []
 
     def set_closest_stations_bulk(
         self, mapping: dict[str, list[tuple[str, int]]]
@@ -306,8 +602,9 @@ class Database:
             ],
         )
         conn.commit()
-        if self._closest_cache is not None:
-            self._closest_cache.update(mapping)
+        self._closest_cache = None
+        self._closest_by_key.cache_clear()
+        self._drop_compact_tables()
 
     def get_meta(self, key: str) -> str | None:
         """Read a value from the meta table.
@@ -352,6 +649,15 @@ class Database:
             result = self.execute("SELECT COUNT(*) FROM stations")
         return result[0][0] if result else 0
 
+    def count_located_stations(self, station_type: str) -> int:
+        """Count stations of a type that have coordinates."""
+        result = self.execute(
+            "SELECT COUNT(*) FROM stations "
+            "WHERE type = ? AND lat IS NOT NULL AND lon IS NOT NULL",
+            (station_type,),
+        )
+        return result[0][0] if result else 0
+
     def exists(self) -> bool:
         """Check if database file exists."""
         return self.path.exists()
@@ -72,6 +72,81 @@ def _project(lat: float, lon: float) -> tuple[float, float, float]:
     return (cos_lat * math.cos(lon_r), cos_lat * math.sin(lon_r), math.sin(lat_r))
 
 
+def _project_many(lats: Any, lons: Any) -> Any:
+    """Vectorized ``_project``: (m,) degree arrays -> (m, 3) unit vectors."""
+    lat_r = np.asarray(lats, dtype=float) * RAD
+    lon_r = np.asarray(lons, dtype=float) * RAD
+    cos_lat = np.cos(lat_r)
+    return np.column_stack(
+        (cos_lat * np.cos(lon_r), cos_lat * np.sin(lon_r), np.sin(lat_r))
+    )
+
+
+def _meters_distance_many(lat1: Any, lon1: Any, lat2: Any, lon2: Any) -> Any:
+    """Vectorized ``meters_distance`` over broadcastable arrays."""
+    y_distance = (lat2 - lat1) * NAUTICAL_MILE_PER_LAT
+    x_distance = (
+        (np.cos(lat1 * RAD) + np.cos(lat2 * RAD))
+        * (lon2 - lon1)
+        * (NAUTICAL_MILE_PER_LON / 2)
+    )
+    return np.hypot(y_distance, x_distance) * METERS_PER_NAUTICAL_MILE
+
+
+def _query_many(
+    tree: Any,
+    station_lats: Any,
+    station_lons: Any,
+    lats: Any,
+    lons: Any,
+    n: int,
+    max_distance_km: float | None,
+) -> tuple[Any, Any]:
+    """Vectorized k-nearest query and re-rank over a projected KDTree.
+
+    ``tree`` holds the stations' ``_project`` coordinates in the same
+    order as ``station_lats``/``station_lons``. See
+    ``StationIndex.find_closest_many`` for the returned arrays.
+    """
+    lats = np.asarray(lats, dtype=float).reshape(-1)
+    lons = np.asarray(lons, dtype=float).reshape(-1)
+    m = len(lats)
+    total = len(station_lats)
+    width = min(n, total)
+    if m == 0 or width == 0:
+        empty = np.empty((m, width), dtype=np.int64)
+        return empty, empty.copy()
+
+    k = min(n + KDTREE_OVERSAMPLE, total)
+    _, candidates = tree.query(_project_many(lats, lons), k=k)
+    candidates = np.asarray(candidates, dtype=np.int64).reshape(m, k)
+    distances = _meters_distance_many(
+        lats[:, None],
+        lons[:, None],
+        station_lats[candidates],
+        station_lons[candidates],
+    ).astype(np.int64)
+
+    order = np.argsort(distances, axis=1, kind="stable")[:, :width]
+    indices = np.take_along_axis(candidates, order, axis=1)
+    distances = np.take_along_axis(distances, order, axis=1)
+    if max_distance_km is not None:
+        too_far = distances > max_distance_km * 1000
+        indices[too_far] = -1
+        distances[too_far] = -1
+    return indices, distances
+
+
+def _pairs_from_arrays(
+    station_ids: Sequence[str], indices: Any, distances: Any
+) -> list[list[tuple[str, int]]]:
+    """Turn ``find_closest_many`` arrays into (station_id, distance) lists."""
+    return [
+        [(station_ids[i], d) for i, d in zip(row_i, row_d, strict=True) if i >= 0]
+        for row_i, row_d in zip(indices.tolist(), distances.tolist(), strict=True)
+    ]
+
+
 def _rank_candidates(
     lat: float,
     lon: float,
@@ -133,9 +208,21 @@ class StationIndex:
         """Build the spatial index from a list of stations."""
         self.stations = [s for s in stations if s.lat is not None and s.lon is not None]
         self._tree: Any = None
+        self._lats: Any = None
+        self._lons: Any = None
         if self.stations and np is not None and KDTree is not None:
-            coords = np.array([_project(s.lat, s.lon) for s in self.stations])
-            self._tree = KDTree(coords)
+            self._lats = np.array([s.lat for s in self.stations], dtype=float)
+            self._lons = np.array([s.lon for s in self.stations], dtype=float)
+            self._tree = KDTree(_project_many(self._lats, self._lons))
+
+    def __len__(self) -> int:
+        """Number of indexed stations."""
+        return len(self.stations)
+
+    @property
+    def vectorized(self) -> bool:
+        """Whether ``find_closest_many`` is available (numpy + scipy)."""
+        return self._tree is not None
 
     def find_closest(
         self,
@@ -171,6 +258,76 @@ class StationIndex:
         # Fallback to brute force
         return _find_closest_brute(lat, lon, self.stations, n, max_distance_km)
 
+    def closest_pairs(
+        self,
+        points: Sequence[tuple[float, float]],
+        n: int,
+        max_distance_km: float | None = None,
+    ) -> list[list[tuple[str, int]]]:
+        """(station_id, distance_meters) lists for many points.
+
+        One vectorized query when numpy/scipy are available, otherwise
+        ``find_closest`` point by point.
+
+        Args:
+            points: (lat, lon) query points.
+            n: Maximum number of stations per point.
+            max_distance_km: Maximum distance in kilometers.
+
+        Returns:
+            One list per point, nearest first.
+        """
+        if not self.vectorized:
+            return [
+                [
+                    (sd.station.id, sd.distance_meters)
+                    for sd in self.find_closest(lat, lon, n, max_distance_km)
+                ]
+                for lat, lon in points
+            ]
+        indices, distances = self.find_closest_many(
+            [lat for lat, _ in points], [lon for _, lon in points], n, max_distance_km
+        )
+        return _pairs_from_arrays(
+            [station.id for station in self.stations], indices, distances
+        )
+
+    def find_closest_many(
+        self,
+        lats: Any,
+        lons: Any,
+        n: int,
+        max_distance_km: float | None = None,
+    ) -> tuple[Any, Any]:
+        """Closest stations for many points in one tree query.
+
+        Same ranking as ``find_closest`` point by point (KDTree
+        candidates re-ranked by ``meters_distance``, ties in tree
+        order), but projection, the tree query, distances and the
+        re-rank are all array operations.
+
+        Args:
+            lats: Latitudes of the query points (array-like, shape (m,)).
+            lons: Longitudes of the query points (array-like, shape (m,)).
+            n: Maximum number of stations per point.
+            max_distance_km: Maximum distance in kilometers.
+
+        Returns:
+            (indices, distances): int64 arrays of shape
+            (m, min(n, len(stations))), nearest first. ``indices`` index
+            into ``self.stations``; distances are whole meters. Slots
+            beyond ``max_distance_km`` hold -1 in both arrays.
+
+        Raises:
+            RuntimeError: If numpy/scipy are not installed (see
+                ``vectorized``).
+        """
+        if np is None or self._tree is None:
+            raise RuntimeError("numpy and scipy are required for batch search")
+        return _query_many(
+            self._tree, self._lats, self._lons, lats, lons, n, max_distance_km
+        )
+
 
 def find_closest(
     lat: float,
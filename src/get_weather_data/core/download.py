@@ -1,15 +1,123 @@
-"""Download utilities for get-weather-data."""
+"""Download utilities for get-weather-data.
 
+Every download goes through one pooled ``httpx.Client`` per process, so
+thousands of per-station-year files reuse connections (and TLS
+sessions) instead of opening a client each. HTTP/2 is used when the
+``h2`` package is installed (``pip install httpx[http2]``). A
+per-host semaphore caps concurrent transfers to any one server, and
+retries back off exponentially with jitter so parallel downloads that
+fail together do not retry in lockstep.
+"""
+
+import asyncio
+import importlib.util
 import io
 import logging
 import os
+import queue
+import random
+import threading
+import time
 import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, TypeVar
 
 import httpx
 
 logger = logging.getLogger("get_weather_data")
 
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Concurrent transfers to one host (NCEI throttles aggressive clients)
+PER_HOST_LIMIT = 8
+# Workers used by download_many
+DEFAULT_DOWNLOAD_WORKERS = 8
+# Retry delays: exponential from BACKOFF_BASE seconds, capped, jittered
+BACKOFF_BASE = 5.0
+BACKOFF_CAP = 60.0
+
+_client: httpx.Client | None = None
+_client_guard = threading.Lock()
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+
+_T = TypeVar("_T")
+
+
+def _reset_after_fork() -> None:
+    """Forget the parent's client and slots in a forked child.
+
+    Pooled connections belong to the parent; a child must open its own.
+    """
+    global _client, _client_guard
+    _client = None
+    _client_guard = threading.Lock()
+    _host_slots.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_client() -> httpx.Client:
+    """The process-wide pooled HTTP client (created on first use).
+
+    Returns:
+        A client that follows redirects, keeps connections alive and
+        speaks HTTP/2 when available.
+    """
+    global _client
+    with _client_guard:
+        if _client is None:
+            _client = httpx.Client(
+                follow_redirects=True,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=4 * PER_HOST_LIMIT,
+                    max_keepalive_connections=PER_HOST_LIMIT,
+                ),
+            )
+        return _client
+
+
+def close_client() -> None:
+    """Close the pooled client; the next download opens a new one."""
+    global _client
+    with _client_guard:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+@contextmanager
+def _host_slot(url: str) -> Iterator[None]:
+    """Hold one of the URL host's PER_HOST_LIMIT transfer slots."""
+    host = httpx.URL(url).host
+    with _client_guard:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(PER_HOST_LIMIT)
+    with slot:
+        yield
+
+
+def backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retry number ``attempt`` (0-based).
+
+    Exponential from BACKOFF_BASE, capped at BACKOFF_CAP, with the upper
+    half jittered so simultaneous failures spread out.
+
+    Args:
+        attempt: Retries already made.
+
+    Returns:
+        Delay in seconds.
+    """
+    delay = min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt)
+    return delay / 2 + random.uniform(0, delay / 2)  # noqa: S311 - not crypto
+
 
 def download(url: str, output_path: Path | str, timeout: float = 120.0) -> Path:
     """Download a file from URL to local path.
@@ -30,13 +138,16 @@ def download(url: str, output_path: Path | str, timeout: float = 120.0) -> Path:
         httpx.HTTPStatusError: If download fails.
     """  # noqa: DOC502 - raised by raise_for_status()
     output_path = Path(output_path)
-    part_path = output_path.with_name(f"{output_path.name}.part-{os.getpid()}")
+    # Per process and thread: a prefetch and a lookup may fetch one file at once
+    part_path = output_path.with_name(
+        f"{output_path.name}.part-{os.getpid()}-{threading.get_ident()}"
+    )
     logger.info(f"Downloading {url}...")
 
     try:
         with (
-            httpx.Client(timeout=timeout, follow_redirects=True) as client,
-            client.stream("GET", url) as response,
+            _host_slot(url),
+            get_client().stream("GET", url, timeout=timeout) as response,
         ):
             response.raise_for_status()
             with part_path.open("wb") as handle:
@@ -50,6 +161,161 @@ def download(url: str, output_path: Path | str, timeout: float = 120.0) -> Path:
     return output_path
 
 
+async def download_async(
+    url: str,
+    output_path: Path | str,
+    client: httpx.AsyncClient,
+    timeout: float = 120.0,
+) -> Path:
+    """Asyncio version of ``download`` over a caller-owned client.
+
+    Args:
+        url: URL to download from.
+        output_path: Local path to save file.
+        client: Client to send the request with (connections are pooled
+            across calls).
+        timeout: Request timeout in seconds.
+
+    Returns:
+        Path to downloaded file.
+
+    Raises:
+        httpx.HTTPStatusError: If download fails.
+    """  # noqa: DOC502 - raised by raise_for_status()
+    output_path = Path(output_path)
+    part_path = output_path.with_name(
+        f"{output_path.name}.part-{os.getpid()}-{id(asyncio.current_task())}"
+    )
+    logger.info(f"Downloading {url}...")
+
+    try:
+        async with client.stream(
+            "GET", url, timeout=timeout, follow_redirects=True
+        ) as response:
+            response.raise_for_status()
+            with part_path.open("wb") as handle:
+                async for chunk in response.aiter_bytes():
+                    handle.write(chunk)
+        os.replace(part_path, output_path)
+    finally:
+        part_path.unlink(missing_ok=True)
+
+    logger.debug(f"Downloaded to {output_path}")
+    return output_path
+
+
+async def download_with_retry_async(
+    url: str,
+    output_path: Path | str,
+    client: httpx.AsyncClient,
+    max_retries: int = 3,
+    timeout: float = 120.0,
+) -> Path | None:
+    """Asyncio version of ``download_with_retry``.
+
+    Args:
+        url: URL to download from.
+        output_path: Local path to save file.
+        client: Client to send the requests with.
+        max_retries: Maximum number of retry attempts.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        Path to downloaded file, or None if it is missing or all retries
+        failed.
+    """
+    for attempt in range(max_retries):
+        try:
+            return await download_async(url, output_path, client, timeout)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.warning(f"File not found: {url}")
+                return None
+            error = f"HTTP {e.response.status_code}"
+        except httpx.HTTPError as e:
+            error = str(e) or type(e).__name__
+        if attempt < max_retries - 1:
+            wait_time = backoff_delay(attempt)
+            logger.warning(f"Error {error}, retrying in {wait_time:.0f}s...")
+            await asyncio.sleep(wait_time)
+    logger.error(f"Download failed after {max_retries} attempts: {url}")
+    return None
+
+
+# Read-ahead queue depth (chunks) for stream_download
+_STREAM_PREFETCH = 16
+_STREAM_DONE = object()
+
+
+def stream_download(
+    url: str,
+    timeout: float = 120.0,
+    chunk_size: int = 1 << 20,
+    prefetch: int = _STREAM_PREFETCH,
+) -> Iterator[bytes]:
+    """Stream a URL's body without writing it to disk.
+
+    A background thread reads the response into a bounded queue while
+    the caller consumes it, so network time overlaps with whatever the
+    caller does with each chunk (decompress, parse, write). Closing the
+    iterator early stops the reader.
+
+    Args:
+        url: URL to download from.
+        timeout: Request timeout in seconds.
+        chunk_size: Bytes per chunk.
+        prefetch: Chunks the reader may run ahead of the caller.
+
+    Yields:
+        Body chunks as served (not content-decoded), so a ``.gz``
+        file arrives as gzip bytes.
+
+    Raises:
+        httpx.HTTPStatusError: If the server answers with an error.
+        httpx.HTTPError: If the transfer fails midway.
+    """  # noqa: DOC502 - raised in the reader thread, re-raised here
+    chunks: queue.Queue[object] = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def offer(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read() -> None:
+        try:
+            with (
+                _host_slot(url),
+                get_client().stream("GET", url, timeout=timeout) as response,
+            ):
+                response.raise_for_status()
+                for chunk in response.iter_raw(chunk_size):
+                    if not offer(chunk):
+                        return
+            offer(_STREAM_DONE)
+        except Exception as exc:
+            offer(exc)
+
+    logger.info(f"Streaming {url}...")
+    reader = threading.Thread(target=read, name="stream-download", daemon=True)
+    reader.start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is _STREAM_DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item  # type: ignore[misc]  # bytes
+    finally:
+        stop.set()
+        reader.join()
+
+
 def download_and_extract(
     url: str,
     output_dir: Path | str,
@@ -74,17 +340,17 @@ def download_and_extract(
 
     logger.info(f"Downloading {url}...")
 
-    with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-        response = client.get(url)
-        response.raise_for_status()
+    with _host_slot(url):
+        response = get_client().get(url, timeout=timeout)
+    response.raise_for_status()
 
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-            extracted = []
-            for name in zf.namelist():
-                if not name.startswith("__") and not name.endswith("/"):
-                    zf.extract(name, output_dir)
-                    extracted.append(output_dir / name)
-                    logger.debug(f"Extracted {name}")
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
+        extracted = []
+        for name in zf.namelist():
+            if not name.startswith("__") and not name.endswith("/"):
+                zf.extract(name, output_dir)
+                extracted.append(output_dir / name)
+                logger.debug(f"Extracted {name}")
 
     return extracted
 
@@ -106,8 +372,6 @@ def download_with_retry(
     Returns:
         Path to downloaded file, or None if all retries failed.
     """
-    import time
-
     output_path = Path(output_path)
 
     for attempt in range(max_retries):
@@ -118,19 +382,62 @@ def download_with_retry(
                 logger.warning(f"File not found: {url}")
                 return None
             if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 10
-                logger.warning(f"Download failed, retrying in {wait_time}s...")
+                wait_time = backoff_delay(attempt)
+                logger.warning(f"Download failed, retrying in {wait_time:.0f}s...")
                 time.sleep(wait_time)
             else:
                 logger.error(f"Download failed after {max_retries} attempts: {url}")
                 return None
         except Exception as e:
             if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 10
-                logger.warning(f"Error {e}, retrying in {wait_time}s...")
+                wait_time = backoff_delay(attempt)
+                logger.warning(f"Error {e}, retrying in {wait_time:.0f}s...")
                 time.sleep(wait_time)
             else:
                 logger.error(f"Download failed: {e}")
                 return None
 
     return None
+
+
+def download_many(
+    items: Iterable[_T],
+    max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    max_retries: int = 3,
+    timeout: float = 120.0,
+    fetch: Callable[[_T], Path | None] | None = None,
+) -> list[Path | None]:
+    """Download many files concurrently over the pooled client.
+
+    By default each item is a (url, output_path) pair fetched with
+    ``download_with_retry``. Callers with their own per-file step (a
+    cache check, a single-flight group) pass it as ``fetch`` and any
+    items it accepts. Transfers to one host never exceed PER_HOST_LIMIT
+    at a time whatever ``max_workers`` is.
+
+    Args:
+        items: (url, output_path) pairs, or whatever ``fetch`` takes.
+        max_workers: Files in flight at once.
+        max_retries: Attempts per file (default fetch only).
+        timeout: Request timeout in seconds (default fetch only).
+        fetch: Fetches one item, returning its path or None.
+
+    Returns:
+        One entry per item, in order: the downloaded path, or None if
+        the file was missing or every attempt failed.
+
+    Raises:
+        ValueError: If max_workers is less than 1.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    items = list(items)
+    if not items:
+        return []
+    run: Callable[[Any], Path | None] = fetch or (
+        lambda item: download_with_retry(item[0], item[1], max_retries, timeout)
+    )
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)), thread_name_prefix="download"
+    ) as pool:
+        return list(pool.map(run, items))
@@ -0,0 +1,61 @@
+"""Token-bucket rate limiting shared by threads and coroutines.
+
+A caller takes a token with ``reserve()``, which returns how long it
+must wait before sending; waiting is left to the caller (``time.sleep``
+in threads, ``asyncio.sleep`` in coroutines), so one bucket can pace
+both. Reservations queue up: concurrent callers are spaced out at the
+bucket's rate instead of all waking at once.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Allow ``rate`` events per second, with bursts of up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Start with a full bucket.
+
+        Args:
+            rate: Tokens added per second; 0 or less disables limiting.
+            burst: Most tokens held at once (events allowed back to back
+                after an idle spell).
+
+        Raises:
+            ValueError: If burst is less than 1.
+        """
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token, returning the seconds to wait before using it.
+
+        Returns:
+            0.0 when a token was available, else the delay until the
+            reserved token is due.
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            # Negative balance: later callers queue behind this one
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Take a token, sleeping until it is due."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,126 @@
+"""Coalesce concurrent requests for the same thing into one.
+
+When many callers ask for the same key at once (the same station-year
+file, the same API query), only the first starts the work; the rest
+wait for its outcome. Nothing is cached once the work finishes, so a
+later request starts afresh.
+
+- ``SingleFlight`` coalesces threads (batch lookups fetching GHCN
+  years and GSOD/ISD station-years).
+- ``AsyncSingleFlight`` coalesces awaitables within one event loop.
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class _Call:
+    """One in-flight call: its waiters block on ``done``."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Per-key coalescing of blocking calls across threads."""
+
+    def __init__(self) -> None:
+        """Start with nothing in flight."""
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, _Call] = {}
+        _instances.add(self)
+
+    def do(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Call ``fetch()``, or wait for the identical call in flight.
+
+        Args:
+            key: Identity of the work (callers with equal keys share it).
+            fetch: Does the work in the calling thread; only called when
+                nothing is in flight for the key.
+
+        Returns:
+            The work's result (its exception is raised to every waiter).
+
+        Raises:
+            BaseException: Whatever the shared call raised.
+        """
+        with self._lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fetch()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def __len__(self) -> int:
+        """Number of keys in flight."""
+        return len(self._inflight)
+
+
+# A forked child must not wait on calls led by parent threads that do
+# not exist in the child (nor inherit a lock one of them held)
+_instances: "weakref.WeakSet[SingleFlight]" = weakref.WeakSet()
+
+
+def _reset_after_fork() -> None:
+    for flights in list(_instances):
+        flights._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class AsyncSingleFlight:
+    """Per-key coalescing of awaitables within one event loop."""
+
+    def __init__(self) -> None:
+        """Start with nothing in flight."""
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def run(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``fetch()``, or join the identical call already in flight.
+
+        Args:
+            key: Identity of the work (callers with equal keys share it).
+            fetch: Starts the work; only called when nothing is in flight.
+
+        Returns:
+            The work's result (its exception is raised to every waiter).
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _f: self._inflight.pop(key, None))
+        # A cancelled waiter must not cancel the work others are awaiting
+        return await asyncio.shield(future)
+
+    def __len__(self) -> int:
+        """Number of keys in flight."""
+        return len(self._inflight)
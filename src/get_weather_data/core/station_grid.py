@@ -0,0 +1,458 @@
+"""Persisted, memory-mapped station index.
+
+``setup()`` writes one file per station type next to the station
+database. Stations are bucketed into a 1-degree lat/lon grid and stored
+sorted by cell, column by column:
+
+- a cell offset table, so a cell's stations are one contiguous slice;
+- latitude, longitude, elevation and the ``_project`` unit-sphere
+  coordinates (float64), plus fixed-width ids and length-prefixed
+  names and states.
+
+The header records the database's content stamp
+(``Database.content_stamp``) at write time; a file whose stamp no longer
+matches is ignored. Opening the file maps it and reads only the
+header, so a short-lived
+process answers its first coordinate query without reading the
+``stations`` table or building a tree. Point queries walk rings of grid
+cells outward until no unvisited cell can hold a closer station; the
+vectorized batch query builds a KDTree from the mapped coordinates on
+first use. Results match ``StationIndex`` (same distances and limits).
+"""
+
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from get_weather_data.core.distance import (
+    METERS_PER_NAUTICAL_MILE,
+    NAUTICAL_MILE_PER_LAT,
+    NAUTICAL_MILE_PER_LON,
+    RAD,
+    KDTree,
+    Station,
+    StationDistance,
+    _pairs_from_arrays,
+    _project,
+    _query_many,
+    meters_distance,
+    np,
+)
+
+_MAGIC = b"STNGRID"
+FORMAT_VERSION = 2
+
+# magic, format version, byte order (0 = little, 1 = big), cell size in
+# degrees, grid rows, grid columns, station count, station type, content
+# stamp of the source database
+_HEADER = struct.Struct("<7sBBxdIII16s4q")
+_ID_WIDTH = 16
+_ALIGN = 8
+_BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+
+CELL_DEGREES = 1.0
+_LAT_METERS = NAUTICAL_MILE_PER_LAT * METERS_PER_NAUTICAL_MILE
+_LON_METERS = NAUTICAL_MILE_PER_LON * METERS_PER_NAUTICAL_MILE
+
+
+def _pad(size: int) -> int:
+    """Bytes of padding that align a section end to _ALIGN."""
+    return -size % _ALIGN
+
+
+def _grid_shape(cell: float) -> tuple[int, int]:
+    return math.ceil(180 / cell), math.ceil(360 / cell)
+
+
+def _cell_of(
+    lat: float, lon: float, cell: float, rows: int, cols: int
+) -> tuple[int, int]:
+    """Grid (row, column) holding a point, clamped to the grid."""
+    row = min(max(int((lat + 90) // cell), 0), rows - 1)
+    col = min(max(int((lon + 180) // cell), 0), cols - 1)
+    return row, col
+
+
+def _strings_section(values: Sequence[str]) -> tuple[bytes, bytes]:
+    """(uint32 offsets, utf-8 blob) for a list of strings."""
+    encoded = [v.encode() for v in values]
+    offsets = array("I", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    return offsets.tobytes(), b"".join(encoded)
+
+
+def write_station_grid(
+    path: Path,
+    stations: Sequence[Station],
+    station_type: str,
+    stamp: tuple[int, int, int, int] = (0, 0, 0, 0),
+) -> int:
+    """Write stations to a memory-mappable grid index file.
+
+    The file is written to a temporary name and renamed into place, so
+    a concurrent reader never maps a partial file.
+
+    Args:
+        path: Destination file.
+        stations: Stations of one type (ones without coordinates are
+            skipped).
+        station_type: Station type recorded in the header.
+        stamp: Content stamp of the database the stations were read
+            from (see ``read_source_stamp``).
+
+    Returns:
+        Number of stations written.
+
+    Raises:
+        ValueError: If a station id is longer than the id column.
+    """
+    cell = CELL_DEGREES
+    rows, cols = _grid_shape(cell)
+    located = [s for s in stations if s.lat is not None and s.lon is not None]
+    keyed = sorted(
+        ((_cell_of(s.lat, s.lon, cell, rows, cols), i) for i, s in enumerate(located)),
+    )
+    ordered = [located[i] for _, i in keyed]
+
+    offsets = array("I", [0]) * (rows * cols + 1)
+    for (row, col), _ in keyed:
+        offsets[row * cols + col + 1] += 1
+    for c in range(rows * cols):
+        offsets[c + 1] += offsets[c]
+
+    ids = []
+    for s in ordered:
+        raw = s.id.encode()
+        if len(raw) > _ID_WIDTH:
+            raise ValueError(f"station id {s.id!r} exceeds {_ID_WIDTH} bytes")
+        ids.append(raw.ljust(_ID_WIDTH, b"\0"))
+    xyz = array("d")
+    for s in ordered:
+        xyz.extend(_project(s.lat, s.lon))
+    name_offsets, names = _strings_section([s.name or "" for s in ordered])
+    state_offsets, states = _strings_section([s.state or "" for s in ordered])
+
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+
+        def section(data: bytes) -> None:
+            f.write(data)
+            f.write(b"\0" * _pad(len(data)))
+
+        section(
+            _HEADER.pack(
+                _MAGIC,
+                FORMAT_VERSION,
+                _BYTE_ORDER,
+                cell,
+                rows,
+                cols,
+                len(ordered),
+                station_type.encode()[:16],
+                *stamp,
+            )
+        )
+        section(offsets.tobytes())
+        section(array("d", (s.lat for s in ordered)).tobytes())
+        section(array("d", (s.lon for s in ordered)).tobytes())
+        section(
+            array(
+                "d",
+                (math.nan if s.elevation is None else s.elevation for s in ordered),
+            ).tobytes()
+        )
+        section(xyz.tobytes())
+        section(b"".join(ids))
+        section(name_offsets)
+        section(names)
+        section(state_offsets)
+        section(states)
+    os.replace(tmp, path)
+    return len(ordered)
+
+
+def read_source_stamp(path: Path) -> tuple[int, ...] | None:
+    """Source database content stamp in a grid file's header.
+
+    Args:
+        path: Grid index file.
+
+    Returns:
+        The stamp passed to ``write_station_grid``, or None if the file
+        is missing or unreadable.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+        magic, version, byte_order, *rest = _HEADER.unpack(header)
+    except (OSError, struct.error):
+        return None
+    if magic != _MAGIC or version != FORMAT_VERSION or byte_order != _BYTE_ORDER:
+        return None
+    return tuple(rest[-4:])
+
+
+class StationGrid:
+    """Read-only, memory-mapped station index (``StationIndex`` interface).
+
+    Safe to share across threads: the lazily built KDTree and Station
+    list are idempotent.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Map a grid file written by :func:`write_station_grid`.
+
+        Args:
+            path: Grid index file.
+
+        Raises:
+            ValueError: If the file is not a grid this version can read.
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        magic, version, byte_order, cell, rows, cols, n, station_type, *_stamp = (
+            _HEADER.unpack_from(view)
+        )
+        if magic != _MAGIC or version != FORMAT_VERSION or byte_order != _BYTE_ORDER:
+            raise ValueError(f"{path} is not a readable station grid")
+        self.station_type = station_type.rstrip(b"\0").decode()
+        self._cell = cell
+        self._rows = rows
+        self._cols = cols
+        self._n = n
+
+        pos = _HEADER.size + _pad(_HEADER.size)
+
+        def take(size: int) -> memoryview:
+            nonlocal pos
+            chunk = view[pos : pos + size]
+            pos += size + _pad(size)
+            return chunk
+
+        self._offsets = take((rows * cols + 1) * 4).cast("I")
+        self._lats_at = pos
+        self._lats = take(n * 8).cast("d")
+        self._lons = take(n * 8).cast("d")
+        self._elevations = take(n * 8).cast("d")
+        self._xyz_at = pos
+        take(n * 24)
+        self._ids = take(n * _ID_WIDTH)
+        self._name_offsets = take((n + 1) * 4).cast("I")
+        self._names = take(self._name_offsets[n])
+        self._state_offsets = take((n + 1) * 4).cast("I")
+        self._states = take(self._state_offsets[n])
+
+        self._kdtree: tuple[Any, Any, Any] | None = None
+        self._stations: list[Station] | None = None
+
+    def __len__(self) -> int:
+        """Number of indexed stations."""
+        return self._n
+
+    @property
+    def stations(self) -> list[Station]:
+        """All stations, in file order (materialized on first access)."""
+        if self._stations is None:
+            self._stations = [self._station(k) for k in range(self._n)]
+        return self._stations
+
+    @property
+    def vectorized(self) -> bool:
+        """Whether ``find_closest_many`` is available (numpy + scipy)."""
+        return KDTree is not None and np is not None
+
+    def _station_id(self, k: int) -> str:
+        start = k * _ID_WIDTH
+        return bytes(self._ids[start : start + _ID_WIDTH]).rstrip(b"\0").decode()
+
+    def _station(self, k: int) -> Station:
+        name = bytes(self._names[self._name_offsets[k] : self._name_offsets[k + 1]])
+        state = bytes(self._states[self._state_offsets[k] : self._state_offsets[k + 1]])
+        elevation = self._elevations[k]
+        return Station(
+            id=self._station_id(k),
+            name=name.decode(),
+            lat=self._lats[k],
+            lon=self._lons[k],
+            type=self.station_type,
+            state=state.decode(),
+            elevation=None if math.isnan(elevation) else elevation,
+        )
+
+    def _ring(self, row0: int, col0: int, r: int) -> list[tuple[int, int]]:
+        """Grid cells at Chebyshev distance r from (row0, col0)."""
+        if r == 0:
+            return [(row0, col0)]
+        cells = []
+        for row in (row0 - r, row0 + r):
+            if 0 <= row < self._rows:
+                cells.extend(
+                    (row, col)
+                    for col in range(
+                        max(col0 - r, 0), min(col0 + r, self._cols - 1) + 1
+                    )
+                )
+        for col in (col0 - r, col0 + r):
+            if 0 <= col < self._cols:
+                cells.extend(
+                    (row, col)
+                    for row in range(
+                        max(row0 - r + 1, 0), min(row0 + r - 1, self._rows - 1) + 1
+                    )
+                )
+        return cells
+
+    def _unvisited_bound(
+        self, lat: float, lon: float, row0: int, col0: int, r: int
+    ) -> float:
+        """Lower bound (meters) on the distance to any cell beyond ring r.
+
+        An unvisited station lies outside the visited rows or outside the
+        visited columns. Outside the rows, its latitude gap alone bounds
+        ``meters_distance``; outside the columns, its longitude gap times
+        half the query's cos(lat) does (the other station's cos term is
+        non-negative).
+        """
+        cell = self._cell
+        bound = math.inf
+        if row0 - r > 0:
+            bound = min(bound, (lat - ((row0 - r) * cell - 90)) * _LAT_METERS)
+        if row0 + r < self._rows - 1:
+            bound = min(bound, (((row0 + r + 1) * cell - 90) - lat) * _LAT_METERS)
+        lon_scale = math.cos(lat * RAD) / 2 * _LON_METERS
+        if col0 - r > 0:
+            bound = min(bound, (lon - ((col0 - r) * cell - 180)) * lon_scale)
+        if col0 + r < self._cols - 1:
+            bound = min(bound, (((col0 + r + 1) * cell - 180) - lon) * lon_scale)
+        return bound
+
+    def find_closest(
+        self,
+        lat: float,
+        lon: float,
+        n: int,
+        max_distance_km: float | None = None,
+    ) -> list[StationDistance]:
+        """Query the mapped index for closest stations.
+
+        Args:
+            lat: Latitude of reference point.
+            lon: Longitude of reference point.
+            n: Maximum number of stations to return.
+            max_distance_km: Maximum distance in kilometers.
+
+        Returns:
+            List of StationDistance objects, sorted by distance.
+        """
+        if self._n == 0 or n <= 0:
+            return []
+        limit = math.inf if max_distance_km is None else max_distance_km * 1000
+        row0, col0 = _cell_of(lat, lon, self._cell, self._rows, self._cols)
+        last_ring = max(row0, self._rows - 1 - row0, col0, self._cols - 1 - col0)
+
+        found: list[tuple[int, int]] = []  # (distance, file position)
+        for r in range(last_ring + 1):
+            for row, col in self._ring(row0, col0, r):
+                c = row * self._cols + col
+                for k in range(self._offsets[c], self._offsets[c + 1]):
+                    distance = int(
+                        meters_distance(lat, lon, self._lats[k], self._lons[k])
+                    )
+                    if distance <= limit:
+                        found.append((distance, k))
+            bound = self._unvisited_bound(lat, lon, row0, col0, r)
+            if bound > limit:
+                break
+            if len(found) >= n:
+                found.sort()
+                del found[n:]
+                # Unvisited stations are at least floor(bound) meters away
+                if found[-1][0] <= bound - 1:
+                    break
+        found.sort()
+        return [
+            StationDistance(station=self._station(k), distance_meters=distance)
+            for distance, k in found[:n]
+        ]
+
+    def _arrays(self) -> tuple[Any, Any, Any]:
+        """(KDTree, lats, lons) over the mapped coordinates."""
+        if self._kdtree is None:
+            lats = np.frombuffer(self._mmap, np.float64, self._n, self._lats_at)
+            lons = np.frombuffer(
+                self._mmap, np.float64, self._n, self._lats_at + self._n * 8
+            )
+            xyz = np.frombuffer(self._mmap, np.float64, self._n * 3, self._xyz_at)
+            self._kdtree = (KDTree(xyz.reshape(self._n, 3)), lats, lons)
+        return self._kdtree
+
+    def find_closest_many(
+        self,
+        lats: Any,
+        lons: Any,
+        n: int,
+        max_distance_km: float | None = None,
+    ) -> tuple[Any, Any]:
+        """Closest stations for many points in one tree query.
+
+        Args:
+            lats: Latitudes of the query points (array-like, shape (m,)).
+            lons: Longitudes of the query points (array-like, shape (m,)).
+            n: Maximum number of stations per point.
+            max_distance_km: Maximum distance in kilometers.
+
+        Returns:
+            (indices, distances) arrays as ``StationIndex.find_closest_many``
+            returns them; indices are file positions (see ``stations``).
+
+        Raises:
+            RuntimeError: If numpy/scipy are not installed.
+        """
+        if not self.vectorized:
+            raise RuntimeError("numpy and scipy are required for batch search")
+        if self._n == 0:
+            return _query_many(None, [], [], lats, lons, n, max_distance_km)
+        tree, station_lats, station_lons = self._arrays()
+        return _query_many(
+            tree, station_lats, station_lons, lats, lons, n, max_distance_km
+        )
+
+    def closest_pairs(
+        self,
+        points: Sequence[tuple[float, float]],
+        n: int,
+        max_distance_km: float | None = None,
+    ) -> list[list[tuple[str, int]]]:
+        """(station_id, distance_meters) lists for many points.
+
+        Args:
+            points: (lat, lon) query points.
+            n: Maximum number of stations per point.
+            max_distance_km: Maximum distance in kilometers.
+
+        Returns:
+            One list per point, nearest first.
+        """
+        if not self.vectorized:
+            return [
+                [
+                    (sd.station.id, sd.distance_meters)
+                    for sd in self.find_closest(lat, lon, n, max_distance_km)
+                ]
+                for lat, lon in points
+            ]
+        indices, distances = self.find_closest_many(
+            [lat for lat, _ in points], [lon for _, lon in points], n, max_distance_km
+        )
+        station_ids = [self._station_id(k) for k in range(self._n)]
+        return _pairs_from_arrays(station_ids, indices, distances)
@@ -0,0 +1,225 @@
+"""Byte-budgeted in-memory cache with LRU or LFU eviction.
+
+Backs the per-source station-day value caches in ``weather/lookup.py``.
+Unlike ``functools.lru_cache`` the bound is an approximate size in
+bytes rather than an entry count, so a long-running process holds a
+predictable amount of memory whatever the shape of its values.
+
+- ``"lru"`` evicts the least recently used entry; good when recent
+  queries predict the next ones (batch jobs sorted by date).
+- ``"lfu"`` evicts the least frequently used entry (oldest first among
+  ties); good for servers with a stable set of hot locations and a long
+  tail of one-off queries that would otherwise flush them.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Literal, NamedTuple
+
+CachePolicy = Literal["lru", "lfu"]
+CACHE_POLICIES = ("lru", "lfu")
+
+
+class ValueCacheInfo(NamedTuple):
+    """Statistics of a ValueCache (``lru_cache`` fields plus bytes)."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    bytes: int
+    max_bytes: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def approx_size(key: Hashable, value: Any) -> int:
+    """Approximate memory held by one cache entry.
+
+    Counts the key, the value and, for dicts, each item's value (keys
+    such as element codes are usually shared strings).
+
+    Args:
+        key: Cache key.
+        value: Cached value.
+
+    Returns:
+        Size estimate in bytes.
+    """
+    size = sys.getsizeof(key) + sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(v) for v in value.values())
+    return size
+
+
+class ValueCache:
+    """Thread-safe mapping bounded by an approximate byte budget."""
+
+    def __init__(
+        self,
+        max_bytes: int,
+        policy: CachePolicy = "lru",
+        sizeof: Callable[[Hashable, Any], int] = approx_size,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_bytes: Budget for all entries; 0 disables caching.
+            policy: Eviction policy, "lru" or "lfu".
+            sizeof: Size estimate of an entry, in bytes.
+
+        Raises:
+            ValueError: If policy is unknown or max_bytes is negative.
+        """
+        if policy not in CACHE_POLICIES:
+            raise ValueError(
+                f"policy must be one of {', '.join(CACHE_POLICIES)}, got {policy!r}"
+            )
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {max_bytes}")
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self._sizeof = sizeof
+        self._lock = threading.Lock()
+        # key -> (value, size, use count)
+        self._entries: dict[Hashable, tuple[Any, int, int]] = {}
+        # LRU: one queue. LFU: one queue per use count, oldest first.
+        self._queues: dict[int, OrderedDict[Hashable, None]] = {}
+        self._min_count = 1
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _queue_for(self, count: int) -> OrderedDict[Hashable, None]:
+        return self._queues.setdefault(
+            count if self.policy == "lfu" else 1, OrderedDict()
+        )
+
+    def _touch(self, key: Hashable, count: int) -> None:
+        """Record a use of an entry with ``count`` prior uses."""
+        if self.policy == "lru":
+            self._queues[1].move_to_end(key)
+            return
+        queue = self._queues[count]
+        del queue[key]
+        if not queue:
+            del self._queues[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._queue_for(count + 1)[key] = None
+
+    def _evict_one(self) -> None:
+        if self.policy == "lfu" and self._min_count not in self._queues:
+            self._min_count = min(self._queues)
+        count = self._min_count if self.policy == "lfu" else 1
+        queue = self._queues[count]
+        key, _ = queue.popitem(last=False)
+        if not queue:
+            del self._queues[count]
+        _value, size, _count = self._entries.pop(key)
+        self._bytes -= size
+        self._evictions += 1
+
+    def get(self, key: Hashable) -> Any:
+        """Look up a key, counting a hit or a miss.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached value, or None when absent.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            value, size, count = entry
+            self._touch(key, count)
+            self._entries[key] = (value, size, count + 1)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting entries until it fits the budget.
+
+        Values larger than the whole budget are not stored.
+
+        Args:
+            key: Cache key.
+            value: Value to cache (not None).
+        """
+        size = self._sizeof(key, value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                count = old[2] if self.policy == "lfu" else 1
+                queue = self._queues[count]
+                del queue[key]
+                if not queue:
+                    del self._queues[count]
+                self._bytes -= old[1]
+            while self._entries and self._bytes + size > self.max_bytes:
+                self._evict_one()
+            self._entries[key] = (value, size, 1)
+            self._queue_for(1)[key] = None
+            self._min_count = 1
+            self._bytes += size
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Return the cached value, loading and storing it on a miss.
+
+        Args:
+            key: Cache key.
+            load: Computes the value on a miss (called without the lock
+                held, so concurrent misses may both load).
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = load()
+            if value is not None:
+                self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._queues.clear()
+            self._min_count = 1
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> ValueCacheInfo:
+        """Current statistics.
+
+        Returns:
+            Hits, misses, entry count, bytes held and evictions.
+        """
+        with self._lock:
+            return ValueCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=None,
+                currsize=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+                evictions=self._evictions,
+            )
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
@@ -1,6 +1,7 @@
 """High-level Weather API for get-weather-data."""
 
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
@@ -15,12 +16,18 @@ from get_weather_data.stations import (
     import_isd_stations,
     import_zipcodes,
 )
+from get_weather_data.weather.batch import BatchExecutor
 from get_weather_data.weather.batch import process_csv as _process_csv
 from get_weather_data.weather.gridded import GriddedLookup
 from get_weather_data.weather.hourly import HourlyLookup
 from get_weather_data.weather.location import LocationInput
 from get_weather_data.weather.lookup import WeatherLookup
 from get_weather_data.weather.online import OnlineLookup
+from get_weather_data.weather.prefetch import (
+    PrefetchProgress,
+    YearPrefetch,
+    prefetch_ghcn_years,
+)
 from get_weather_data.weather.results import (
     Coverage,
     HourlyResult,
@@ -57,6 +64,10 @@ class Weather:
     With online=True, get() and get_range() query the NOAA CDO API
     directly — no setup() download (just a small cached ZIP-coordinates
     file), but NCDC_TOKEN must be set.
+
+    With preload=False the station index is read by key on demand
+    instead of loaded whole, which suits one-off lookups (the CLI's
+    ``get``); batch jobs load it regardless.
     """
 
     database_path: Path | str | None = None
@@ -68,6 +79,7 @@ class Weather:
     explain: bool = False
     interpolate: bool = False
     source: Source = "station"
+    preload: bool = True
     _db: Database | None = field(default=None, repr=False)
     _lookup: WeatherLookup | None = field(default=None, repr=False)
     _online_lookup: OnlineLookup | None = field(default=None, repr=False)
@@ -94,13 +106,13 @@ class Weather:
                 explain=self.explain,
             )
         else:
-            self._db = Database(self.database_path)
+            self._db = Database(self.database_path, preload=self.preload)
 
     @property
     def db(self) -> Database:
         """Get the database instance."""
         if self._db is None:
-            self._db = Database(self.database_path)
+            self._db = Database(self.database_path, preload=self.preload)
         return self._db
 
     @property
@@ -160,6 +172,10 @@ class Weather:
             and self.db.count_zipcodes() > 0
         ):
             logger.info("Database already set up. Use force=True to rebuild.")
+            if not self.db.station_indexes_current():
+                self.db.save_station_indexes()
+            if not self.db.compact_tables_current():
+                self.db.save_compact_tables()
             return
 
         if ghcn_stations:
@@ -182,7 +198,11 @@ class Weather:
             count = build_closest_index(self.db)
             logger.info(f"Indexed {count} ZIP codes")
 
+        # Written last: the saved files are stamped with the final contents
         self.db.set_meta("index_version", str(INDEX_VERSION))
+        logger.info("Saving station spatial indexes...")
+        self.db.save_station_indexes()
+        self.db.save_compact_tables()
 
     def get(
         self,
@@ -397,6 +417,9 @@ class Weather:
         output_format: str | None = None,
         parallel: bool = True,
         max_workers: int | None = None,
+        executor: BatchExecutor = "thread",
+        prefetch: bool = False,
+        prefetch_jobs: int | None = None,
     ) -> int:
         """Process a CSV file and add weather data.
 
@@ -413,7 +436,16 @@ class Weather:
             output_format: "csv" or "parquet"; inferred from the output
                 path suffix when None (Parquet needs the ``parquet`` extra).
             parallel: Use parallel processing for faster execution.
-            max_workers: Number of worker threads (default: CPU count, max 8).
+            max_workers: Number of workers (default: CPU count; capped
+                at 8 for threads).
+            executor: "thread" (default) or "process". Process mode
+                shards each chunk across worker processes, each with its
+                own database connections, so CPU-bound lookups scale
+                with cores.
+            prefetch: Scan the input ahead of the lookups and download/
+                build the GHCN years and GSOD station-years it needs in
+                the background, so first touches do not stall the job.
+            prefetch_jobs: Concurrent prefetch fetches (default 4).
 
         Returns:
             Number of rows processed.
@@ -446,8 +478,42 @@ class Weather:
             output_format=output_format,
             parallel=parallel,
             max_workers=max_workers,
+            executor=executor,
+            prefetch=prefetch,
+            prefetch_jobs=prefetch_jobs,
         )
 
+    def prefetch(
+        self,
+        years: Iterable[int],
+        jobs: int | None = None,
+        progress: PrefetchProgress | None = None,
+    ) -> list[YearPrefetch]:
+        """Download and build GHCN years ahead of a run.
+
+        Lookups otherwise build each year on first use, stalling every
+        thread that needs it. Years are built concurrently in worker
+        processes; cached years return immediately.
+
+        Args:
+            years: Calendar years to warm (e.g. ``range(2000, 2025)``).
+            jobs: Years built at once (default 4; 1 = in this process).
+            progress: Called as (outcome, completed, total) after each
+                year.
+
+        Returns:
+            Per-year outcomes (timing, whether built, error), by year.
+
+        Raises:
+            ValueError: In online mode (there is no local cache to warm),
+                or if jobs is less than 1.
+        """  # noqa: DOC502 - jobs is validated by prefetch_ghcn_years
+        if self.online:
+            raise ValueError(
+                "prefetch warms the local GHCN cache; online=True uses none"
+            )
+        return prefetch_ghcn_years(years, jobs=jobs, progress=progress)
+
     def info(self) -> dict[str, int]:
         """Get database statistics.
 
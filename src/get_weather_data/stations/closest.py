@@ -4,7 +4,6 @@ import logging
 
 from get_weather_data.core.config import get_config
 from get_weather_data.core.database import Database
-from get_weather_data.core.distance import StationIndex
 
 logger = logging.getLogger("get_weather_data")
 
@@ -33,49 +32,33 @@ def build_closest_index(
     if usaf_count is None:
         usaf_count = config.usaf_station_count
 
-    # Load all stations
-    ghcn_stations = db.get_stations(station_type="GHCND")
-    usaf_stations = db.get_stations(station_type="USAF-WBAN")
-
+    # Spatial indexes are built ONCE and kept on the Database (key
+    # optimization!), so coordinate lookups afterwards reuse them
+    ghcn_index = db.get_station_index("GHCND")
+    usaf_index = db.get_station_index("USAF-WBAN")
     logger.info(
-        f"Loaded {len(ghcn_stations)} GHCND, {len(usaf_stations)} USAF stations"
+        f"Indexed {len(ghcn_index.stations)} GHCND, "
+        f"{len(usaf_index.stations)} USAF stations"
     )
 
-    # Build spatial indexes ONCE (key optimization!)
-    ghcn_index = StationIndex(ghcn_stations)
-    usaf_index = StationIndex(usaf_stations)
-    logger.info("Built spatial indexes")
-
     # Get all ZIP codes
     zipcodes = db.execute(
         "SELECT zipcode, lat, lon FROM zipcodes WHERE lat IS NOT NULL"
     )
 
-    processed = 0
-    total = len(zipcodes)
-    mapping: dict[str, list[tuple[str, int]]] = {}
+    points = [
+        (z, lat, lon) for z, lat, lon in zipcodes if lat is not None and lon is not None
+    ]
+    mapping: dict[str, list[tuple[str, int]]] = {z: [] for z, _, _ in points}
 
-    for zipcode, lat, lon in zipcodes:
-        if lat is None or lon is None:
+    # One vectorized query per station type covers every ZIP
+    for index, count in ((ghcn_index, ghcn_count), (usaf_index, usaf_count)):
+        if count <= 0:
             continue
-
-        closest_stations = []
-
-        if ghcn_count > 0:
-            ghcn_closest = ghcn_index.find_closest(lat, lon, n=ghcn_count)
-            for sd in ghcn_closest:
-                closest_stations.append((sd.station.id, sd.distance_meters))
-
-        if usaf_count > 0:
-            usaf_closest = usaf_index.find_closest(lat, lon, n=usaf_count)
-            for sd in usaf_closest:
-                closest_stations.append((sd.station.id, sd.distance_meters))
-
-        mapping[zipcode] = closest_stations
-
-        processed += 1
-        if processed % 5000 == 0:
-            logger.info(f"Computed {processed}/{total} ZIP codes...")
+        closest = index.closest_pairs([(lat, lon) for _, lat, lon in points], count)
+        for (zipcode, _lat, _lon), stations in zip(points, closest, strict=True):
+            mapping[zipcode].extend(stations)
+    processed = len(points)
 
     # One transaction for the whole index (~41k ZIPs) instead of per-ZIP commits
     db.set_closest_stations_bulk(mapping)
@@ -1,33 +1,65 @@
 """Batch processing of CSV files with locations and dates.
 
 Rows stream through in chunks: each chunk is looked up (optionally in
-parallel), written, and flushed before the next chunk is read, so
-memory stays bounded and completed chunks survive a crash. A failing
+parallel), written, and flushed in input order, so memory stays bounded
+and completed chunks survive a crash. Thread mode finishes a chunk
+before reading the next; process mode keeps up to one chunk per worker
+in flight, so workers are not left idle waiting on a chunk's slowest
+shard. A failing
 row gets its error recorded in the ``weather_error`` column instead of
 aborting the job.
+
+Within a chunk, rows are planned rather than looked up in input order:
+they are ordered by (year, location), split into one shard per worker,
+and each shard resolves its locations once and reads every station-year
+it needs with a single range query. Results are scattered back to the
+input order before the chunk is written.
+
+With ``prefetch=True`` a background thread streams the input once
+ahead of the lookups, resolves each block of rows to the GHCN years and
+GSOD station-years it will read, and hands them to a bounded fetch pool
+so downloads and builds overlap the lookups instead of stalling them on
+first touch.
 """
 
 import csv
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import date
 from itertools import islice
 from pathlib import Path
-from typing import Any, TextIO
+from typing import Any, Literal, TextIO
 
+from get_weather_data.core.config import Config, get_config, set_config
 from get_weather_data.core.database import Database
 from get_weather_data.weather.lookup import WeatherLookup
+from get_weather_data.weather.prefetch import BackgroundPrefetch
 from get_weather_data.weather.results import WeatherResult
 from get_weather_data.weather.units import ELEMENTS, Units
 from get_weather_data.weather.weather_types import format_weather_types
 
 logger = logging.getLogger("get_weather_data")
 
+# Rows per chunk: the unit of lookup, writing and flushing
 CHUNK_SIZE = 500
 
+# Nearest candidates per row whose data the prefetch scan fetches;
+# farther stations are only read when these lack a value
+PREFETCH_STATIONS = 2
+
+# "thread" shares one lookup (and its caches) across threads; "process"
+# shards each chunk across worker processes, sidestepping the GIL for
+# the CPU-bound parse/convert work of large jobs.
+BatchExecutor = Literal["thread", "process"]
+BATCH_EXECUTORS: tuple[str, ...] = ("thread", "process")
+
 _STATION_COLUMNS = [
     "station_id",
     "station_name",
@@ -165,6 +197,165 @@ class _Row:
     error: str | None = None
 
 
+def _lookup_rows(
+    lookup: WeatherLookup, rows: list[_Row]
+) -> list[tuple[WeatherResult | None, str]]:
+    """Look up parsed rows as one planned batch, returning (result, error)s.
+
+    Rows that failed to parse keep their error; the rest go through
+    ``WeatherLookup.get_weather_batch``, which reads each station-year
+    they share once.
+    """
+    outputs: list[tuple[WeatherResult | None, str]] = []
+    queries: list[tuple[str | tuple[float, float], date]] = []
+    pending: list[int] = []
+    for parsed in rows:
+        if parsed.error is not None or parsed.location is None:
+            outputs.append((None, parsed.error or "missing location"))
+        elif parsed.target_date is None:
+            outputs.append((None, "missing or invalid date"))
+        else:
+            pending.append(len(outputs))
+            outputs.append((None, ""))
+            queries.append((parsed.location, parsed.target_date))
+    if not queries:
+        return outputs
+    for index, result in zip(pending, lookup.get_weather_batch(queries), strict=True):
+        if isinstance(result, Exception):
+            logger.warning("Row failed: %s", result)
+            outputs[index] = (None, str(result))
+        else:
+            outputs[index] = (result, "")
+    return outputs
+
+
+def _plan_order(chunk: list[_Row]) -> list[int]:
+    """Chunk indices ordered by (year, location).
+
+    Contiguous shards of this order share station-years, so each worker
+    reads a station-year once instead of every worker reading it.
+    """
+    return sorted(
+        range(len(chunk)),
+        key=lambda i: (
+            chunk[i].target_date.year if chunk[i].target_date else 0,
+            str(chunk[i].location),
+        ),
+    )
+
+
+# Worker-process state, set once per process by _init_worker.
+_worker_lookup: WeatherLookup | None = None
+
+
+def _init_worker(
+    config: Config,
+    db_path: Path,
+    units: Units,
+    include_weather_types: bool,
+    explain: bool,
+) -> None:
+    """Give a worker process its own Database and lookup.
+
+    SQLite connections (station database and per-year GHCN tables) are
+    opened lazily inside the worker, never inherited from the parent.
+    """
+    global _worker_lookup
+    set_config(config)
+    _worker_lookup = WeatherLookup(
+        db=Database(db_path),
+        units=units,
+        include_weather_types=include_weather_types,
+        explain=explain,
+    )
+
+
+def _publish_tables(db: Database) -> None:
+    """Make sure worker processes can map one shared copy of the caches."""
+    # A stale or unreadable file (e.g. an older format) is rewritten too
+    if not db.exists() or db.compact_tables_current():
+        return
+    try:
+        db.save_compact_tables()
+    except (OSError, sqlite3.Error) as exc:
+        # Read-only location or no tables yet: each worker loads its own copy instead
+        logger.debug("Could not write shared tables for workers: %s", exc)
+
+
+def _process_shard(shard: list[_Row]) -> list[tuple[WeatherResult | None, str]]:
+    """Look up a contiguous run of rows in a worker process."""
+    if _worker_lookup is None:
+        raise RuntimeError("batch worker process was not initialized")
+    return _lookup_rows(_worker_lookup, shard)
+
+
+def _shards(chunk: list[_Row], n: int) -> list[list[_Row]]:
+    """Split a chunk into at most n contiguous, near-equal shards."""
+    size = -(-len(chunk) // n)
+    return [chunk[i : i + size] for i in range(0, len(chunk), size)]
+
+
+def _start_chunk(
+    pool: Executor,
+    lookup: WeatherLookup,
+    chunk: list[_Row],
+    parallel: bool,
+    max_workers: int,
+) -> Callable[[], list[tuple[WeatherResult | None, str]]]:
+    """Start looking up a chunk.
+
+    Returns:
+        A callable that waits for the chunk's outputs, in input order.
+    """
+    if not parallel or len(chunk) <= 1:
+        outputs = _lookup_rows(lookup, chunk)
+        return lambda: outputs
+    order = _plan_order(chunk)
+    shards = _shards([chunk[i] for i in order], max_workers)
+    if isinstance(pool, ProcessPoolExecutor):
+        futures = [pool.submit(_process_shard, shard) for shard in shards]
+    else:
+        futures = [pool.submit(_lookup_rows, lookup, shard) for shard in shards]
+
+    def collect() -> list[tuple[WeatherResult | None, str]]:
+        outputs: list[tuple[WeatherResult | None, str]] = [(None, "")] * len(chunk)
+        planned = (output for future in futures for output in future.result())
+        for i, output in zip(order, planned, strict=True):
+            outputs[i] = output
+        return outputs
+
+    return collect
+
+
+def _scan_for_prefetch(
+    input_path: Path,
+    parse_row: Callable[[dict[str, str]], _Row],
+    lookup: WeatherLookup,
+    prefetcher: BackgroundPrefetch,
+    stop: threading.Event,
+) -> None:
+    """Stream the input once, queueing the station-years its rows need."""
+    try:
+        with open(input_path, encoding="utf-8", errors="replace") as infile:
+            reader = csv.DictReader(infile)
+            while not stop.is_set():
+                block = [parse_row(row) for row in islice(reader, CHUNK_SIZE)]
+                if not block:
+                    break
+                queries = [
+                    (row.location, row.target_date)
+                    for row in block
+                    if row.error is None
+                    and row.location is not None
+                    and row.target_date is not None
+                ]
+                prefetcher.add(lookup.station_years(queries, PREFETCH_STATIONS))
+    except Exception as exc:
+        # Prefetching is an optimization; the lookups fetch on demand
+        logger.warning(f"Prefetch scan stopped: {exc}")
+    logger.debug(f"Prefetch scan queued {prefetcher.queued} fetches")
+
+
 def process_csv(
     input_path: Path | str,
     output_path: Path | str,
@@ -182,6 +373,9 @@ def process_csv(
     output_format: str | None = None,
     parallel: bool = True,
     max_workers: int | None = None,
+    executor: BatchExecutor = "thread",
+    prefetch: bool = False,
+    prefetch_jobs: int | None = None,
 ) -> int:
     """Process a CSV file and add weather data.
 
@@ -207,11 +401,34 @@ def process_csv(
             needs the ``parquet`` extra and gives typed, compressed
             columns for the analytical workflow.
         parallel: Use parallel processing for faster execution.
-        max_workers: Number of worker threads (default: CPU count).
+        max_workers: Number of workers (default: CPU count, capped at
+            8 for threads).
+        executor: "thread" or "process". Process mode splits each chunk
+            into one contiguous shard per worker process; every worker
+            keeps its own Database and GHCN connections, and maps the
+            station, ZIP and closest tables from one shared file
+            (written next to the database if missing). Up to one chunk
+            per worker is in flight at a time. Output order and
+            per-chunk flushing are the same in both modes.
+        prefetch: Scan the input in a background thread and fetch the
+            GHCN years and GSOD station-years its rows need ahead of the
+            lookups. Most useful in thread mode, where a lookup waits
+            for an in-flight build instead of repeating it.
+        prefetch_jobs: Concurrent prefetch downloads/builds (default 4).
 
     Returns:
         Number of rows processed.
+
+    Raises:
+        ValueError: If executor is not "thread" or "process", or
+            prefetch_jobs is less than 1.
     """
+    if executor not in BATCH_EXECUTORS:
+        raise ValueError(
+            f"executor must be one of {', '.join(BATCH_EXECUTORS)}, got {executor!r}"
+        )
+    if prefetch_jobs is not None and prefetch_jobs < 1:
+        raise ValueError(f"prefetch_jobs must be at least 1, got {prefetch_jobs}")
     input_path = Path(input_path)
     output_path = Path(output_path)
     if output_format is None:
@@ -220,8 +437,13 @@ def process_csv(
     if db is None:
         db = Database()
     if max_workers is None:
-        max_workers = min(os.cpu_count() or 4, 8)
+        cpus = os.cpu_count() or 4
+        max_workers = cpus if executor == "process" else min(cpus, 8)
 
+    if not db.preload and db.exists():
+        # Batch jobs touch most of the index; per-key queries would be
+        # slower than loading it once
+        db.preload_caches()
     lookup = WeatherLookup(
         db=db,
         units=units,
@@ -253,18 +475,6 @@ def process_csv(
             error = "missing or invalid date"
         return _Row(data=row, location=location, target_date=target_date, error=error)
 
-    def process_row(parsed: _Row) -> tuple[dict[str, str], WeatherResult | None, str]:
-        if parsed.error is not None or parsed.location is None:
-            return (parsed.data, None, parsed.error or "missing location")
-        if parsed.target_date is None:
-            return (parsed.data, None, "missing or invalid date")
-        try:
-            result = lookup.get_weather(parsed.location, parsed.target_date)
-        except Exception as exc:
-            logger.warning("Row failed: %s", exc)
-            return (parsed.data, None, str(exc))
-        return (parsed.data, result, "")
-
     processed = 0
     errors = 0
 
@@ -287,24 +497,56 @@ def process_csv(
             sink = _CsvSink(outfile, input_fieldnames, include_weather_types, explain)
         stack.callback(sink.close)
 
-        executor = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+        if prefetch:
+            prefetcher = BackgroundPrefetch(prefetch_jobs)
+            stop = threading.Event()
+            scanner = threading.Thread(
+                target=_scan_for_prefetch,
+                args=(input_path, parse_row, lookup, prefetcher, stop),
+                name="prefetch-scan",
+                daemon=True,
+            )
+            # Unwound in reverse: stop the scan, then drain the fetch pool
+            stack.callback(prefetcher.close)
+            stack.callback(scanner.join)
+            stack.callback(stop.set)
+            scanner.start()
+
+        pool: Executor
+        if parallel and executor == "process":
+            _publish_tables(db)
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(get_config(), db.path, units, include_weather_types, explain),
+            )
+        else:
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+        stack.enter_context(pool)
+        # Chunks started but not yet written, oldest first
+        in_flight = max_workers if parallel and executor == "process" else 1
+        pending: deque[
+            tuple[list[_Row], Callable[[], list[tuple[WeatherResult | None, str]]]]
+        ] = deque()
         while True:
             chunk = [parse_row(row) for row in islice(reader, CHUNK_SIZE)]
-            if not chunk:
+            if chunk:
+                pending.append(
+                    (chunk, _start_chunk(pool, lookup, chunk, parallel, max_workers))
+                )
+                if len(pending) < in_flight:
+                    continue
+            if not pending:
                 break
 
-            if parallel and len(chunk) > 1:
-                outputs = list(executor.map(process_row, chunk))
-            else:
-                outputs = [process_row(parsed) for parsed in chunk]
-
-            for row_data, result, error in outputs:
-                sink.write_row(row_data, result, error)
+            done, collect = pending.popleft()
+            for parsed, (result, error) in zip(done, collect(), strict=True):
+                sink.write_row(parsed.data, result, error)
                 if error:
                     errors += 1
             sink.flush_chunk()
 
-            processed += len(chunk)
+            processed += len(done)
             logger.info(f"Processed {processed} rows...")
 
     if errors:
@@ -1,17 +1,28 @@
 """GHCN (Global Historical Climatology Network) daily data fetching."""
 
+import codecs
 import csv
 import gzip
+import hashlib
 import logging
 import os
 import sqlite3
 import threading
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from contextlib import closing
 from datetime import date
 from pathlib import Path
 
+import httpx
+
 from get_weather_data.core.cache import is_fresh, year_is_immutable
 from get_weather_data.core.config import get_config
-from get_weather_data.core.download import download_with_retry
+from get_weather_data.core.database import Database, station_writes
+from get_weather_data.core.download import backoff_delay, stream_download
+from get_weather_data.core.singleflight import SingleFlight
+from get_weather_data.weather.ghcn_store import ColumnarYear, build_year_store
 from get_weather_data.weather.weather_types import WT_CODES
 
 logger = logging.getLogger("get_weather_data")
@@ -33,43 +44,102 @@ GHCN_ELEMENTS = [
     "ASTP",  # Average station pressure
 ]
 
-# One lock per year so concurrent batch threads build each yearly
-# database exactly once.
+# Attempts at streaming a year before giving up
+STREAM_RETRIES = 3
+# zlib window bits that accept a gzip header
+_GZIP_WBITS = zlib.MAX_WBITS | 16
+
+# Everything the lookups ever read: the value elements plus the WT**
+# present-weather codes. Filtered ingest keeps only these.
+_INGEST_ELEMENTS = frozenset(GHCN_ELEMENTS) | frozenset(WT_CODES)
+
+# Concurrent batch threads that need the same year wait on one build
+# instead of each downloading it.
+_builds = SingleFlight()
+# Guards creation of the shared columnar stores.
 _locks_guard = threading.Lock()
-_year_locks: dict[int, threading.Lock] = {}
 
-# Per-thread, per-year read-only connections (multi-GB files; opening a
-# fresh connection per row lookup is wasteful).
+# Per-thread, per-store read-only connections (multi-GB files; opening a
+# fresh connection per row lookup is wasteful), with the identity of the
+# file each one opened (see _store_identity).
 _connections = threading.local()
 
+# Process-wide memory-mapped columnar stores, one per store path, with the
+# identity of the mapped file. Unlike SQLite connections these are
+# immutable and safe to share across threads.
+_columnar_years: dict[Path, tuple[tuple[int, int], ColumnarYear]] = {}
+
+# Filtered ingest: the latest station set read, as (database path, file
+# stamps, GHCND station IDs or None, digest of the IDs), so the stations
+# table is re-read only after it changes
+_StationFilter = tuple[Path, tuple[int, ...], set[str] | None, str]
+_station_filter_cache: _StationFilter | None = None
+
+# Filtered ingest: (year, database path) -> (station_writes() when the
+# year's store was located, digest it was located with, "" if unfiltered).
+# Value reads reuse it instead of stat()ing the station DB each time.
+_located_filters: dict[tuple[int, Path], tuple[int, str]] = {}
+
+
+def _reset_after_fork() -> None:
+    """Drop locks and connections a forked child must not inherit.
+
+    A lock held by another parent thread at fork time would never be
+    released in the child, and SQLite connections are not fork-safe.
+    The columnar mmaps are read-only and stay shared. (``_builds``
+    resets itself.)
+    """
+    global _locks_guard, _connections
+    _locks_guard = threading.Lock()
+    _connections = threading.local()
 
-def _year_lock(year: int) -> threading.Lock:
-    """Get (or create) the build lock for a year."""
-    with _locks_guard:
-        if year not in _year_locks:
-            _year_locks[year] = threading.Lock()
-        return _year_locks[year]
 
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
-def _get_ghcn_db_path(year: int) -> Path:
-    """Get path to GHCN database for a year."""
+
+def _get_ghcn_db_path(year: int, relocate: bool = False) -> Path:
+    """Get path to the GHCN store for a year (per the configured engine).
+
+    Filtered builds are named after a digest of the station set they
+    keep, so switching the ingest mode never serves a station-subset
+    cache to an unfiltered reader, and importing stations later builds
+    a new store that includes them. The station set is checked when a
+    year is first located, when it is about to be built
+    (``relocate``), and after this process imports stations; other
+    reads reuse the located store.
+    """
     config = get_config()
-    return config.ghcn_cache_dir / f"ghcn_{year}.sqlite3"
+    stem = f"ghcn_{year}"
+    if config.ghcn_filtered_ingest:
+        key = (year, config.database_path)
+        writes = station_writes()
+        located = _located_filters.get(key)
+        if relocate or located is None or located[0] != writes:
+            station_ids, digest = _station_filter()
+            located = (writes, digest if station_ids is not None else "")
+            _located_filters[key] = located
+        if located[1]:
+            stem = f"ghcn_{year}-filtered-{located[1]}"
+    if config.ghcn_engine == "columnar":
+        return config.ghcn_cache_dir / f"{stem}.cols"
+    return config.ghcn_cache_dir / f"{stem}.sqlite3"
 
 
 def _ensure_ghcn_database(year: int) -> Path:
     """Ensure the yearly GHCN database exists, downloading if needed.
 
-    Thread-safe: a per-year lock means one thread downloads and builds
-    while the rest wait. Cross-process safe: the database is built to a
-    temporary path and atomically renamed, so other processes only ever
-    see a complete file (worst case they duplicate work, never corrupt).
+    Thread-safe: one thread downloads and builds a year while the rest
+    wait on its build (``SingleFlight``) and share the outcome.
+    Cross-process safe: the database is built to a temporary path and
+    atomically renamed, so other processes only ever see a complete
+    file (worst case they duplicate work, never corrupt).
 
     Args:
         year: Calendar year to ensure.
 
     Returns:
-        Path to the yearly SQLite database.
+        Path to the yearly SQLite database (or columnar store).
 
     Raises:
         RuntimeError: If the yearly file cannot be downloaded.
@@ -77,30 +147,112 @@ def _ensure_ghcn_database(year: int) -> Path:
     db_path = _get_ghcn_db_path(year)
     if _year_db_usable(db_path, year):
         return db_path
+    # About to build: make sure the store is named for the current stations
+    db_path = _get_ghcn_db_path(year, relocate=True)
+    if _year_db_usable(db_path, year):
+        return db_path
+    # Keyed by path: each engine and ingest mode has its own store
+    return _builds.do(("GHCND", db_path), lambda: _build_ghcn_year(db_path, year))
 
-    with _year_lock(year):
-        if _year_db_usable(db_path, year):  # built while we waited
-            return db_path
-
-        config = get_config()
-        gz_path = config.ghcn_cache_dir / f"{year}.csv.gz"
-        if not gz_path.exists():
-            url = GHCN_BY_YEAR_URL.format(year=year)
-            if download_with_retry(url, gz_path) is None:
-                raise RuntimeError(f"Failed to download GHCN data for {year}")
 
-        logger.info(f"Building GHCN database for {year}...")
-        tmp_path = db_path.with_name(f"{db_path.name}.tmp-{os.getpid()}")
-        try:
-            _build_year_db(tmp_path, gz_path, year)
-            os.replace(tmp_path, db_path)
-        finally:
-            tmp_path.unlink(missing_ok=True)
+def _build_ghcn_year(db_path: Path, year: int) -> Path:
+    """Download and build a year's store unless it is already usable."""
+    if _year_db_usable(db_path, year):  # built just before this flight
+        return db_path
 
+    logger.info(f"Building GHCN database for {year}...")
+    station_ids = _ingest_station_filter()
+    if station_ids is not None:
+        # Stores filtered to an older station set are superseded
+        pattern = f"ghcn_{year}-filtered*{db_path.suffix}"
+        for stale in db_path.parent.glob(pattern):
+            if stale != db_path:
+                stale.unlink(missing_ok=True)
+    elements = _INGEST_ELEMENTS if station_ids is not None else None
+    gz_path = get_config().ghcn_cache_dir / f"{year}.csv.gz"
+    if gz_path.exists():
+        # An archive left by an older version or placed by hand
+        lines = _iter_archive_lines(gz_path)
+        _build_year(db_path, _parse_year_lines(lines, station_ids, elements), year)
         # The extracted database supersedes the source archive
         gz_path.unlink(missing_ok=True)
-        logger.info(f"GHCN database for {year} ready")
-        return db_path
+    else:
+        _stream_year(db_path, year, station_ids, elements)
+    logger.info(f"GHCN database for {year} ready")
+    return db_path
+
+
+def ensure_ghcn_year(year: int) -> bool:
+    """Download and build a GHCN year unless a usable copy is cached.
+
+    Args:
+        year: Calendar year.
+
+    Returns:
+        True if the year was built, False if it was already cached.
+
+    Raises:
+        RuntimeError: If the yearly file cannot be downloaded.
+    """  # noqa: DOC502 - raised by _ensure_ghcn_database
+    built = not _year_db_usable(_get_ghcn_db_path(year), year)
+    _ensure_ghcn_database(year)
+    return built
+
+
+def _build_year(db_path: Path, rows: Iterable[list[str]], year: int) -> None:
+    """Build a year's store from rows at a temporary path, then rename it."""
+    tmp_path = db_path.with_name(f"{db_path.name}.tmp-{os.getpid()}")
+    try:
+        if get_config().ghcn_engine == "columnar":
+            build_year_store(tmp_path, rows, year)
+        else:
+            _build_year_db(tmp_path, rows, year)
+        os.replace(tmp_path, db_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _stream_year(
+    db_path: Path,
+    year: int,
+    station_ids: set[str] | None,
+    elements: frozenset[str] | None,
+) -> None:
+    """Build a year straight from the HTTP stream, retrying failed transfers.
+
+    The archive is decompressed and parsed as it arrives and rows go
+    into the store while later chunks are still downloading; the
+    ``.csv.gz`` never touches disk. A transfer that fails midway
+    restarts the build from scratch.
+
+    Raises:
+        RuntimeError: If the year cannot be downloaded.
+    """
+    url = GHCN_BY_YEAR_URL.format(year=year)
+    for attempt in range(STREAM_RETRIES):
+        try:
+            with closing(stream_download(url)) as chunks:
+                lines = _gunzip_lines(chunks)
+                rows = _parse_year_lines(lines, station_ids, elements)
+                _build_year(db_path, rows, year)
+            return
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404:
+                logger.warning(f"File not found: {url}")
+                break
+            error: Exception = exc
+        except (httpx.HTTPError, OSError, EOFError, zlib.error) as exc:
+            error = exc
+        if attempt < STREAM_RETRIES - 1:
+            # Jittered, so parallel cache-warm workers do not retry in step
+            wait_time = backoff_delay(attempt)
+            logger.warning(
+                f"GHCN {year} stream failed ({error}); retrying in {wait_time:.0f}s"
+            )
+            time.sleep(wait_time)
+        else:
+            logger.error(f"GHCN {year} stream failed after {STREAM_RETRIES} attempts")
+    raise RuntimeError(f"Failed to download GHCN data for {year}")
 
 
 def _year_db_usable(db_path: Path, year: int) -> bool:
@@ -116,8 +268,127 @@ def _year_db_usable(db_path: Path, year: int) -> bool:
     return is_fresh(db_path, get_config().cache_max_age_days)
 
 
-def _build_year_db(db_file: Path, gz_path: Path, year: int) -> None:
-    """Load a yearly GHCN csv.gz into a SQLite file."""
+def _ingest_station_filter() -> set[str] | None:
+    """GHCND station IDs to keep when filtered ingest is enabled.
+
+    Returns:
+        The station DB's GHCND IDs, or None for an unfiltered build (mode
+        off, or no stations imported yet).
+    """
+    if not get_config().ghcn_filtered_ingest:
+        return None
+    return _station_filter()[0]
+
+
+def _station_filter() -> tuple[set[str] | None, str]:
+    """The station DB's GHCND IDs (None if there are none) and their digest."""
+    global _station_filter_cache
+    path = get_config().database_path
+    # Writes may still sit in the WAL file, so it counts as a change too
+    stamp: list[int] = []
+    for file in (path, path.with_name(f"{path.name}-wal")):
+        try:
+            info = file.stat()
+        except OSError:
+            continue
+        stamp += [info.st_mtime_ns, info.st_size]
+    cached = _station_filter_cache
+    if cached is not None and cached[:2] == (path, tuple(stamp)):
+        return cached[2], cached[3]
+    db = Database(path)
+    station_ids = db.get_station_ids("GHCND") if db.exists() else set()
+    db.close()
+    if not station_ids:
+        logger.warning(
+            "Filtered GHCN ingest needs imported stations (run setup()); "
+            "building the unfiltered year instead"
+        )
+    digest = hashlib.sha256("\n".join(sorted(station_ids)).encode()).hexdigest()
+    _station_filter_cache = (path, tuple(stamp), station_ids or None, digest[:12])
+    return station_ids or None, digest[:12]
+
+
+def _iter_archive_lines(gz_path: Path) -> Iterator[str]:
+    """Text lines of a yearly csv.gz archive on disk."""
+    with gzip.open(gz_path, "rt") as f:
+        yield from f
+
+
+def _gunzip_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decompress a gzip byte stream incrementally into text lines.
+
+    Handles multi-member archives.
+
+    Args:
+        chunks: Compressed bytes, in order (e.g. from ``stream_download``).
+
+    Yields:
+        Lines including their newline (the last one may lack it).
+
+    Raises:
+        EOFError: If the stream ends inside a gzip member (a truncated
+            transfer must not build a partial year).
+    """
+    inflater = zlib.decompressobj(_GZIP_WBITS)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    in_member = False
+    pending = ""
+    for chunk in chunks:
+        while chunk:
+            in_member = True
+            text = decoder.decode(inflater.decompress(chunk))
+            chunk = b""
+            if inflater.eof:
+                # Next gzip member, if any
+                chunk = inflater.unused_data
+                inflater = zlib.decompressobj(_GZIP_WBITS)
+                in_member = False
+            if not text:
+                continue
+            lines = (pending + text).split("\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line + "\n"
+    if in_member:
+        raise EOFError("GHCN archive stream ended early")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def _parse_year_lines(
+    lines: Iterable[str],
+    station_ids: set[str] | None = None,
+    elements: frozenset[str] | None = None,
+) -> Iterator[list[str]]:
+    """Parse the csv lines of a yearly GHCN archive.
+
+    Args:
+        lines: Text lines of a ``by_year`` archive.
+        station_ids: If given, drop rows for other stations.
+        elements: If given, drop rows for other element codes.
+
+    Yields:
+        Parsed csv rows (id, date, element, value, m_flag, q_flag,
+        s_flag, obs_time).
+    """
+    if station_ids is None and elements is None:
+        yield from csv.reader(lines)
+        return
+    # Filter on the raw line (id and element are the 1st and 3rd
+    # fields, never quoted) so dropped rows skip csv parsing entirely
+    kept = (
+        line
+        for line in lines
+        if (parts := line.split(",", 3))
+        and (station_ids is None or parts[0] in station_ids)
+        and (elements is None or (len(parts) > 2 and parts[2] in elements))
+    )
+    yield from csv.reader(kept)
+
+
+def _build_year_db(db_file: Path, rows: Iterable[list[str]], year: int) -> None:
+    """Load a yearly GHCN csv stream into a SQLite file."""
     conn = sqlite3.connect(db_file)
     try:
         c = conn.cursor()
@@ -138,32 +409,120 @@ def _build_year_db(db_file: Path, gz_path: Path, year: int) -> None:
         c.execute("PRAGMA synchronous = OFF")
         c.execute("PRAGMA cache_size = 1000000")
 
-        with gzip.open(gz_path, "rt") as f:
-            reader = csv.reader(f)
-            c.executemany(
-                f"""INSERT OR IGNORE INTO ghcn_{year}
-                    (id, date, element, value, m_flag, q_flag, s_flag, obs_time)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",  # noqa: S608 - int year
-                reader,
-            )
+        c.executemany(
+            f"""INSERT OR IGNORE INTO ghcn_{year}
+                (id, date, element, value, m_flag, q_flag, s_flag, obs_time)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",  # noqa: S608 - int year
+            rows,
+        )
         conn.commit()
     finally:
         conn.close()
 
 
+def _store_identity(year: int, path: Path) -> tuple[int, int]:
+    """Inode and mtime of a year's store, to notice it being rebuilt.
+
+    A TTL rebuild ``os.replace()``s the file, so an open connection or
+    mmap would keep reading the old one. Final years are never rebuilt
+    and skip the ``stat()``.
+    """
+    if year_is_immutable(year):
+        return (0, 0)
+    try:
+        info = path.stat()
+    except OSError:
+        return (0, 0)
+    return (info.st_ino, info.st_mtime_ns)
+
+
 def _year_connection(year: int, db_path: Path) -> sqlite3.Connection:
-    """Get this thread's read-only connection for a year."""
-    pool: dict[int, sqlite3.Connection] | None = getattr(_connections, "pool", None)
+    """Get this thread's read-only connection for a year's store."""
+    pool: dict[Path, tuple[tuple[int, int], sqlite3.Connection]] | None = getattr(
+        _connections, "pool", None
+    )
     if pool is None:
         pool = {}
         _connections.pool = pool
-    conn = pool.get(year)
-    if conn is None:
-        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-        pool[year] = conn
+    identity = _store_identity(year, db_path)
+    entry = pool.get(db_path)
+    if entry is not None and entry[0] == identity:
+        return entry[1]
+    if entry is not None:
+        entry[1].close()  # the store was rebuilt since
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    pool[db_path] = (identity, conn)
     return conn
 
 
+def _columnar_year(year: int, path: Path) -> ColumnarYear:
+    """Get the shared memory-mapped columnar store for a year."""
+    identity = _store_identity(year, path)
+    entry = _columnar_years.get(path)
+    if entry is None or entry[0] != identity:
+        with _locks_guard:
+            entry = _columnar_years.get(path)
+            if entry is None or entry[0] != identity:
+                # A replaced store's old mapping is released once no
+                # reader still holds it
+                entry = _columnar_years[path] = (identity, ColumnarYear(path))
+    return entry[1]
+
+
+def _read_ghcn_range(
+    station_id: str, start: date, end: date, elements: list[str]
+) -> dict[date, dict[str, tuple[float, str]]]:
+    """Read a station's GHCN observations over a span, with QC flags.
+
+    One query (or one columnar slice) per calendar year in the span,
+    rather than one per day.
+
+    Args:
+        station_id: GHCN station ID.
+        start: First date (inclusive).
+        end: Last date (inclusive).
+        elements: Element codes to keep.
+
+    Returns:
+        Date -> element code -> (raw value, quality flag). The quality
+        flag is blank when the value passed all of NOAA's QC checks.
+        Days with no wanted observation are absent.
+    """
+    wanted = set(elements)
+    columnar = get_config().ghcn_engine == "columnar"
+    rows: dict[date, dict[str, tuple[float, str]]] = {}
+
+    for year in range(start.year, end.year + 1):
+        first = max(start, date(year, 1, 1))
+        last = min(end, date(year, 12, 31))
+        db_path = _ensure_ghcn_database(year)
+        if columnar:
+            rows.update(
+                _columnar_year(year, db_path).read(station_id, first, last, wanted)
+            )
+            continue
+
+        conn = _year_connection(year, db_path)
+        c = conn.execute(
+            f"SELECT date, element, value, q_flag FROM ghcn_{year} "  # noqa: S608 - int year
+            "WHERE id = ? AND date BETWEEN ? AND ?",
+            (station_id, first.strftime("%Y%m%d"), last.strftime("%Y%m%d")),
+        )
+        days: dict[str, date] = {}
+        for date_str, element, value, q_flag in c:
+            if element in wanted and value and value != "-9999":
+                day = days.get(date_str)
+                if day is None:
+                    day = days[date_str] = date(
+                        int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8])
+                    )
+                rows.setdefault(day, {})[element] = (
+                    float(value),
+                    (q_flag or "").strip(),
+                )
+    return rows
+
+
 def _read_ghcn_rows(
     station_id: str, target_date: date, elements: list[str]
 ) -> dict[str, tuple[float, str]]:
@@ -178,22 +537,20 @@ def _read_ghcn_rows(
         Mapping of element code to (raw value, quality flag). The quality
         flag is blank when the value passed all of NOAA's QC checks.
     """
-    year = target_date.year
-    db_path = _ensure_ghcn_database(year)
-    date_str = target_date.strftime("%Y%m%d")
-    wanted = set(elements)
+    rows = _read_ghcn_range(station_id, target_date, target_date, elements)
+    return rows.get(target_date, {})
 
-    conn = _year_connection(year, db_path)
-    c = conn.execute(
-        f"SELECT element, value, q_flag FROM ghcn_{year} "  # noqa: S608 - int year
-        "WHERE id = ? AND date = ?",
-        (station_id, date_str),
-    )
-    rows: dict[str, tuple[float, str]] = {}
-    for element, value, q_flag in c:
-        if element in wanted and value and value != "-9999":
-            rows[element] = (float(value), (q_flag or "").strip())
-    return rows
+
+def _values_from_rows(
+    rows: dict[str, tuple[float, str]], elements: list[str], drop_flagged: bool
+) -> dict[str, float | None]:
+    """Element values for one day, None where missing (or QC-flagged)."""
+    values: dict[str, float | None] = dict.fromkeys(elements)
+    for element, (value, q_flag) in rows.items():
+        if drop_flagged and q_flag:
+            continue
+        values[element] = value
+    return values
 
 
 def get_ghcn_data(
@@ -217,12 +574,37 @@ def get_ghcn_data(
     if elements is None:
         elements = GHCN_ELEMENTS
     rows = _read_ghcn_rows(station_id, target_date, elements)
-    values: dict[str, float | None] = dict.fromkeys(elements)
-    for element, (value, q_flag) in rows.items():
-        if drop_flagged and q_flag:
-            continue
-        values[element] = value
-    return values
+    return _values_from_rows(rows, elements, drop_flagged)
+
+
+def get_ghcn_data_range(
+    station_id: str,
+    start: date,
+    end: date,
+    elements: list[str] | None = None,
+    drop_flagged: bool = True,
+) -> dict[date, dict[str, float | None]]:
+    """Get a station's GHCN series over a date span in one pass.
+
+    Args:
+        station_id: GHCN station ID (e.g., "USW00094728").
+        start: First date (inclusive).
+        end: Last date (inclusive).
+        elements: List of elements to retrieve. Uses default set if None.
+        drop_flagged: If True (default), exclude values that failed one
+            of NOAA's quality-control checks.
+
+    Returns:
+        Date -> the same dict ``get_ghcn_data`` returns for that day.
+        Days on which the station reported nothing are absent.
+    """
+    if elements is None:
+        elements = GHCN_ELEMENTS
+    rows = _read_ghcn_range(station_id, start, end, elements)
+    return {
+        day: _values_from_rows(day_rows, elements, drop_flagged)
+        for day, day_rows in rows.items()
+    }
 
 
 def get_ghcn_flags(
@@ -260,3 +642,49 @@ def get_ghcn_weather_types(station_id: str, target_date: date) -> set[str]:
     """
     rows = _read_ghcn_rows(station_id, target_date, list(WT_CODES))
     return {WT_CODES[code] for code in rows if code in WT_CODES}
+
+
+def get_ghcn_flags_range(
+    station_id: str,
+    start: date,
+    end: date,
+    elements: list[str] | None = None,
+) -> dict[date, dict[str, str]]:
+    """Get a station's GHCN quality-control flags over a date span.
+
+    Args:
+        station_id: GHCN station ID.
+        start: First date (inclusive).
+        end: Last date (inclusive).
+        elements: Element codes to retrieve. Uses default set if None.
+
+    Returns:
+        Date -> element code -> QC flag, for days with any value.
+    """
+    if elements is None:
+        elements = GHCN_ELEMENTS
+    rows = _read_ghcn_range(station_id, start, end, elements)
+    return {
+        day: {element: q_flag for element, (_value, q_flag) in day_rows.items()}
+        for day, day_rows in rows.items()
+    }
+
+
+def get_ghcn_weather_types_range(
+    station_id: str, start: date, end: date
+) -> dict[date, set[str]]:
+    """Get a station's present-weather phenomena over a date span.
+
+    Args:
+        station_id: GHCN station ID.
+        start: First date (inclusive).
+        end: Last date (inclusive).
+
+    Returns:
+        Date -> set of phenomenon names, for days with any WT** code.
+    """
+    rows = _read_ghcn_range(station_id, start, end, list(WT_CODES))
+    return {
+        day: {WT_CODES[code] for code in day_rows if code in WT_CODES}
+        for day, day_rows in rows.items()
+    }
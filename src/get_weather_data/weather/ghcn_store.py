@@ -0,0 +1,264 @@
+"""Columnar, memory-mapped store for yearly GHCN-Daily data.
+
+An alternative to the per-year SQLite table (``Config(ghcn_engine=
+"columnar")``). Each year is one binary file whose observations are
+sorted by (station, date) and laid out column by column:
+
+- day of year (uint16), element index (uint8), value (int16, raw GHCN
+  units) and QC flag (one ASCII byte, 0 = blank), one entry per row;
+- a sorted station-id table with a row-offset array, so a station's
+  observations are one contiguous slice of every column.
+
+Readers ``mmap`` the file and cast each column to a typed memoryview:
+a lookup touches only the pages holding that station's rows and never
+parses text, and the page cache is shared by every process reading the
+same year. Values that do not fit int16 (none of the elements this
+package reads) are dropped at build time.
+"""
+
+import logging
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from datetime import date
+from pathlib import Path
+
+logger = logging.getLogger("get_weather_data")
+
+_MAGIC = b"GHCNCOL"
+FORMAT_VERSION = 1
+
+# magic, format version, byte order (0 = little, 1 = big), year,
+# element count, station count, row count
+_HEADER = struct.Struct("<7sBBxHIII")
+_STATION_ID_WIDTH = 12
+_ELEMENT_WIDTH = 4
+_ALIGN = 8
+
+_MISSING = "-9999"
+_INT16_MIN, _INT16_MAX = -32768, 32767
+_BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+
+
+def _pad(size: int) -> int:
+    """Bytes of padding that align a section end to _ALIGN."""
+    return -size % _ALIGN
+
+
+class _StationColumns:
+    """One station's rows while a year is being built."""
+
+    __slots__ = ("days", "elements", "qflags", "values")
+
+    def __init__(self) -> None:
+        self.days = array("H")
+        self.elements = array("B")
+        self.values = array("h")
+        self.qflags = array("B")
+
+    def sort(self) -> None:
+        """Order rows by (day, element) if the source was unsorted."""
+        days = self.days
+        if all(days[i] <= days[i + 1] for i in range(len(days) - 1)):
+            return
+        order = sorted(range(len(days)), key=lambda i: (days[i], self.elements[i]))
+        self.days = array("H", (days[i] for i in order))
+        self.elements = array("B", (self.elements[i] for i in order))
+        self.values = array("h", (self.values[i] for i in order))
+        self.qflags = array("B", (self.qflags[i] for i in order))
+
+
+def build_year_store(out_path: Path, rows: Iterable[Sequence[str]], year: int) -> int:
+    """Write a year of GHCN csv rows to a columnar store file.
+
+    Args:
+        out_path: Destination file (callers write to a temporary path
+            and rename it into place).
+        rows: Parsed ``by_year`` csv rows (id, date, element, value,
+            m_flag, q_flag, s_flag, obs_time).
+        year: Calendar year of the rows.
+
+    Returns:
+        Number of observations written.
+
+    Raises:
+        ValueError: If the year uses more distinct elements than the
+            one-byte element index can address.
+    """
+    jan1 = date(year, 1, 1).toordinal()
+    day_of: dict[str, int] = {}  # YYYYMMDD -> day of year (<= 366 keys)
+    element_index: dict[str, int] = {}
+    stations: dict[str, _StationColumns] = {}
+    skipped = 0
+
+    for row in rows:
+        station_id, date_str, element, value = row[0], row[1], row[2], row[3]
+        if not value or value == _MISSING:
+            continue
+        try:
+            raw = int(value)
+            day = day_of.get(date_str)
+            if day is None:
+                day = day_of[date_str] = (
+                    date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))
+                ).toordinal() - jan1
+        except ValueError:
+            skipped += 1
+            continue
+        if not _INT16_MIN <= raw <= _INT16_MAX:
+            skipped += 1
+            continue
+        code = element_index.get(element)
+        if code is None:
+            code = len(element_index)
+            if code > 0xFF:
+                raise ValueError(f"GHCN {year} has more than 256 element codes")
+            element_index[element] = code
+        columns = stations.get(station_id)
+        if columns is None:
+            columns = stations[station_id] = _StationColumns()
+        q_flag = row[5] if len(row) > 5 else ""
+        columns.days.append(day)
+        columns.elements.append(code)
+        columns.values.append(raw)
+        columns.qflags.append(ord(q_flag[0]) if q_flag.strip() else 0)
+
+    if skipped:
+        logger.debug("Skipped %d unparseable GHCN %d rows", skipped, year)
+
+    station_ids = sorted(stations)
+    offsets = array("I", [0])
+    for station_id in station_ids:
+        stations[station_id].sort()
+        offsets.append(offsets[-1] + len(stations[station_id].days))
+    n_rows = offsets[-1]
+
+    elements = sorted(element_index, key=element_index.__getitem__)
+    with open(out_path, "wb") as f:
+
+        def section(data: bytes) -> None:
+            f.write(data)
+            f.write(b"\0" * _pad(len(data)))
+
+        f.write(
+            _HEADER.pack(
+                _MAGIC,
+                FORMAT_VERSION,
+                _BYTE_ORDER,
+                year,
+                len(elements),
+                len(station_ids),
+                n_rows,
+            )
+        )
+        f.write(b"\0" * _pad(_HEADER.size))
+        section(b"".join(e.encode().ljust(_ELEMENT_WIDTH, b"\0") for e in elements))
+        section(
+            b"".join(
+                s.encode().ljust(_STATION_ID_WIDTH, b"\0")[:_STATION_ID_WIDTH]
+                for s in station_ids
+            )
+        )
+        section(offsets.tobytes())
+        for column in ("days", "elements", "values", "qflags"):
+            size = 0
+            for station_id in station_ids:
+                data = getattr(stations[station_id], column).tobytes()
+                f.write(data)
+                size += len(data)
+            f.write(b"\0" * _pad(size))
+    return n_rows
+
+
+class ColumnarYear:
+    """Read-only, memory-mapped view of one year's columnar store.
+
+    Safe to share across threads: all state is immutable after open.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Map a store file and index its station table.
+
+        Args:
+            path: Store file written by :func:`build_year_store`.
+
+        Raises:
+            ValueError: If the file is not a store this version can read.
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        magic, version, byte_order, year, n_elements, n_stations, n_rows = (
+            _HEADER.unpack_from(view)
+        )
+        if magic != _MAGIC or version != FORMAT_VERSION or byte_order != _BYTE_ORDER:
+            raise ValueError(f"{path} is not a readable GHCN columnar store")
+        self.year = year
+        self._jan1 = date(year, 1, 1).toordinal()
+
+        pos = _HEADER.size + _pad(_HEADER.size)
+
+        def take(size: int) -> memoryview:
+            nonlocal pos
+            chunk = view[pos : pos + size]
+            pos += size + _pad(size)
+            return chunk
+
+        raw_elements = take(n_elements * _ELEMENT_WIDTH).tobytes()
+        self._elements = [
+            raw_elements[i : i + _ELEMENT_WIDTH].rstrip(b"\0").decode()
+            for i in range(0, len(raw_elements), _ELEMENT_WIDTH)
+        ]
+        raw_ids = take(n_stations * _STATION_ID_WIDTH).tobytes()
+        self._stations = {
+            raw_ids[i : i + _STATION_ID_WIDTH].rstrip(b"\0").decode(): n
+            for n, i in enumerate(range(0, len(raw_ids), _STATION_ID_WIDTH))
+        }
+        self._offsets = take((n_stations + 1) * 4).cast("I")
+        self._days = take(n_rows * 2).cast("H")
+        self._element_codes = take(n_rows)
+        self._values = take(n_rows * 2).cast("h")
+        self._qflags = take(n_rows)
+
+    def read(
+        self, station_id: str, start: date, end: date, elements: Iterable[str]
+    ) -> dict[date, dict[str, tuple[float, str]]]:
+        """Read a station's observations over a span of this year.
+
+        Args:
+            station_id: GHCN station ID.
+            start: First date (inclusive, clipped to this year).
+            end: Last date (inclusive, clipped to this year).
+            elements: Element codes to keep.
+
+        Returns:
+            Date -> element -> (raw value, quality flag); days with no
+            wanted element are absent.
+        """
+        station = self._stations.get(station_id)
+        if station is None:
+            return {}
+        wanted = {
+            code for code, element in enumerate(self._elements) if element in elements
+        }
+        lo, hi = self._offsets[station], self._offsets[station + 1]
+        first = max(start.toordinal() - self._jan1, 0)
+        last = end.toordinal() - self._jan1
+        lo = bisect_left(self._days, first, lo, hi)
+        hi = bisect_right(self._days, last, lo, hi)
+
+        rows: dict[date, dict[str, tuple[float, str]]] = {}
+        for i in range(lo, hi):
+            code = self._element_codes[i]
+            if code not in wanted:
+                continue
+            q_flag = self._qflags[i]
+            day = date.fromordinal(self._jan1 + self._days[i])
+            rows.setdefault(day, {})[self._elements[code]] = (
+                float(self._values[i]),
+                chr(q_flag) if q_flag else "",
+            )
+        return rows
@@ -0,0 +1,184 @@
+"""Local chunked cache of nClimGrid cell time series.
+
+Enabled by default for ``GriddedLookup`` with the default OPeNDAP opener
+(``Config(grid_cache=False)`` turns it off). Every grid cell a lookup
+reads is stored, with all four variables for the whole month, in one
+NetCDF file per month under ``config.grid_cache_dir``. Variables are
+laid out (cell, time) and chunked ``CELLS_PER_CHUNK`` cells by the full
+month, so a point's time series is a single compressed chunk. Later
+lookups of cached cells read the file instead of THREDDS, and work
+offline; cells seen for the first time are fetched and merged in.
+
+Expiry follows ``year_is_immutable``: months of final years never
+expire; recent months (nClimGrid revises its preliminary values) are
+refetched after ``config.cache_max_age_days``. A refetch covers every
+cell the month already stored, so the cache never shrinks.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from get_weather_data.core.cache import year_is_immutable
+from get_weather_data.core.config import get_config
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger("get_weather_data")
+
+# Cells per chunk along the cell dimension (each chunk holds a full month)
+CELLS_PER_CHUNK = 64
+
+_SECONDS_PER_DAY = 86400
+
+
+@dataclass
+class MonthCells:
+    """The cached cells of one month of the grid."""
+
+    lat: "np.ndarray"  # grid latitude axis
+    lon: "np.ndarray"  # grid longitude axis
+    rows: "np.ndarray"  # (cells,) lat index of each cached cell
+    cols: "np.ndarray"  # (cells,) lon index of each cached cell
+    time: "np.ndarray"  # (days,)
+    values: dict[str, "np.ndarray"]  # variable -> (cells, days)
+
+    def _keys(self, rows: "np.ndarray", cols: "np.ndarray") -> "np.ndarray":
+        """Flat grid index of each (row, col)."""
+        return rows.astype("int64") * self.lon.size + cols
+
+    def locate(self, rows: "np.ndarray", cols: "np.ndarray") -> "np.ndarray":
+        """Position of each (row, col) among the cached cells, or -1.
+
+        Args:
+            rows: Lat indices of the wanted cells.
+            cols: Lon indices of the wanted cells.
+
+        Returns:
+            Array of positions into the cell dimension.
+        """
+        import numpy as np
+
+        stored = self._keys(self.rows, self.cols)
+        wanted = self._keys(rows, cols)
+        if stored.size == 0:
+            return np.full(wanted.shape, -1)
+        order = np.argsort(stored)
+        slot = np.clip(np.searchsorted(stored[order], wanted), 0, stored.size - 1)
+        found = stored[order][slot] == wanted
+        return np.where(found, order[slot], -1)
+
+    def merge(self, other: "MonthCells") -> "MonthCells":
+        """These cells followed by another set's (same month and grid).
+
+        Args:
+            other: Newly fetched cells.
+
+        Returns:
+            A new MonthCells holding both.
+        """
+        import numpy as np
+
+        return MonthCells(
+            lat=self.lat,
+            lon=self.lon,
+            rows=np.concatenate([self.rows, other.rows]),
+            cols=np.concatenate([self.cols, other.cols]),
+            time=self.time,
+            values={
+                name: np.concatenate([series, other.values[name]])
+                for name, series in self.values.items()
+            },
+        )
+
+
+class GridCache:
+    """Directory of per-month NetCDF cell stores."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Point the cache at a directory (created on first write).
+
+        Args:
+            path: Directory. Defaults to ``config.grid_cache_dir``.
+        """
+        self.path = get_config().grid_cache_dir if path is None else path
+
+    def _file(self, year: int, month: int) -> Path:
+        return self.path / f"ncdd-{year}{month:02d}-cells.nc"
+
+    def load(
+        self, year: int, month: int, include_expired: bool = False
+    ) -> MonthCells | None:
+        """Read a month's cached cells.
+
+        Args:
+            year: Data year.
+            month: Data month.
+            include_expired: Also return a month past its maximum age.
+
+        Returns:
+            The cells, or None when the month is not cached, has
+            expired (unless ``include_expired``) or cannot be read.
+        """
+        file = self._file(year, month)
+        if not file.exists():
+            return None
+        if not include_expired and not year_is_immutable(year):
+            max_age = get_config().cache_max_age_days * _SECONDS_PER_DAY
+            if file.stat().st_mtime + max_age <= time.time():
+                return None
+        import xarray as xr
+
+        try:
+            with xr.open_dataset(file) as ds:
+                names = [name for name in ds.data_vars if name not in ("row", "col")]
+                return MonthCells(
+                    lat=ds["lat"].to_numpy(),
+                    lon=ds["lon"].to_numpy(),
+                    rows=ds["row"].to_numpy(),
+                    cols=ds["col"].to_numpy(),
+                    time=ds["time"].to_numpy(),
+                    values={name: ds[name].to_numpy() for name in names},
+                )
+        except (OSError, ValueError, KeyError) as exc:
+            logger.debug("Could not read cached grid month %s: %s", file, exc)
+            return None
+
+    def save(self, year: int, month: int, cells: MonthCells) -> None:
+        """Write a month's cells, replacing the stored file.
+
+        Args:
+            year: Data year.
+            month: Data month.
+            cells: Every cell to keep for the month.
+        """
+        import xarray as xr
+
+        data = {
+            name: (("cell", "time"), series) for name, series in cells.values.items()
+        }
+        data["row"] = (("cell",), cells.rows.astype("int32"))
+        data["col"] = (("cell",), cells.cols.astype("int32"))
+        dataset = xr.Dataset(
+            data, coords={"time": cells.time, "lat": cells.lat, "lon": cells.lon}
+        )
+        chunks = (min(CELLS_PER_CHUNK, cells.rows.size), cells.time.size)
+        encoding = {name: {"zlib": True, "chunksizes": chunks} for name in cells.values}
+        file = self._file(year, month)
+        # Write aside and rename, so readers never see a partial file
+        partial = file.with_name(
+            f"{file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            dataset.to_netcdf(partial, encoding=encoding)
+            os.replace(partial, file)
+        except (OSError, ValueError, ImportError) as exc:
+            # A read-only or full cache must not fail the lookup
+            logger.debug("Could not store grid month %s: %s", file, exc)
+            partial.unlink(missing_ok=True)
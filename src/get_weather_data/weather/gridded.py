@@ -5,23 +5,30 @@ and average temperature and precipitation for the contiguous US
 (1951-present), interpolated from GHCN-Daily with thin-plate splines. It
 gives *any* Lower-48 point real NOAA data with no station gaps.
 
-Data is sliced a single grid cell at a time over THREDDS/OPeNDAP, so a
-per-point time series is a tiny transfer (no multi-GB monthly
-downloads). Requires the ``grid`` extra:
+Data is sliced over THREDDS/OPeNDAP: only the grid rows and columns
+holding the query points are read, one request per variable and month
+however many points share it (no multi-GB monthly downloads). Requires
+the ``grid`` extra:
 ``pip install get-weather-data[grid]``.
 
+Cells read with the default opener are kept in a local chunked cache
+(``weather.grid_cache``), so repeat queries are disk-local and work
+offline.
+
 Caveats: contiguous US only (no AK/HI/PR), temperature + precipitation
 only, and a ~2-3 day latency for the most recent days.
 """
 
 import logging
 import math
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
+from get_weather_data.core.config import get_config
 from get_weather_data.stations.zipcodes import zip_centroids
+from get_weather_data.weather.grid_cache import GridCache, MonthCells
 from get_weather_data.weather.location import LocationInput, parse_location
 from get_weather_data.weather.results import (
     StationMeta,
@@ -31,6 +38,7 @@ from get_weather_data.weather.results import (
 from get_weather_data.weather.units import Units, normalize_elements
 
 if TYPE_CHECKING:
+    import numpy as np
     import xarray as xr
 
 logger = logging.getLogger("get_weather_data")
@@ -85,15 +93,72 @@ def _open_opendap(year: int, month: int) -> "xr.Dataset | None":
         return None
 
 
+def _nearest_indices(axis: "np.ndarray", values: "np.ndarray") -> "np.ndarray":
+    """Index of the nearest axis coordinate for each value.
+
+    Matches ``.sel(method="nearest")``: a value halfway between two
+    coordinates takes the larger one. The axis may be ascending or
+    descending.
+    """
+    import numpy as np
+
+    if axis.size == 1:
+        return np.zeros(values.shape, dtype=np.intp)
+    descending = bool(axis[0] > axis[-1])
+    ascending = axis[::-1] if descending else axis
+    right = np.clip(np.searchsorted(ascending, values), 1, ascending.size - 1)
+    left = right - 1
+    take_left = np.abs(values - ascending[left]) < np.abs(ascending[right] - values)
+    index = np.where(take_left, left, right)
+    return ascending.size - 1 - index if descending else index
+
+
+def _slice_cells(
+    ds: "xr.Dataset", rows: "np.ndarray", cols: "np.ndarray", variables: list[str]
+) -> list["np.ndarray"]:
+    """Each variable's (cells, time) series at the given grid indices.
+
+    Reads only the rows and columns holding cells (outer indexing), then
+    picks each cell locally.
+    """
+    import numpy as np
+
+    unique_rows, row_pos = np.unique(rows, return_inverse=True)
+    unique_cols, col_pos = np.unique(cols, return_inverse=True)
+    window = ds[variables].isel(lat=unique_rows, lon=unique_cols)
+    return [
+        window[variable]
+        .transpose("time", "lat", "lon")
+        .to_numpy()[:, row_pos, col_pos]
+        .T
+        for variable in variables
+    ]
+
+
 @dataclass
 class GriddedLookup:
-    """Look up weather for any CONUS point from the nClimGrid grid."""
+    """Look up weather for any CONUS point from the nClimGrid grid.
+
+    With the default opener, cells are read through a ``GridCache``
+    unless ``config.grid_cache`` is off; pass ``cache`` to use one with
+    another opener.
+    """
 
     units: Units = "metric"
     dataset_opener: Callable[[int, int], "xr.Dataset | None"] = _open_opendap
     zip_coordinates_loader: Callable[[], dict[str, tuple[float, float]]] = zip_centroids
+    cache: GridCache | None = None
     _zip_coords: dict[str, tuple[float, float]] | None = field(default=None, repr=False)
 
+    def __post_init__(self) -> None:
+        """Open the local grid cache for the default opener."""
+        if (
+            self.cache is None
+            and self.dataset_opener is _open_opendap
+            and get_config().grid_cache
+        ):
+            self.cache = GridCache()
+
     def get_weather(
         self,
         location: LocationInput,
@@ -136,57 +201,112 @@ class GriddedLookup:
         Raises:
             ValueError: If the location cannot be parsed.
         """  # noqa: DOC502 - raised by parse_location/normalize_elements
-        requested = normalize_elements(elements)
-        grid_elements = [e for e in requested if e in GRID_VARS]
-        parsed = parse_location(location)
+        return self.get_weather_many([location], start_date, end_date, elements)[0]
 
-        zipcode: str | None = None
-        if isinstance(parsed, str):
-            zipcode = parsed
-            coords = self._resolve_zip(zipcode)
-        else:
-            coords = parsed
+    def get_weather_many(
+        self,
+        locations: Sequence[LocationInput],
+        start_date: date,
+        end_date: date,
+        elements: list[str] | None = None,
+    ) -> list[list[WeatherResult]]:
+        """Get gridded weather for many locations over one date range.
 
-        n_days = (end_date - start_date).days + 1
+        Each monthly dataset is opened once for all locations, and every
+        point is mapped to its grid cell in one vectorized step, so a
+        panel of N locations costs one read per variable and month
+        rather than N.
 
-        def _bare(day_offset: int) -> WeatherResult:
-            return WeatherResult(
-                date=start_date + timedelta(days=day_offset),
-                zipcode=zipcode,
-                latitude=coords[0] if coords else None,
-                longitude=coords[1] if coords else None,
-                units=self.units,
-            )
+        Args:
+            locations: ZIP codes, "lat,lon" strings or (lat, lon) tuples.
+            start_date: Start date.
+            end_date: End date.
+            elements: Element codes to retrieve (default: all; only
+                TMAX/TMIN/TAVG/PRCP are available from the grid).
+
+        Returns:
+            One list of daily WeatherResults per location, in input
+            order.
 
-        if coords is None or not grid_elements or not in_conus(*coords):
-            if coords is not None and not in_conus(*coords):
+        Raises:
+            ValueError: If a location cannot be parsed.
+        """  # noqa: DOC502 - raised by parse_location/normalize_elements
+        requested = normalize_elements(elements)
+        grid_elements = [e for e in requested if e in GRID_VARS]
+        # An end before the start is an empty range, not an error
+        n_days = max((end_date - start_date).days + 1, 0)
+        days = [start_date + timedelta(days=i) for i in range(n_days)]
+
+        located: list[tuple[str | None, tuple[float, float] | None]] = []
+        for location in locations:
+            parsed = parse_location(location)
+            if isinstance(parsed, str):
+                located.append((parsed, self._resolve_zip(parsed)))
+            else:
+                located.append((None, parsed))
+
+        # Positions (into located) and coordinates of the points the grid
+        # can answer
+        on_grid: list[int] = []
+        points: list[tuple[float, float]] = []
+        for position, (_zipcode, coords) in enumerate(located):
+            if coords is None:
+                continue
+            if not in_conus(*coords):
                 logger.warning(
                     "Point (%.2f, %.2f) is outside the nClimGrid CONUS domain",
                     *coords,
                 )
-            return [_bare(i) for i in range(n_days)]
+            elif grid_elements:
+                on_grid.append(position)
+                points.append(coords)
 
-        lat, lon = coords
-        by_date = self._read_cell(lat, lon, start_date, end_date, grid_elements)
+        grid = None
+        if points and days:
+            grid = self._read_cells(points, start_date, end_date, grid_elements)
+        row_of = {position: row for row, position in enumerate(on_grid)}
 
         results = []
-        current = start_date
-        while current <= end_date:
-            values = by_date.get(current, {})
-            station = StationMeta(station_type="gridded" if values else None)
-            results.append(
-                assemble_result(
-                    target_date=current,
-                    metric_values=values,
-                    station=station,
-                    units=self.units,
-                    requested=requested,
-                    zipcode=zipcode,
-                    latitude=lat,
-                    longitude=lon,
+        for position, (zipcode, coords) in enumerate(located):
+            row = row_of.get(position)
+            if grid is None or row is None or coords is None:
+                results.append(
+                    [
+                        WeatherResult(
+                            date=day,
+                            zipcode=zipcode,
+                            latitude=coords[0] if coords else None,
+                            longitude=coords[1] if coords else None,
+                            units=self.units,
+                        )
+                        for day in days
+                    ]
                 )
-            )
-            current += timedelta(days=1)
+                continue
+            lat, lon = coords
+            # (elements, days) as nested lists: NaN marks a missing value
+            series = grid[:, row, :].tolist()
+            point_results = []
+            for offset, day in enumerate(days):
+                values = {
+                    element: column[offset]
+                    for element, column in zip(grid_elements, series, strict=True)
+                    if not math.isnan(column[offset])
+                }
+                station = StationMeta(station_type="gridded" if values else None)
+                point_results.append(
+                    assemble_result(
+                        target_date=day,
+                        metric_values=values,
+                        station=station,
+                        units=self.units,
+                        requested=requested,
+                        zipcode=zipcode,
+                        latitude=lat,
+                        longitude=lon,
+                    )
+                )
+            results.append(point_results)
         return results
 
     def _resolve_zip(self, zipcode: str) -> tuple[float, float] | None:
@@ -198,34 +318,105 @@ class GriddedLookup:
             logger.warning("ZIP code %s not found in GeoNames data", zipcode)
         return coords
 
-    def _read_cell(
+    def _read_cells(
         self,
-        lat: float,
-        lon: float,
+        points: list[tuple[float, float]],
         start_date: date,
         end_date: date,
         grid_elements: list[str],
-        method: str = "nearest",
-    ) -> dict[date, dict[str, float]]:
-        """Slice the nearest grid cell across a range, month by month."""
-        by_date: dict[date, dict[str, float]] = {}
+    ) -> "np.ndarray":
+        """Slice the nearest grid cells of many points, month by month.
+
+        Returns:
+            Array of shape (elements, points, days) over the range, NaN
+            where the grid has no value.
+        """
+        import numpy as np
+
         variables = [GRID_VARS[e] for e in grid_elements]
+        n_days = (end_date - start_date).days + 1
+        grid = np.full((len(grid_elements), len(points), n_days), np.nan)
+        lats = np.array([lat for lat, _ in points], dtype=float)
+        lons = np.array([lon for _, lon in points], dtype=float)
+        first = np.datetime64(start_date, "D")
 
         for year, month in _iter_months(start_date, end_date):
-            dataset = self.dataset_opener(year, month)
-            if dataset is None:
+            month_cells = self._month_cells(year, month, lats, lons, variables)
+            if month_cells is None:
                 continue
-            with dataset as ds:
-                point = ds[variables].sel(lat=lat, lon=lon, method=method)
-                # nClimGrid time decodes to datetime64; take the calendar date
-                times = [
-                    ts.astype("datetime64[D]").item() for ts in point["time"].to_numpy()
-                ]
-                for element, variable in zip(grid_elements, variables, strict=True):
-                    series = point[variable].to_numpy()
-                    for day, raw in zip(times, series, strict=True):
-                        if start_date <= day <= end_date:
-                            value = float(raw)
-                            if not math.isnan(value):
-                                by_date.setdefault(day, {})[element] = value
-        return by_date
+            times, series = month_cells
+            # nClimGrid time decodes to datetime64; offset from start
+            offsets = (times.astype("datetime64[D]") - first).astype(int)
+            in_range = (offsets >= 0) & (offsets < n_days)
+            for k, cells in enumerate(series):
+                grid[k][:, offsets[in_range]] = cells[:, in_range]
+        return grid
+
+    def _month_cells(
+        self,
+        year: int,
+        month: int,
+        lats: "np.ndarray",
+        lons: "np.ndarray",
+        variables: list[str],
+    ) -> tuple["np.ndarray", list["np.ndarray"]] | None:
+        """One month's times and (points, time) series per variable.
+
+        Served from the cache when it holds every point's cell; else the
+        dataset is opened, and with a cache, every grid variable of the
+        cells not yet stored is fetched and merged in. An expired or
+        grown month is refetched along with every cell it stored.
+        """
+        import numpy as np
+
+        cached = self.cache.load(year, month) if self.cache is not None else None
+        if cached is not None:
+            found = cached.locate(
+                _nearest_indices(cached.lat, lats), _nearest_indices(cached.lon, lons)
+            )
+            if (found >= 0).all():
+                return cached.time, [cached.values[v][found] for v in variables]
+
+        previous = cached
+        if previous is None and self.cache is not None:
+            previous = self.cache.load(year, month, include_expired=True)
+
+        dataset = self.dataset_opener(year, month)
+        if dataset is None:
+            return None
+        with dataset as ds:
+            lat_axis = ds["lat"].to_numpy()
+            lon_axis = ds["lon"].to_numpy()
+            rows = _nearest_indices(lat_axis, lats)
+            cols = _nearest_indices(lon_axis, lons)
+            times = ds["time"].to_numpy()
+            if self.cache is None:
+                return times, _slice_cells(ds, rows, cols, variables)
+
+            if cached is not None and cached.time.size != times.size:
+                cached = None  # the month has grown; refetch it whole
+            # Flat indices of the distinct cells not stored yet
+            wanted = np.unique(rows.astype("int64") * lon_axis.size + cols)
+            if cached is None and previous is not None:
+                # Rewriting the month: keep the cells it already held
+                stored = previous.rows.astype("int64") * lon_axis.size + previous.cols
+                wanted = np.union1d(wanted, stored)
+            new_rows, new_cols = np.divmod(wanted, lon_axis.size)
+            if cached is not None:
+                new = cached.locate(new_rows, new_cols) < 0
+                new_rows, new_cols = new_rows[new], new_cols[new]
+            names = list(GRID_VARS.values())
+            fetched = MonthCells(
+                lat=lat_axis,
+                lon=lon_axis,
+                rows=new_rows,
+                cols=new_cols,
+                time=times,
+                values=dict(
+                    zip(names, _slice_cells(ds, new_rows, new_cols, names), strict=True)
+                ),
+            )
+        merged = fetched if cached is None else cached.merge(fetched)
+        self.cache.save(year, month, merged)
+        found = merged.locate(rows, cols)
+        return merged.time, [merged.values[v][found] for v in variables]
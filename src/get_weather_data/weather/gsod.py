@@ -1,13 +1,24 @@
 """GSOD (Global Summary of the Day) data fetching for USAF-WBAN stations."""
 
+import contextlib
 import csv
 import logging
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import Iterable, Iterator
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
 from get_weather_data.core.cache import is_fresh, year_is_immutable
 from get_weather_data.core.config import get_config
-from get_weather_data.core.download import download_with_retry
+from get_weather_data.core.download import download_many, download_with_retry
+from get_weather_data.core.singleflight import SingleFlight
 from get_weather_data.weather.units import KNOTS_TO_MS, f_to_c
 from get_weather_data.weather.weather_types import parse_frshtt
 
@@ -31,6 +42,11 @@ GSOD_COLUMNS = [
 ]
 
 
+# Threads missing the same station-year share one download, and one
+# parse of the file
+_fetches = SingleFlight()
+
+
 def _get_gsod_file_path(station_id: str, year: int) -> Path:
     """Get path to cached GSOD file."""
     config = get_config()
@@ -40,17 +56,349 @@ def _get_gsod_file_path(station_id: str, year: int) -> Path:
 def _ensure_gsod_file(station_id: str, year: int) -> Path | None:
     """Download GSOD file if not cached (or stale for a mutable year)."""
     file_path = _get_gsod_file_path(station_id, year)
+    if _is_cached(file_path, year):
+        return file_path
+    return _fetches.do(
+        ("GSOD", station_id, year), lambda: _download_gsod_file(station_id, year)
+    )
 
-    if file_path.exists() and (
-        year_is_immutable(year) or is_fresh(file_path, get_config().cache_max_age_days)
-    ):
+
+def _download_gsod_file(station_id: str, year: int) -> Path | None:
+    file_path = _get_gsod_file_path(station_id, year)
+    if _is_cached(file_path, year):  # fetched just before this flight
         return file_path
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    return download_with_retry(_gsod_url(station_id, year), file_path)
+
+
+def _gsod_url(station_id: str, year: int) -> str:
+    return GSOD_URL.format(year=year, station_id=station_id.replace("-", ""))
+
+
+def _is_cached(file_path: Path, year: int) -> bool:
+    """Whether a cached station-year file can be used as is."""
+    return file_path.exists() and (
+        year_is_immutable(year) or is_fresh(file_path, get_config().cache_max_age_days)
+    )
+
+
+def ensure_gsod_year(station_id: str, year: int) -> bool:
+    """Download a station's GSOD year unless a fresh copy is cached.
+
+    Args:
+        station_id: GSOD station ID (USAF-WBAN).
+        year: Calendar year.
+
+    Returns:
+        True if the file is available, False if it could not be fetched
+        (the station has no file for the year, or the download failed).
+    """
+    return _ensure_gsod_file(station_id, year) is not None
+
+
+def pending_gsod_download(station_id: str, year: int) -> tuple[str, Path] | None:
+    """Where to fetch a station-year from, unless it is already cached.
+
+    For callers that download with their own client (e.g. asyncio).
+
+    Args:
+        station_id: GSOD station ID (USAF-WBAN).
+        year: Calendar year.
 
+    Returns:
+        (url, cache path) when the file is missing or stale (its
+        directory is created), else None.
+    """
+    file_path = _get_gsod_file_path(station_id, year)
+    if _is_cached(file_path, year):
+        return None
     file_path.parent.mkdir(parents=True, exist_ok=True)
+    return _gsod_url(station_id, year), file_path
+
+
+def ensure_gsod_files(
+    station_years: Iterable[tuple[str, int]],
+) -> dict[tuple[str, int], Path | None]:
+    """Make many GSOD station-years available, downloading concurrently.
+
+    Args:
+        station_years: (station_id, year) pairs.
+
+    Returns:
+        Each distinct pair mapped to its cached file, or None if it could
+        not be downloaded.
+    """
+    files: dict[tuple[str, int], Path | None] = {}
+    missing: list[tuple[str, int]] = []
+    for station_id, year in station_years:
+        if (station_id, year) in files:
+            continue
+        file_path = files[(station_id, year)] = _get_gsod_file_path(station_id, year)
+        if not _is_cached(file_path, year):
+            missing.append((station_id, year))
+    if not missing:
+        return files
+    # Each download joins the station-year's flight, as in ensure_isd_files
+    fetched = download_many(missing, fetch=lambda key: _ensure_gsod_file(*key))
+    for key, path in zip(missing, fetched, strict=True):
+        files[key] = path
+    return files
+
+
+_MISSING = ("9999.9", "999.9", "99.99")
+_TEMP_FIELDS = frozenset({"temp", "max_temp", "min_temp", "dewpoint"})
+_WIND_FIELDS = frozenset({"wind_speed", "max_wind_speed", "gust"})
+_N_COLUMNS = len(GSOD_COLUMNS)
+_NAN = float("nan")
+
+# Parsed station-years kept open (each maps its ``.days`` file, which
+# holds a file descriptor). The mapped pages live in the page cache, so
+# a year dropped from here is cheap to map again.
+GSOD_YEAR_CACHE_SIZE = 256
+
+# Parsed station-years are saved next to their CSV as ``.days`` files
+# and memory-mapped, so every process on a host shares one copy.
+_DAYS_MAGIC = b"GSODDAY"
+_DAYS_VERSION = 1
+# magic, format version, byte order (0 = little, 1 = big), year, source
+# CSV mtime (ns) and size
+_DAYS_HEADER = struct.Struct("<7sBBxIqq")
+_FRSHTT_WIDTH = 6
+_ALIGN = 8
+_BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+
+
+def _pad(size: int) -> int:
+    """Bytes of padding that align a section end to _ALIGN."""
+    return -size % _ALIGN
+
+
+class _GsodYear:
+    """One station-year of GSOD, parsed once and indexed by day of year.
+
+    Values are kept in source units (°F, knots, inches) in one flat
+    float array, NaN for missing; unit conversion happens on read so
+    both ``convert_units`` modes share the same parse. FRSHTT codes sit
+    alongside (fixed width), so values and weather types never rescan
+    the file. The columns are either freshly parsed arrays or views of
+    a mapped ``.days`` file (see :meth:`save` and :meth:`map`).
+    """
+
+    __slots__ = ("_frshtt", "_jan1", "_mmap", "_present", "_values", "year")
+
+    def __init__(
+        self,
+        year: int,
+        values: "array[float] | memoryview",
+        present: bytearray | memoryview,
+        frshtt: bytearray | memoryview,
+        mapped: mmap.mmap | None = None,
+    ) -> None:
+        self.year = year
+        self._jan1 = date(year, 1, 1).toordinal()
+        self._values = values
+        self._present = present
+        self._frshtt = frshtt
+        self._mmap = mapped
+
+    @classmethod
+    def parse(cls, year: int, file_path: Path) -> "_GsodYear":
+        """Parse a station-year CSV."""
+        jan1 = date(year, 1, 1).toordinal()
+        n_days = date(year, 12, 31).toordinal() - jan1 + 1
+        present = bytearray(n_days)
+        values = array("d", [_NAN]) * (n_days * _N_COLUMNS)
+        frshtt = bytearray(n_days * _FRSHTT_WIDTH)
 
-    url = GSOD_URL.format(year=year, station_id=station_id.replace("-", ""))
-    result = download_with_retry(url, file_path)
-    return result
+        with open(file_path, encoding="utf-8", errors="replace") as f:
+            for row in csv.DictReader(f):
+                try:
+                    index = date.fromisoformat(row.get("DATE") or "").toordinal()
+                except ValueError:
+                    continue
+                index -= jan1
+                if not 0 <= index < n_days:
+                    continue
+                present[index] = 1
+                code = (row.get("FRSHTT") or "").strip().encode("ascii", "replace")
+                code = code[:_FRSHTT_WIDTH].ljust(_FRSHTT_WIDTH, b"\0")
+                frshtt[index * _FRSHTT_WIDTH : (index + 1) * _FRSHTT_WIDTH] = code
+                base = index * _N_COLUMNS
+                for offset, (gsod_name, _field) in enumerate(GSOD_COLUMNS):
+                    raw = (row.get(gsod_name) or "").strip()
+                    if raw and raw not in _MISSING:
+                        with contextlib.suppress(ValueError):
+                            values[base + offset] = float(raw)
+        return cls(year, values, present, frshtt)
+
+    def save(self, path: Path, source: tuple[int, int]) -> bool:
+        """Write the parsed columns to a memory-mappable file.
+
+        Written aside and renamed, so a reader never maps a partial
+        file. A read-only or full cache is not an error.
+
+        Args:
+            path: Destination ``.days`` file.
+            source: (mtime_ns, size) of the CSV it was parsed from.
+
+        Returns:
+            True if the file was written.
+        """
+        header = _DAYS_HEADER.pack(
+            _DAYS_MAGIC, _DAYS_VERSION, _BYTE_ORDER, self.year, *source
+        )
+        sections = [header, bytes(self._values), self._present, self._frshtt]
+        partial = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(partial, "wb") as f:
+                for section in sections:
+                    f.write(section)
+                    f.write(b"\0" * _pad(len(section)))
+            os.replace(partial, path)
+        except OSError as exc:
+            logger.debug("Could not save parsed GSOD year %s: %s", path, exc)
+            partial.unlink(missing_ok=True)
+            return False
+        return True
+
+    @classmethod
+    def map(cls, path: Path, year: int, source: tuple[int, int]) -> "_GsodYear | None":
+        """Map a ``.days`` file if it was parsed from the current CSV.
+
+        Args:
+            path: ``.days`` file written by :meth:`save`.
+            year: Data year.
+            source: (mtime_ns, size) of the current CSV.
+
+        Returns:
+            The mapped year, or None when the file is missing, stale or
+            unreadable.
+        """
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        n_days = date(year, 12, 31).toordinal() - date(year, 1, 1).toordinal() + 1
+        sizes = [
+            _DAYS_HEADER.size,
+            n_days * _N_COLUMNS * 8,
+            n_days,
+            n_days * _FRSHTT_WIDTH,
+        ]
+        if len(mapped) != sum(size + _pad(size) for size in sizes):
+            mapped.close()
+            return None
+        magic, version, byte_order, stored_year, *stored_source = (
+            _DAYS_HEADER.unpack_from(mapped)
+        )
+        if (
+            magic != _DAYS_MAGIC
+            or version != _DAYS_VERSION
+            or byte_order != _BYTE_ORDER
+            or stored_year != year
+            or tuple(stored_source) != source
+        ):
+            mapped.close()
+            return None
+        view = memoryview(mapped)
+        sections = []
+        pos = 0
+        for size in sizes:
+            sections.append(view[pos : pos + size])
+            pos += size + _pad(size)
+        _header, values, present, frshtt = sections
+        return cls(year, values.cast("d"), present, frshtt, mapped)
+
+    def _index(self, day: date) -> int | None:
+        index = day.toordinal() - self._jan1
+        if 0 <= index < len(self._present) and self._present[index]:
+            return index
+        return None
+
+    def days(self, start: date, end: date) -> Iterator[date]:
+        """Dates within a span that have a GSOD row."""
+        first = max(start.toordinal() - self._jan1, 0)
+        last = min(end.toordinal() - self._jan1, len(self._present) - 1)
+        for index in range(first, last + 1):
+            if self._present[index]:
+                yield date.fromordinal(self._jan1 + index)
+
+    def values(self, day: date, convert_units: bool) -> dict[str, float | None]:
+        """Field values for a day (all None when the day has no row)."""
+        values: dict[str, float | None] = {col[1]: None for col in GSOD_COLUMNS}
+        index = self._index(day)
+        if index is None:
+            return values
+        base = index * _N_COLUMNS
+        for offset, (_gsod_name, field_name) in enumerate(GSOD_COLUMNS):
+            value = self._values[base + offset]
+            if math.isnan(value):
+                continue
+            if convert_units:
+                if field_name in _TEMP_FIELDS:
+                    value = f_to_c(value)
+                elif field_name in _WIND_FIELDS:
+                    value = value * KNOTS_TO_MS
+            values[field_name] = value
+        return values
+
+    def frshtt(self, day: date) -> str:
+        """The day's FRSHTT indicator ("" when the day has no row)."""
+        index = self._index(day)
+        if index is None:
+            return ""
+        code = self._frshtt[index * _FRSHTT_WIDTH : (index + 1) * _FRSHTT_WIDTH]
+        return sys.intern(bytes(code).rstrip(b"\0").decode("ascii", "replace"))
+
+
+def _days_path(file_path: Path) -> Path:
+    """The ``.days`` file holding a station-year CSV's parsed columns."""
+    return file_path.with_suffix(".days")
+
+
+@lru_cache(maxsize=GSOD_YEAR_CACHE_SIZE)
+def _parse_year(file_path: Path, year: int, mtime_ns: int, size: int) -> _GsodYear:
+    """Map a station-year's parsed columns, parsing the CSV if needed.
+
+    Keyed by the CSV's mtime and size, so a refresh re-parses. The parse
+    is saved as a ``.days`` file and mapped, so other processes map it
+    instead of parsing again; without a writable cache the parsed copy
+    is used directly.
+    """
+    days_path = _days_path(file_path)
+    source = (mtime_ns, size)
+    mapped = _GsodYear.map(days_path, year, source)
+    if mapped is not None:
+        return mapped
+    parsed = _GsodYear.parse(year, file_path)
+    if parsed.save(days_path, source):
+        mapped = _GsodYear.map(days_path, year, source)
+    return parsed if mapped is None else mapped
+
+
+def clear_gsod_year_cache() -> None:
+    """Drop every parsed GSOD station-year held in memory."""
+    _parse_year.cache_clear()
+
+
+def gsod_year_cache_info() -> tuple:
+    """Hit/miss statistics of the parsed station-year cache."""
+    return _parse_year.cache_info()
+
+
+def _gsod_year(station_id: str, year: int) -> _GsodYear | None:
+    """Get the parsed GSOD station-year, downloading the file if needed."""
+    file_path = _ensure_gsod_file(station_id, year)
+    if file_path is None:
+        return None
+    info = file_path.stat()
+    return _fetches.do(
+        ("GSOD-parse", file_path, info.st_mtime_ns, info.st_size),
+        lambda: _parse_year(file_path, year, info.st_mtime_ns, info.st_size),
+    )
 
 
 def get_gsod_data(
@@ -68,44 +416,38 @@ def get_gsod_data(
     Returns:
         Dict mapping field names to values.
     """
-    year = target_date.year
-    file_path = _ensure_gsod_file(station_id, year)
-
-    if file_path is None:
+    year_data = _gsod_year(station_id, target_date.year)
+    if year_data is None:
         return {col[1]: None for col in GSOD_COLUMNS}
+    return year_data.values(target_date, convert_units)
+
 
-    date_str = target_date.strftime("%Y-%m-%d")
-    values: dict[str, float | None] = {col[1]: None for col in GSOD_COLUMNS}
-
-    with open(file_path, encoding="utf-8", errors="replace") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get("DATE") == date_str:
-                for gsod_name, field_name in GSOD_COLUMNS:
-                    raw = row.get(gsod_name, "").strip()
-                    if raw and raw not in ("9999.9", "999.9", "99.99"):
-                        try:
-                            value = float(raw)
-                            if convert_units:
-                                if field_name in (
-                                    "temp",
-                                    "max_temp",
-                                    "min_temp",
-                                    "dewpoint",
-                                ):
-                                    value = f_to_c(value)
-                                elif field_name in (
-                                    "wind_speed",
-                                    "max_wind_speed",
-                                    "gust",
-                                ):
-                                    value = value * KNOTS_TO_MS
-                            values[field_name] = value
-                        except ValueError:
-                            pass
-                break
-
-    return values
+def get_gsod_data_range(
+    station_id: str,
+    start: date,
+    end: date,
+    convert_units: bool = True,
+) -> dict[date, dict[str, float | None]]:
+    """Get a station's GSOD series over a date span in one pass.
+
+    Args:
+        station_id: USAF-WBAN station ID (e.g., "722950-23174").
+        start: First date (inclusive).
+        end: Last date (inclusive).
+        convert_units: If True, convert temperature to Celsius and wind to m/s.
+
+    Returns:
+        Date -> the same dict ``get_gsod_data`` returns for that day.
+        Days with no GSOD row are absent.
+    """
+    series: dict[date, dict[str, float | None]] = {}
+    for year in range(start.year, end.year + 1):
+        year_data = _gsod_year(station_id, year)
+        if year_data is None:
+            continue
+        for day in year_data.days(start, end):
+            series[day] = year_data.values(day, convert_units)
+    return series
 
 
 def get_gsod_weather_types(station_id: str, target_date: date) -> set[str]:
@@ -118,14 +460,31 @@ def get_gsod_weather_types(station_id: str, target_date: date) -> set[str]:
     Returns:
         Set of phenomenon names parsed from the day's FRSHTT indicator.
     """
-    year = target_date.year
-    file_path = _ensure_gsod_file(station_id, year)
-    if file_path is None:
+    year_data = _gsod_year(station_id, target_date.year)
+    if year_data is None:
         return set()
+    return parse_frshtt(year_data.frshtt(target_date))
+
+
+def get_gsod_weather_types_range(
+    station_id: str, start: date, end: date
+) -> dict[date, set[str]]:
+    """Get a station's present-weather phenomena over a date span.
 
-    date_str = target_date.strftime("%Y-%m-%d")
-    with open(file_path, encoding="utf-8", errors="replace") as f:
-        for row in csv.DictReader(f):
-            if row.get("DATE") == date_str:
-                return parse_frshtt(row.get("FRSHTT", "").strip())
-    return set()
+    Args:
+        station_id: USAF-WBAN station ID.
+        start: First date (inclusive).
+        end: Last date (inclusive).
+
+    Returns:
+        Date -> set of phenomenon names from that day's FRSHTT
+        indicator, for days with a GSOD row.
+    """
+    series: dict[date, set[str]] = {}
+    for year in range(start.year, end.year + 1):
+        year_data = _gsod_year(station_id, year)
+        if year_data is None:
+            continue
+        for day in year_data.days(start, end):
+            series[day] = parse_frshtt(year_data.frshtt(day))
+    return series
@@ -11,8 +11,7 @@ from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 
 from get_weather_data.core.database import Database
-from get_weather_data.core.distance import find_closest
-from get_weather_data.weather.isd import get_isd_hourly
+from get_weather_data.weather.isd import ensure_isd_files, get_isd_hourly
 from get_weather_data.weather.location import LocationInput, parse_location
 from get_weather_data.weather.results import HourlyResult
 from get_weather_data.weather.units import (
@@ -81,8 +80,12 @@ class HourlyLookup:
         lat, lon = coords
 
         dates = _date_range(start_date, end_date)
+        years = range(start_date.year, end_date.year + 1)
         for station in self._nearest_stations(lat, lon):
             station_id, station_name, distance = station
+            if len(years) > 1:
+                # Fetch the station's years together rather than one by one
+                ensure_isd_files((station_id, year) for year in years)
             records: list[dict[str, float | int | datetime | None]] = []
             for day in dates:
                 records.extend(get_isd_hourly(station_id, day))
@@ -116,8 +119,8 @@ class HourlyLookup:
 
     def _nearest_stations(self, lat: float, lon: float) -> list[tuple[str, str, int]]:
         """Nearest USAF-WBAN stations as (id, name, distance_meters)."""
-        stations = self.db.get_stations(station_type="USAF-WBAN")
-        closest = find_closest(lat, lon, stations, n=self.max_stations)
+        index = self.db.get_station_index("USAF-WBAN")
+        closest = index.find_closest(lat, lon, n=self.max_stations)
         return [(sd.station.id, sd.station.name, sd.distance_meters) for sd in closest]
 
     def _build(
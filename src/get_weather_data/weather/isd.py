@@ -10,12 +10,14 @@ missing value.
 
 import gzip
 import logging
+from collections.abc import Iterable
 from datetime import UTC, date, datetime
 from pathlib import Path
 
 from get_weather_data.core.cache import is_fresh, year_is_immutable
 from get_weather_data.core.config import get_config
-from get_weather_data.core.download import download_with_retry
+from get_weather_data.core.download import download_many, download_with_retry
+from get_weather_data.core.singleflight import SingleFlight
 
 logger = logging.getLogger("get_weather_data")
 
@@ -39,6 +41,10 @@ _FIELDS: list[tuple[int, str, float]] = [
 _INT_FIELDS = frozenset({"wind_direction", "sky_condition"})
 
 
+# Threads missing the same station-year share one download
+_downloads = SingleFlight()
+
+
 def _get_isd_file_path(station_id: str, year: int) -> Path:
     """Path to the cached ISD-Lite file for a station-year."""
     config = get_config()
@@ -56,17 +62,60 @@ def _ensure_isd_file(station_id: str, year: int) -> Path | None:
         Path to the cached file, or None if it could not be downloaded.
     """
     file_path = _get_isd_file_path(station_id, year)
-
-    if file_path.exists() and (
-        year_is_immutable(year) or is_fresh(file_path, get_config().cache_max_age_days)
-    ):
+    if _is_cached(file_path, year):
         return file_path
 
+    return _downloads.do(
+        ("ISD", station_id, year), lambda: _download_isd_file(station_id, year)
+    )
+
+
+def _download_isd_file(station_id: str, year: int) -> Path | None:
+    file_path = _get_isd_file_path(station_id, year)
+    if _is_cached(file_path, year):  # fetched just before this flight
+        return file_path
     file_path.parent.mkdir(parents=True, exist_ok=True)
     url = ISD_LITE_URL.format(year=year, station_id=station_id)
     return download_with_retry(url, file_path)
 
 
+def _is_cached(file_path: Path, year: int) -> bool:
+    """Whether a cached station-year file can be used as is."""
+    return file_path.exists() and (
+        year_is_immutable(year) or is_fresh(file_path, get_config().cache_max_age_days)
+    )
+
+
+def ensure_isd_files(
+    station_years: Iterable[tuple[str, int]],
+) -> dict[tuple[str, int], Path | None]:
+    """Make many ISD-Lite station-years available, downloading concurrently.
+
+    Args:
+        station_years: (station_id, year) pairs.
+
+    Returns:
+        Each distinct pair mapped to its cached file, or None if it could
+        not be downloaded.
+    """
+    files: dict[tuple[str, int], Path | None] = {}
+    missing: list[tuple[str, int]] = []
+    for station_id, year in station_years:
+        if (station_id, year) in files:
+            continue
+        file_path = files[(station_id, year)] = _get_isd_file_path(station_id, year)
+        if not _is_cached(file_path, year):
+            missing.append((station_id, year))
+    if not missing:
+        return files
+    # Each download joins the station-year's flight, so a concurrent
+    # caller missing the same file waits for it instead of fetching twice
+    fetched = download_many(missing, fetch=lambda key: _ensure_isd_file(*key))
+    for key, path in zip(missing, fetched, strict=True):
+        files[key] = path
+    return files
+
+
 def _parse_line(
     line: str, target_date: date
 ) -> dict[str, float | int | datetime | None] | None:
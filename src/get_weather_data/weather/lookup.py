@@ -1,20 +1,34 @@
 """Weather data lookup backed by the local station database."""
 
 import logging
+import threading
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass, field
 from datetime import date, timedelta
-from functools import lru_cache
+from typing import TypeVar
 
+from get_weather_data.core.config import DEFAULT_VALUE_CACHE_BYTES, get_config
 from get_weather_data.core.database import INDEX_VERSION, Database
-from get_weather_data.core.distance import find_closest
+from get_weather_data.core.value_cache import ValueCache
 from get_weather_data.weather.ghcn import (
     get_ghcn_data,
+    get_ghcn_data_range,
     get_ghcn_flags,
+    get_ghcn_flags_range,
     get_ghcn_weather_types,
+    get_ghcn_weather_types_range,
+)
+from get_weather_data.weather.gsod import (
+    clear_gsod_year_cache,
+    get_gsod_data,
+    get_gsod_data_range,
+    get_gsod_weather_types,
+    get_gsod_weather_types_range,
+    gsod_year_cache_info,
 )
-from get_weather_data.weather.gsod import get_gsod_data, get_gsod_weather_types
 from get_weather_data.weather.interpolate import Sample, idw
 from get_weather_data.weather.location import LocationInput, parse_location
+from get_weather_data.weather.result_cache import ResultCache, result_key
 from get_weather_data.weather.results import (
     StationMeta,
     WeatherResult,
@@ -49,21 +63,54 @@ _GSOD_TO_METRIC = {
     "visibility": ("VIS", MI_TO_KM),
 }
 
+# (station_id, year): the unit range reads fetch and batches group by.
+_StationYear = tuple[str, int]
+# A station-year series memoized by _StationSeries
+_T = TypeVar("_T")
+# A resolved location: (zipcode, coordinates, closest stations).
+_Resolution = tuple[str | None, tuple[float, float] | None, list[tuple[str, int]]]
+
+
+# Process-wide station-day value caches, one partition per source, sized
+# from config (value_cache_bytes / value_cache_policy) on first use.
+VALUE_CACHE_SOURCES = tuple(DEFAULT_VALUE_CACHE_BYTES)
+_value_caches: dict[str, ValueCache] = {}
+_value_caches_lock = threading.Lock()
+
+
+def _value_cache(source: str) -> ValueCache:
+    """The value cache partition for one source."""
+    cache = _value_caches.get(source)
+    if cache is None:
+        with _value_caches_lock:
+            cache = _value_caches.get(source)
+            if cache is None:
+                config = get_config()
+                cache = _value_caches[source] = ValueCache(
+                    config.value_cache_bytes[source],
+                    config.value_cache_policy,
+                )
+    return cache
+
+
+def clear_value_caches() -> None:
+    """Drop the value caches; they are re-created from the current config."""
+    with _value_caches_lock:
+        _value_caches.clear()
 
-@lru_cache(maxsize=65536)
-def _cached_ghcn_data(
-    station_id: str, year: int, month: int, day: int
-) -> dict[str, float | None]:
+
+def _cached_ghcn_data(station_id: str, target_date: date) -> dict[str, float | None]:
     """Cached GHCN data lookup (all elements)."""
-    return get_ghcn_data(station_id, date(year, month, day))
+    return _value_cache("ghcn").get_or_load(
+        (station_id, target_date), lambda: get_ghcn_data(station_id, target_date)
+    )
 
 
-@lru_cache(maxsize=65536)
-def _cached_gsod_data(
-    station_id: str, year: int, month: int, day: int
-) -> dict[str, float | None]:
+def _cached_gsod_data(station_id: str, target_date: date) -> dict[str, float | None]:
     """Cached GSOD data lookup."""
-    return get_gsod_data(station_id, date(year, month, day))
+    return _value_cache("gsod").get_or_load(
+        (station_id, target_date), lambda: get_gsod_data(station_id, target_date)
+    )
 
 
 def _ghcn_metric(raw: dict[str, float | None]) -> dict[str, float]:
@@ -105,11 +152,16 @@ class WeatherLookup:
     interpolate: bool = False
     idw_power: float = 2.0
     interpolate_stations: int = 5
+    # Persistent result store; opened from config when result_cache is set
+    result_cache: ResultCache | None = None
 
     def __post_init__(self) -> None:
-        """Preload caches and check the index version."""
+        """Preload caches (unless the database is lazy); check the index version."""
+        if self.result_cache is None and get_config().result_cache:
+            self.result_cache = ResultCache()
         if self.db.exists():
-            self.db.preload_caches()
+            if self.db.preload:
+                self.db.preload_caches()
             stored = self.db.get_meta("index_version")
             if stored != str(INDEX_VERSION):
                 logger.warning(
@@ -142,30 +194,137 @@ class WeatherLookup:
             ValueError: If the location cannot be parsed.
         """  # noqa: DOC502 - raised by parse_location/normalize_elements
         requested = normalize_elements(elements)
-        parsed = parse_location(location)
+        zipcode, coords, closest = self._resolve(location)
+        if coords is None:
+            return self._unknown_zip_result(zipcode, target_date, requested)
+        return self._weather_for_day(target_date, requested, zipcode, coords, closest)
+
+    def _resolve(self, location: LocationInput) -> _Resolution:
+        """Resolve a location to (zipcode, coordinates, closest stations).
 
-        zipcode: str | None = None
+        Coordinates are None (and the station list empty) for a ZIP code
+        that is not in the database.
+        """
+        parsed = parse_location(location)
         if isinstance(parsed, str):
-            zipcode = parsed
-            coords = self.db.get_zipcode(zipcode)
+            coords = self.db.get_zipcode(parsed)
             if coords is None:
-                logger.warning(f"ZIP code {zipcode} not found in database")
-                result = WeatherResult(
-                    date=target_date, zipcode=zipcode, units=self.units
-                )
-                if self.explain:
-                    reason = f"ZIP code {zipcode} is not in the station database"
-                    result.stations_considered = 0
-                    result.missing = {ELEMENTS[e].field: reason for e in requested}
-                return result
-            lat, lon = coords
-            closest = self._closest_stations_for_zip(zipcode, lat, lon)
-        else:
-            lat, lon = parsed
-            closest = self._closest_stations_for_coords(lat, lon)
+                logger.warning(f"ZIP code {parsed} not found in database")
+                return parsed, None, []
+            return parsed, coords, self._closest_stations_for_zip(parsed, *coords)
+        return None, parsed, self._closest_stations_for_coords(*parsed)
+
+    def _resolve_many(
+        self,
+        locations: Iterable[LocationInput],
+        resolved: dict[LocationInput, _Resolution | ValueError],
+    ) -> None:
+        """Resolve distinct locations into ``resolved`` (errors included).
+
+        Coordinate locations are matched to stations with one vectorized
+        query per station type rather than a search per point.
+        """
+        points: list[tuple[LocationInput, tuple[float, float]]] = []
+        for location in locations:
+            try:
+                parsed = parse_location(location)
+            except ValueError as exc:
+                resolved[location] = exc
+                continue
+            if isinstance(parsed, str):
+                resolved[location] = self._resolve(parsed)
+            else:
+                points.append((location, parsed))
+        if not points:
+            return
+        closest = self._closest_stations_for_coords_many([p for _, p in points])
+        for (location, coords), stations in zip(points, closest, strict=True):
+            resolved[location] = (None, coords, stations)
+
+    def _unknown_zip_result(
+        self, zipcode: str | None, target_date: date, requested: list[str]
+    ) -> WeatherResult:
+        """Empty result for a ZIP code missing from the database."""
+        result = WeatherResult(date=target_date, zipcode=zipcode, units=self.units)
+        if self.explain:
+            reason = f"ZIP code {zipcode} is not in the station database"
+            result.stations_considered = 0
+            result.missing = {ELEMENTS[e].field: reason for e in requested}
+        return result
+
+    def _weather_for_day(
+        self,
+        target_date: date,
+        requested: list[str],
+        zipcode: str | None,
+        coords: tuple[float, float],
+        closest: list[tuple[str, int]],
+        series: "_StationSeries | None" = None,
+    ) -> WeatherResult:
+        """Walk the closest stations for one day and assemble the result.
+
+        With a ``result_cache``, a result stored for the same resolved
+        stations, date, elements and settings is returned without
+        reading any station data.
 
+        Args:
+            target_date: Date to get weather for.
+            requested: Element codes to fill.
+            zipcode: The queried ZIP code, if any.
+            coords: Query point (lat, lon).
+            closest: (station_id, distance) pairs, nearest first.
+            series: Range-prefetched station observations; when None,
+                each station-day is read with a point lookup.
+
+        Returns:
+            WeatherResult for the day in the configured units.
+        """
+        if self.result_cache is None:
+            return self._compute_day(
+                target_date, requested, zipcode, coords, closest, series
+            )
+        key = result_key(
+            zipcode,
+            coords,
+            closest,
+            target_date.isoformat(),
+            requested,
+            self.units,
+            self.max_stations,
+            self.max_distance_meters,
+            self.use_ghcn,
+            self.use_gsod,
+            self.include_flags,
+            self.include_weather_types,
+            self.explain,
+            self.interpolate,
+            self.idw_power,
+            self.interpolate_stations,
+        )
+        result = self.result_cache.get(key)
+        if result is None:
+            result = self._compute_day(
+                target_date, requested, zipcode, coords, closest, series
+            )
+            complete = all(
+                getattr(result, ELEMENTS[e].field) is not None for e in requested
+            )
+            self.result_cache.put(key, result, complete)
+        return result
+
+    def _compute_day(
+        self,
+        target_date: date,
+        requested: list[str],
+        zipcode: str | None,
+        coords: tuple[float, float],
+        closest: list[tuple[str, int]],
+        series: "_StationSeries | None",
+    ) -> WeatherResult:
+        """Uncached body of ``_weather_for_day``."""
+        lat, lon = coords
         if self.interpolate:
-            values, station = self._interpolate(closest, requested, target_date)
+            values, station = self._interpolate(closest, requested, target_date, series)
             return assemble_result(
                 target_date=target_date,
                 metric_values=values,
@@ -200,11 +359,19 @@ class WeatherLookup:
             last_distance = distance
 
             if self.include_weather_types:
-                weather_types |= self._station_weather_types(
-                    station_id, station_type, target_date
+                weather_types |= (
+                    series.weather_types(station_id, station_type, target_date)
+                    if series is not None
+                    else self._station_weather_types(
+                        station_id, station_type, target_date
+                    )
                 )
 
-            metric = self._station_values(station_id, station_type, target_date)
+            metric = (
+                series.values(station_id, station_type, target_date)
+                if series is not None
+                else self._station_values(station_id, station_type, target_date)
+            )
             new_elements = {
                 element: value
                 for element, value in metric.items()
@@ -215,7 +382,11 @@ class WeatherLookup:
 
             values.update(new_elements)
             if self.include_flags and station_type == "GHCND":
-                station_flags = self._station_flags(station_id, target_date)
+                station_flags = (
+                    series.flags(station_id, target_date)
+                    if series is not None
+                    else self._station_flags(station_id, target_date)
+                )
                 flags.update({e: station_flags.get(e, "") for e in new_elements})
             if station.station_id is None:
                 station = StationMeta(
@@ -317,6 +488,7 @@ class WeatherLookup:
         closest: list[tuple[str, int]],
         requested: list[str],
         target_date: date,
+        series: "_StationSeries | None" = None,
     ) -> tuple[dict[str, float], StationMeta]:
         """Inverse-distance-weight each element across nearby stations.
 
@@ -324,6 +496,7 @@ class WeatherLookup:
             closest: (station_id, distance) pairs, nearest first.
             requested: Element codes to estimate.
             target_date: Date to fetch.
+            series: Range-prefetched station observations, if any.
 
         Returns:
             (metric values keyed by element, station metadata marking the
@@ -343,7 +516,11 @@ class WeatherLookup:
             if not station_info:
                 continue
             _name, station_type = station_info
-            metric = self._station_values(station_id, station_type, target_date)
+            metric = (
+                series.values(station_id, station_type, target_date)
+                if series is not None
+                else self._station_values(station_id, station_type, target_date)
+            )
             contributed = False
             for element, value in metric.items():
                 if element in samples:
@@ -380,42 +557,47 @@ class WeatherLookup:
         self, lat: float, lon: float
     ) -> list[tuple[str, int]]:
         """Closest stations to a coordinate, via in-memory spatial search."""
-        ghcn_stations = self.db.get_stations(station_type="GHCND")
-        usaf_stations = self.db.get_stations(station_type="USAF-WBAN")
+        ghcn_index = self.db.get_station_index("GHCND")
+        usaf_index = self.db.get_station_index("USAF-WBAN")
         pairs = [
             (sd.station.id, sd.distance_meters)
-            for sd in find_closest(lat, lon, ghcn_stations, n=5)
+            for sd in ghcn_index.find_closest(lat, lon, n=5)
         ]
         pairs.extend(
             (sd.station.id, sd.distance_meters)
-            for sd in find_closest(lat, lon, usaf_stations, n=3)
+            for sd in usaf_index.find_closest(lat, lon, n=3)
         )
         pairs.sort(key=lambda pair: pair[1])
         return pairs
 
+    def _closest_stations_for_coords_many(
+        self, points: list[tuple[float, float]]
+    ) -> list[list[tuple[str, int]]]:
+        """``_closest_stations_for_coords`` for many points at once."""
+        merged: list[list[tuple[str, int]]] = [[] for _ in points]
+        for station_type, n in (("GHCND", 5), ("USAF-WBAN", 3)):
+            index = self.db.get_station_index(station_type)
+            for pairs, closest in zip(
+                merged, index.closest_pairs(points, n), strict=True
+            ):
+                pairs.extend(closest)
+        for pairs in merged:
+            pairs.sort(key=lambda pair: pair[1])
+        return merged
+
     def _station_values(
         self, station_id: str, station_type: str, target_date: date
     ) -> dict[str, float]:
         """Fetch one station's observations for a date, in metric units."""
         if station_type == "GHCND" and self.use_ghcn:
             if self.use_cache:
-                raw = _cached_ghcn_data(
-                    station_id,
-                    target_date.year,
-                    target_date.month,
-                    target_date.day,
-                )
+                raw = _cached_ghcn_data(station_id, target_date)
             else:
                 raw = get_ghcn_data(station_id, target_date)
             return _ghcn_metric(raw)
         if station_type == "USAF-WBAN" and self.use_gsod:
             if self.use_cache:
-                raw = _cached_gsod_data(
-                    station_id,
-                    target_date.year,
-                    target_date.month,
-                    target_date.day,
-                )
+                raw = _cached_gsod_data(station_id, target_date)
             else:
                 raw = get_gsod_data(station_id, target_date)
             return _gsod_metric(raw)
@@ -444,6 +626,11 @@ class WeatherLookup:
     ) -> list[WeatherResult]:
         """Get weather data for a location over a date range.
 
+        Resolves the location once, then reads each station the
+        day-walk reaches for the whole range in one pass (one query per
+        station-year) instead of one point lookup per station-day. Day
+        by day, the station fallback is the same as ``get_weather``.
+
         Args:
             location: 5-digit US ZIP code, "lat,lon" string, or
                 (lat, lon) tuple.
@@ -453,22 +640,272 @@ class WeatherLookup:
 
         Returns:
             List of WeatherResult objects, one per day.
+
+        Raises:
+            ValueError: If the location cannot be parsed.
+        """  # noqa: DOC502 - raised by parse_location/normalize_elements
+        requested = normalize_elements(elements)
+        zipcode, coords, closest = self._resolve(location)
+        days = [
+            start_date + timedelta(days=i)
+            for i in range((end_date - start_date).days + 1)
+        ]
+        if coords is None:
+            return [self._unknown_zip_result(zipcode, day, requested) for day in days]
+        series = _StationSeries(self, start_date, end_date)
+        return [
+            self._weather_for_day(day, requested, zipcode, coords, closest, series)
+            for day in days
+        ]
+
+    def get_weather_batch(
+        self,
+        queries: Sequence[tuple[LocationInput, date]],
+        elements: list[str] | None = None,
+    ) -> list[WeatherResult | Exception]:
+        """Get weather for many (location, date) pairs, grouped by station-year.
+
+        Plans the whole batch before reading anything: each distinct
+        location is resolved once to its candidate stations, the dates
+        every candidate station-year must cover are collected, and the
+        queries are then answered sorted by (year, nearest station) so
+        each station-year is read with one range query and each yearly
+        store stays hot while it is needed. Results come back in input
+        order and match ``get_weather`` query for query.
+
+        Args:
+            queries: (location, date) pairs; locations as for
+                ``get_weather``.
+            elements: Element codes to retrieve (default: all).
+
+        Returns:
+            One entry per query, in order: its WeatherResult, or the
+            exception raised for it (an unparseable location, a failed
+            read), so one bad query does not fail the batch.
+
+        Raises:
+            ValueError: If ``elements`` names an unknown element.
+        """  # noqa: DOC502 - raised by normalize_elements
+        requested = normalize_elements(elements)
+        results: list[WeatherResult | Exception | None] = [None] * len(queries)
+        resolved: dict[LocationInput, _Resolution | ValueError] = {}
+        spans: dict[_StationYear, tuple[date, date]] = {}
+        plan: list[tuple[int, date, _Resolution]] = []
+
+        self._resolve_many({location for location, _ in queries}, resolved)
+        for index, (location, target_date) in enumerate(queries):
+            resolution = resolved[location]
+            if isinstance(resolution, ValueError):
+                results[index] = resolution
+                continue
+            zipcode, coords, closest = resolution
+            if coords is None:
+                results[index] = self._unknown_zip_result(
+                    zipcode, target_date, requested
+                )
+                continue
+            candidates = closest if self.interpolate else closest[: self.max_stations]
+            for station_id, _distance in candidates:
+                key = (station_id, target_date.year)
+                span = spans.get(key)
+                spans[key] = (
+                    (target_date, target_date)
+                    if span is None
+                    else (min(span[0], target_date), max(span[1], target_date))
+                )
+            plan.append((index, target_date, resolution))
+
+        if plan:
+            plan.sort(
+                key=lambda item: (
+                    item[1].year,
+                    item[2][2][0][0] if item[2][2] else "",
+                    item[1],
+                )
+            )
+            series = _StationSeries(
+                self,
+                min(item[1] for item in plan),
+                max(item[1] for item in plan),
+                spans,
+            )
+            for index, target_date, (zipcode, coords, closest) in plan:
+                try:
+                    results[index] = self._weather_for_day(
+                        target_date, requested, zipcode, coords, closest, series
+                    )
+                except Exception as exc:
+                    results[index] = exc
+        return results  # type: ignore[return-value]  # every slot is filled
+
+    def station_years(
+        self,
+        queries: Iterable[tuple[LocationInput, date]],
+        stations: int = 1,
+    ) -> list[tuple[str, str, int]]:
+        """Station-years the queries will read first, in first-touch order.
+
+        Each query contributes its nearest ``stations`` candidates (within
+        ``max_distance_meters``) from the sources this lookup reads;
+        farther candidates are only reached when those lack a value.
+        Queries that fail to resolve are skipped.
+
+        Args:
+            queries: (location, date) pairs, as for ``get_weather_batch``.
+            stations: Candidates per query to include.
+
+        Returns:
+            Distinct (station_id, station_type, year) triples.
         """
-        results = []
-        current = start_date
-        while current <= end_date:
-            results.append(self.get_weather(location, current, elements))
-            current += timedelta(days=1)
-        return results
+        queries = list(queries)
+        resolved: dict[LocationInput, _Resolution | ValueError] = {}
+        self._resolve_many({location for location, _ in queries}, resolved)
+        seen: dict[tuple[str, str, int], None] = {}
+        for location, target_date in queries:
+            resolution = resolved[location]
+            if isinstance(resolution, ValueError):
+                continue
+            taken = 0
+            for station_id, distance in resolution[2][: self.max_stations]:
+                if taken == stations or (
+                    self.max_distance_meters and distance > self.max_distance_meters
+                ):
+                    break
+                station_info = self.db.get_station_info(station_id)
+                if station_info is None:
+                    continue
+                station_type = station_info[1]
+                if (station_type == "GHCND" and self.use_ghcn) or (
+                    station_type == "USAF-WBAN" and self.use_gsod
+                ):
+                    seen[(station_id, station_type, target_date.year)] = None
+                    taken += 1
+        return list(seen)
 
     def clear_cache(self) -> None:
-        """Clear the weather data cache."""
-        _cached_ghcn_data.cache_clear()
-        _cached_gsod_data.cache_clear()
+        """Clear the weather data caches, including stored results."""
+        clear_value_caches()
+        clear_gsod_year_cache()
+        if self.result_cache is not None:
+            self.result_cache.clear()
 
     def cache_info(self) -> dict:
-        """Get cache statistics."""
-        return {
-            "ghcn": _cached_ghcn_data.cache_info(),
-            "gsod": _cached_gsod_data.cache_info(),
+        """Get cache statistics (``results`` when a result cache is set).
+
+        ``ghcn`` and ``gsod`` are the value cache partitions
+        (``ValueCacheInfo``: hits, misses, entries, bytes, evictions and
+        ``hit_rate``).
+        """
+        info = {
+            **{source: _value_cache(source).info() for source in VALUE_CACHE_SOURCES},
+            "gsod_years": gsod_year_cache_info(),
         }
+        if self.result_cache is not None:
+            info["results"] = self.result_cache.info()
+        return info
+
+
+@dataclass
+class _StationSeries:
+    """Station observations over a date span, fetched once per station-year.
+
+    Backs ``get_weather_range`` and ``get_weather_batch``: the first time
+    the day-walk reaches a station in a year, the station's span for that
+    year is read with the range API (one query) and memoized; every later
+    day is a dict lookup. A failed read is memoized too, so later days
+    re-raise its error instead of downloading (and retrying) again.
+    ``spans`` narrows a station-year to the dates a batch needs;
+    otherwise the span is [start, end] clipped to the year.
+    """
+
+    lookup: WeatherLookup
+    start: date
+    end: date
+    spans: dict[_StationYear, tuple[date, date]] = field(default_factory=dict)
+    _values: dict[_StationYear, dict[date, dict[str, float]] | Exception] = field(
+        default_factory=dict
+    )
+    _flags: dict[_StationYear, dict[date, dict[str, str]] | Exception] = field(
+        default_factory=dict
+    )
+    _weather_types: dict[_StationYear, dict[date, set[str]] | Exception] = field(
+        default_factory=dict
+    )
+
+    def _span(self, key: _StationYear) -> tuple[date, date]:
+        span = self.spans.get(key)
+        if span is not None:
+            return span
+        year = key[1]
+        return max(self.start, date(year, 1, 1)), min(self.end, date(year, 12, 31))
+
+    def _series(
+        self,
+        memo: dict[_StationYear, _T | Exception],
+        key: _StationYear,
+        fetch: Callable[[date, date], _T],
+    ) -> _T:
+        """A station-year's series from ``memo``, fetched on first use."""
+        series = memo.get(key)
+        if series is None:
+            try:
+                series = fetch(*self._span(key))
+            except Exception as exc:
+                series = exc
+            memo[key] = series
+        if isinstance(series, Exception):
+            raise series
+        return series
+
+    def values(
+        self, station_id: str, station_type: str, target_date: date
+    ) -> dict[str, float]:
+        """Metric observations for a station-day."""
+        series = self._series(
+            self._values,
+            (station_id, target_date.year),
+            lambda start, end: self._fetch_values(station_id, station_type, start, end),
+        )
+        return series.get(target_date, {})
+
+    def flags(self, station_id: str, target_date: date) -> dict[str, str]:
+        """GHCN quality-control flags for a station-day."""
+        series = self._series(
+            self._flags,
+            (station_id, target_date.year),
+            lambda start, end: get_ghcn_flags_range(station_id, start, end),
+        )
+        return series.get(target_date, {})
+
+    def weather_types(
+        self, station_id: str, station_type: str, target_date: date
+    ) -> set[str]:
+        """Present-weather phenomena for a station-day."""
+        series = self._series(
+            self._weather_types,
+            (station_id, target_date.year),
+            lambda start, end: self._fetch_weather_types(
+                station_id, station_type, start, end
+            ),
+        )
+        return series.get(target_date, set())
+
+    def _fetch_values(
+        self, station_id: str, station_type: str, start: date, end: date
+    ) -> dict[date, dict[str, float]]:
+        if station_type == "GHCND" and self.lookup.use_ghcn:
+            raw = get_ghcn_data_range(station_id, start, end)
+            return {day: _ghcn_metric(values) for day, values in raw.items()}
+        if station_type == "USAF-WBAN" and self.lookup.use_gsod:
+            raw = get_gsod_data_range(station_id, start, end)
+            return {day: _gsod_metric(values) for day, values in raw.items()}
+        return {}
+
+    def _fetch_weather_types(
+        self, station_id: str, station_type: str, start: date, end: date
+    ) -> dict[date, set[str]]:
+        if station_type == "GHCND" and self.lookup.use_ghcn:
+            return get_ghcn_weather_types_range(station_id, start, end)
+        if station_type == "USAF-WBAN" and self.lookup.use_gsod:
+            return get_gsod_weather_types_range(station_id, start, end)
+        return {}
@@ -8,15 +8,18 @@ CDO /stations endpoint, since CDO's own ZIP locations rarely contain a
 GHCND station.
 """
 
+import asyncio
 import logging
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Any
 
-from get_weather_data.api.noaa import NOAAClient, StationInfo
+from get_weather_data.api.noaa import AsyncNOAAClient, NOAAClient, StationInfo
 from get_weather_data.core.distance import meters_distance
+from get_weather_data.core.singleflight import AsyncSingleFlight
 from get_weather_data.stations.zipcodes import download_zipcodes, parse_zipcodes
 from get_weather_data.weather.location import LocationInput, parse_location
 from get_weather_data.weather.results import (
@@ -38,7 +41,14 @@ logger = logging.getLogger("get_weather_data")
 # latitude (~110 km each). Widened progressively for sparse regions.
 EXTENT_STEPS = (1.0, 2.0, 4.0)
 
+# Station ids sent in one /data request by get_weather_many (each adds
+# ~30 characters to the URL; CDO rejects very long query strings)
+MAX_STATIONS_PER_REQUEST = 50
+
 _StationList = list[tuple[StationInfo, int]]
+_StationKey = tuple[float, float, int, int]
+
+_NO_STATIONS = "no CDO stations were found near this location"
 
 
 def _default_zip_coordinates() -> dict[str, tuple[float, float]]:
@@ -48,10 +58,9 @@ def _default_zip_coordinates() -> dict[str, tuple[float, float]]:
 
 
 @dataclass
-class OnlineLookup:
-    """Look up weather for locations via the CDO API."""
+class _OnlineSettings:
+    """Options and result assembly shared by the sync and async lookups."""
 
-    client: NOAAClient = field(default_factory=NOAAClient)
     units: Units = "metric"
     include_weather_types: bool = False
     explain: bool = False
@@ -61,68 +70,43 @@ class OnlineLookup:
     max_stations: int = 20
     zip_coordinates_loader: Callable[[], dict[str, tuple[float, float]]] | None = None
     _zip_coords: dict[str, tuple[float, float]] | None = field(default=None, repr=False)
-    _station_lists: dict[tuple[float, float, int, int], _StationList] = field(
+    _station_lists: dict[_StationKey, _StationList] = field(
         default_factory=dict, repr=False
     )
 
-    def get_weather(
-        self,
-        location: LocationInput,
-        target_date: date,
-        elements: list[str] | None = None,
-    ) -> WeatherResult:
-        """Get weather data for a location and date.
-
-        Args:
-            location: 5-digit US ZIP code, "lat,lon" string, or
-                (lat, lon) tuple.
-            target_date: Date to get weather for.
-            elements: Element codes to retrieve (default: all).
+    def _locate(
+        self, location: LocationInput
+    ) -> tuple[str | None, tuple[float, float] | None]:
+        """Parse a location into (zipcode, coordinates or None)."""
+        parsed = parse_location(location)
+        if isinstance(parsed, str):
+            return parsed, self._resolve_zip(parsed)
+        return None, parsed
 
-        Returns:
-            WeatherResult with available data in the configured units.
-        """
-        results = self.get_weather_range(location, target_date, target_date, elements)
-        return results[0]
+    def _resolve_zip(self, zipcode: str) -> tuple[float, float] | None:
+        """Resolve a ZIP code to its centroid via GeoNames."""
+        if self._zip_coords is None:
+            loader = self.zip_coordinates_loader or _default_zip_coordinates
+            self._zip_coords = loader()
+        coords = self._zip_coords.get(zipcode)
+        if coords is None:
+            logger.warning("ZIP code %s not found in GeoNames data", zipcode)
+        return coords
 
-    def get_weather_range(
+    def _empty_range(
         self,
-        location: LocationInput,
         start_date: date,
         end_date: date,
-        elements: list[str] | None = None,
+        requested: list[str],
+        zipcode: str | None,
+        coords: tuple[float, float] | None,
+        reason: str,
     ) -> list[WeatherResult]:
-        """Get weather data for a location over a date range.
-
-        The range is fetched in at most one API request per calendar
-        year (CDO caps GHCND requests at one year), never per day.
-
-        Args:
-            location: 5-digit US ZIP code, "lat,lon" string, or
-                (lat, lon) tuple.
-            start_date: Start date.
-            end_date: End date.
-            elements: Element codes to retrieve (default: all).
-
-        Returns:
-            List of WeatherResult objects, one per day.
-
-        Raises:
-            ValueError: If the location cannot be parsed.
-        """  # noqa: DOC502 - raised by parse_location/normalize_elements
-        requested = normalize_elements(elements)
-        parsed = parse_location(location)
-
-        zipcode: str | None = None
-        if isinstance(parsed, str):
-            zipcode = parsed
-            coords = self._resolve_zip(zipcode)
-        else:
-            coords = parsed
-
-        def _empty(day_offset: int, reason: str) -> WeatherResult:
+        """One value-less result per day, explaining why when asked."""
+        results = []
+        for offset in range((end_date - start_date).days + 1):
             result = WeatherResult(
-                date=start_date + timedelta(days=day_offset),
+                date=start_date + timedelta(days=offset),
                 zipcode=zipcode,
                 latitude=coords[0] if coords else None,
                 longitude=coords[1] if coords else None,
@@ -131,41 +115,43 @@ class OnlineLookup:
             if self.explain:
                 result.stations_considered = 0
                 result.missing = {ELEMENTS[e].field: reason for e in requested}
-            return result
-
-        n_days = (end_date - start_date).days + 1
-        if coords is None:
-            reason = (
-                f"ZIP code {zipcode} could not be resolved to coordinates"
-                if zipcode
-                else "the location could not be resolved to coordinates"
-            )
-            return [_empty(i, reason) for i in range(n_days)]
-
-        lat, lon = coords
-        stations = self._closest_stations(lat, lon, start_date, end_date)
-        if not stations:
-            return [
-                _empty(i, "no CDO stations were found near this location")
-                for i in range(n_days)
-            ]
+            results.append(result)
+        return results
 
-        station_ids = [info.id for info, _ in stations]
-        records: list[dict[str, Any]] = []
-        chunk_start = start_date
-        while chunk_start <= end_date:
-            chunk_end = min(date(chunk_start.year, 12, 31), end_date)
-            records.extend(
-                self.client.get_data_for_stations(station_ids, chunk_start, chunk_end)
-            )
-            chunk_start = chunk_end + timedelta(days=1)
+    def _rank_stations(
+        self, lat: float, lon: float, candidates: list[StationInfo]
+    ) -> _StationList:
+        """The nearest ``max_stations`` candidates, with distances in meters."""
+        ranked = sorted(
+            (
+                (info, int(meters_distance(lat, lon, info.latitude, info.longitude)))
+                for info in candidates
+                if info.latitude is not None and info.longitude is not None
+            ),
+            key=lambda pair: pair[1],
+        )[: self.max_stations]
+        if not ranked:
+            logger.warning("No CDO stations found near (%.2f, %.2f)", lat, lon)
+        return ranked
 
+    def _results_from_records(
+        self,
+        records: list[dict[str, Any]],
+        stations: _StationList,
+        requested: list[str],
+        zipcode: str | None,
+        coords: tuple[float, float],
+        start_date: date,
+        end_date: date,
+    ) -> list[WeatherResult]:
+        """Assemble one result per day from the range's CDO records."""
         by_date: dict[date, list[dict[str, Any]]] = defaultdict(list)
         for record in records:
             record_date = _record_date(record)
             if record_date is not None:
                 by_date[record_date].append(record)
 
+        lat, lon = coords
         results = []
         current = start_date
         while current <= end_date:
@@ -183,55 +169,6 @@ class OnlineLookup:
             current += timedelta(days=1)
         return results
 
-    def _resolve_zip(self, zipcode: str) -> tuple[float, float] | None:
-        """Resolve a ZIP code to its centroid via GeoNames."""
-        if self._zip_coords is None:
-            loader = self.zip_coordinates_loader or _default_zip_coordinates
-            self._zip_coords = loader()
-        coords = self._zip_coords.get(zipcode)
-        if coords is None:
-            logger.warning("ZIP code %s not found in GeoNames data", zipcode)
-        return coords
-
-    def _closest_stations(
-        self, lat: float, lon: float, start: date, end: date
-    ) -> _StationList:
-        """Nearest GHCND stations to a point, with distances in meters."""
-        # Round the key so nearby queries and same-year ranges share the
-        # station list (each /stations call spends API quota)
-        cache_key = (round(lat, 2), round(lon, 2), start.year, end.year)
-        if cache_key in self._station_lists:
-            return self._station_lists[cache_key]
-
-        candidates: list[StationInfo] = []
-        for extent in EXTENT_STEPS:
-            candidates = self.client.get_stations(
-                (lat - extent, lon - extent, lat + extent, lon + extent),
-                start,
-                end,
-            )
-            if candidates:
-                break
-            logger.info(
-                "No CDO stations within %.0f deg of (%.2f, %.2f); widening",
-                extent,
-                lat,
-                lon,
-            )
-
-        ranked = sorted(
-            (
-                (info, int(meters_distance(lat, lon, info.latitude, info.longitude)))
-                for info in candidates
-                if info.latitude is not None and info.longitude is not None
-            ),
-            key=lambda pair: pair[1],
-        )[: self.max_stations]
-        if not ranked:
-            logger.warning("No CDO stations found near (%.2f, %.2f)", lat, lon)
-        self._station_lists[cache_key] = ranked
-        return ranked
-
     def _build_result(
         self,
         target_date: date,
@@ -329,6 +266,383 @@ class OnlineLookup:
         }
 
 
+@dataclass
+class OnlineLookup(_OnlineSettings):
+    """Look up weather for locations via the CDO API."""
+
+    client: NOAAClient = field(default_factory=NOAAClient)
+
+    def get_weather(
+        self,
+        location: LocationInput,
+        target_date: date,
+        elements: list[str] | None = None,
+    ) -> WeatherResult:
+        """Get weather data for a location and date.
+
+        Args:
+            location: 5-digit US ZIP code, "lat,lon" string, or
+                (lat, lon) tuple.
+            target_date: Date to get weather for.
+            elements: Element codes to retrieve (default: all).
+
+        Returns:
+            WeatherResult with available data in the configured units.
+        """
+        results = self.get_weather_range(location, target_date, target_date, elements)
+        return results[0]
+
+    def get_weather_range(
+        self,
+        location: LocationInput,
+        start_date: date,
+        end_date: date,
+        elements: list[str] | None = None,
+    ) -> list[WeatherResult]:
+        """Get weather data for a location over a date range.
+
+        The range is fetched in at most one API request per calendar
+        year (CDO caps GHCND requests at one year), never per day, and
+        the years are requested concurrently under the rate limit.
+
+        Args:
+            location: 5-digit US ZIP code, "lat,lon" string, or
+                (lat, lon) tuple.
+            start_date: Start date.
+            end_date: End date.
+            elements: Element codes to retrieve (default: all).
+
+        Returns:
+            List of WeatherResult objects, one per day.
+
+        Raises:
+            ValueError: If the location cannot be parsed.
+        """  # noqa: DOC502 - raised by parse_location/normalize_elements
+        requested = normalize_elements(elements)
+        zipcode, coords = self._locate(location)
+        if coords is None:
+            return self._empty_range(
+                start_date,
+                end_date,
+                requested,
+                zipcode,
+                coords,
+                _unresolved_reason(zipcode),
+            )
+
+        stations = self._closest_stations(*coords, start_date, end_date)
+        if not stations:
+            return self._empty_range(
+                start_date, end_date, requested, zipcode, coords, _NO_STATIONS
+            )
+
+        station_ids = [info.id for info, _ in stations]
+        records = self._fetch_data(
+            [(station_ids, *span) for span in _year_chunks(start_date, end_date)]
+        )
+        return self._results_from_records(
+            records, stations, requested, zipcode, coords, start_date, end_date
+        )
+
+    def get_weather_many(
+        self,
+        locations: Sequence[LocationInput],
+        start_date: date,
+        end_date: date,
+        elements: list[str] | None = None,
+    ) -> list[list[WeatherResult]]:
+        """Get weather data for many locations over one date range.
+
+        Answers like ``get_weather_range`` per location, but spends far
+        less quota on a panel of nearby locations: each distinct station
+        search runs once, the union of nearby stations is packed into
+        as few ``/data`` requests as ``MAX_STATIONS_PER_REQUEST`` allows
+        (per calendar year), and each station's records are shared by
+        every location that ranks it.
+
+        Args:
+            locations: ZIP codes, "lat,lon" strings or (lat, lon) tuples.
+            start_date: Start date.
+            end_date: End date.
+            elements: Element codes to retrieve (default: all).
+
+        Returns:
+            One list of daily WeatherResults per location, in input
+            order.
+
+        Raises:
+            ValueError: If a location cannot be parsed.
+        """  # noqa: DOC502 - raised by parse_location/normalize_elements
+        requested = normalize_elements(elements)
+        located = [self._locate(location) for location in locations]
+
+        # One station search per distinct (rounded) point
+        points: dict[_StationKey, tuple[float, float]] = {}
+        for _zipcode, coords in located:
+            if coords is not None:
+                points.setdefault(_station_key(*coords, start_date, end_date), coords)
+        station_lists = dict(
+            zip(
+                points,
+                self._map(
+                    lambda point: self._closest_stations(*point, start_date, end_date),
+                    list(points.values()),
+                ),
+                strict=True,
+            )
+        )
+
+        # Sorted, so a rerun packs (and caches) the same requests
+        station_ids = sorted(
+            {info.id for stations in station_lists.values() for info, _ in stations}
+        )
+        packs = [
+            station_ids[i : i + MAX_STATIONS_PER_REQUEST]
+            for i in range(0, len(station_ids), MAX_STATIONS_PER_REQUEST)
+        ]
+        spans = _year_chunks(start_date, end_date)
+        by_station: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for record in self._fetch_data(
+            [(pack, *span) for pack in packs for span in spans]
+        ):
+            by_station[record.get("station", "")].append(record)
+
+        results = []
+        for zipcode, coords in located:
+            if coords is None:
+                reason = _unresolved_reason(zipcode)
+                results.append(
+                    self._empty_range(
+                        start_date, end_date, requested, zipcode, coords, reason
+                    )
+                )
+                continue
+            stations = station_lists[_station_key(*coords, start_date, end_date)]
+            if not stations:
+                results.append(
+                    self._empty_range(
+                        start_date, end_date, requested, zipcode, coords, _NO_STATIONS
+                    )
+                )
+                continue
+            records = [
+                record for info, _ in stations for record in by_station.get(info.id, [])
+            ]
+            results.append(
+                self._results_from_records(
+                    records, stations, requested, zipcode, coords, start_date, end_date
+                )
+            )
+        return results
+
+    def _fetch_data(
+        self, queries: list[tuple[list[str], date, date]]
+    ) -> list[dict[str, Any]]:
+        """Records for (station ids, start, end) queries, sent concurrently."""
+        records: list[dict[str, Any]] = []
+        for chunk in self._map(
+            lambda query: self.client.get_data_for_stations(*query), queries
+        ):
+            records.extend(chunk)
+        return records
+
+    def _map(self, func: Callable[[Any], Any], items: list[Any]) -> list[Any]:
+        """Apply func to items concurrently, in order.
+
+        The client's rate limiter paces the requests func sends.
+        """
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        workers = min(self.client.max_concurrency, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, items))
+
+    def _closest_stations(
+        self, lat: float, lon: float, start: date, end: date
+    ) -> _StationList:
+        """Nearest GHCND stations to a point, with distances in meters."""
+        cache_key = _station_key(lat, lon, start, end)
+        if cache_key in self._station_lists:
+            return self._station_lists[cache_key]
+
+        candidates: list[StationInfo] = []
+        for extent in EXTENT_STEPS:
+            candidates = self.client.get_stations(
+                (lat - extent, lon - extent, lat + extent, lon + extent),
+                start,
+                end,
+            )
+            if candidates:
+                break
+            _log_widening(extent, lat, lon)
+
+        ranked = self._station_lists[cache_key] = self._rank_stations(
+            lat, lon, candidates
+        )
+        return ranked
+
+
+@dataclass
+class AsyncOnlineLookup(_OnlineSettings):
+    """Asyncio counterpart of OnlineLookup over ``AsyncNOAAClient``.
+
+    Returns the same results. Concurrent calls that need the same
+    station search or the same stations' year of records share one
+    in-flight API request, so a burst of identical queries spends quota
+    once.
+    """
+
+    client: AsyncNOAAClient = field(default_factory=AsyncNOAAClient)
+    _flights: AsyncSingleFlight = field(default_factory=AsyncSingleFlight, repr=False)
+
+    async def get_weather(
+        self,
+        location: LocationInput,
+        target_date: date,
+        elements: list[str] | None = None,
+    ) -> WeatherResult:
+        """Get weather data for a location and date.
+
+        Args:
+            location: 5-digit US ZIP code, "lat,lon" string, or
+                (lat, lon) tuple.
+            target_date: Date to get weather for.
+            elements: Element codes to retrieve (default: all).
+
+        Returns:
+            WeatherResult with available data in the configured units.
+        """
+        results = await self.get_weather_range(
+            location, target_date, target_date, elements
+        )
+        return results[0]
+
+    async def get_weather_range(
+        self,
+        location: LocationInput,
+        start_date: date,
+        end_date: date,
+        elements: list[str] | None = None,
+    ) -> list[WeatherResult]:
+        """Get weather data for a location over a date range.
+
+        Year chunks of the range are requested concurrently.
+
+        Args:
+            location: 5-digit US ZIP code, "lat,lon" string, or
+                (lat, lon) tuple.
+            start_date: Start date.
+            end_date: End date.
+            elements: Element codes to retrieve (default: all).
+
+        Returns:
+            List of WeatherResult objects, one per day.
+
+        Raises:
+            ValueError: If the location cannot be parsed.
+        """  # noqa: DOC502 - raised by parse_location/normalize_elements
+        requested = normalize_elements(elements)
+        # The first ZIP lookup loads (and may download) the GeoNames file
+        zipcode, coords = await asyncio.to_thread(self._locate, location)
+        if coords is None:
+            return self._empty_range(
+                start_date,
+                end_date,
+                requested,
+                zipcode,
+                coords,
+                _unresolved_reason(zipcode),
+            )
+
+        stations = await self._closest_stations(*coords, start_date, end_date)
+        if not stations:
+            return self._empty_range(
+                start_date, end_date, requested, zipcode, coords, _NO_STATIONS
+            )
+
+        station_ids = [info.id for info, _ in stations]
+        chunks = await asyncio.gather(
+            *(
+                self._flights.run(
+                    ("data", tuple(station_ids), chunk_start, chunk_end),
+                    lambda s=chunk_start, e=chunk_end: (
+                        self.client.get_data_for_stations(station_ids, s, e)
+                    ),
+                )
+                for chunk_start, chunk_end in _year_chunks(start_date, end_date)
+            )
+        )
+        records = [record for chunk in chunks for record in chunk]
+        return self._results_from_records(
+            records, stations, requested, zipcode, coords, start_date, end_date
+        )
+
+    async def _closest_stations(
+        self, lat: float, lon: float, start: date, end: date
+    ) -> _StationList:
+        """Nearest GHCND stations to a point, with distances in meters."""
+        cache_key = _station_key(lat, lon, start, end)
+        if cache_key in self._station_lists:
+            return self._station_lists[cache_key]
+
+        async def search() -> _StationList:
+            candidates: list[StationInfo] = []
+            for extent in EXTENT_STEPS:
+                candidates = await self.client.get_stations(
+                    (lat - extent, lon - extent, lat + extent, lon + extent),
+                    start,
+                    end,
+                )
+                if candidates:
+                    break
+                _log_widening(extent, lat, lon)
+            # Cached before the flight lands, so no later caller searches again
+            ranked = self._station_lists[cache_key] = self._rank_stations(
+                lat, lon, candidates
+            )
+            return ranked
+
+        return await self._flights.run(("stations", cache_key), search)
+
+    async def aclose(self) -> None:
+        """Close the API client."""
+        await self.client.aclose()
+
+
+def _station_key(lat: float, lon: float, start: date, end: date) -> _StationKey:
+    """Station-list cache key.
+
+    Rounded so nearby queries and same-year ranges share the station
+    list (each /stations call spends API quota).
+    """
+    return (round(lat, 2), round(lon, 2), start.year, end.year)
+
+
+def _log_widening(extent: float, lat: float, lon: float) -> None:
+    logger.info(
+        "No CDO stations within %.0f deg of (%.2f, %.2f); widening", extent, lat, lon
+    )
+
+
+def _unresolved_reason(zipcode: str | None) -> str:
+    return (
+        f"ZIP code {zipcode} could not be resolved to coordinates"
+        if zipcode
+        else "the location could not be resolved to coordinates"
+    )
+
+
+def _year_chunks(start_date: date, end_date: date) -> list[tuple[date, date]]:
+    """Split a range at year boundaries (CDO caps GHCND requests at a year)."""
+    chunks = []
+    chunk_start = start_date
+    while chunk_start <= end_date:
+        chunk_end = min(date(chunk_start.year, 12, 31), end_date)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end + timedelta(days=1)
+    return chunks
+
+
 def _record_date(record: dict[str, Any]) -> date | None:
     """Parse the date out of a CDO /data record ("2024-01-15T00:00:00")."""
     raw = record.get("date")
@@ -0,0 +1,255 @@
+"""Fetch weather data ahead of the lookups that need it.
+
+Lookups build each GHCN year (and download each GSOD station-year)
+lazily, so the first batch row that touches a new year stalls every
+thread until that year has downloaded and built.
+
+- ``prefetch_ghcn_years`` builds a given set of years up front, several
+  at a time in worker processes (each build is CPU-bound parsing plus
+  network), and reports each year as it finishes.
+- ``BackgroundPrefetch`` fetches GHCN years and GSOD station-years as a
+  planner discovers them (``process_csv(prefetch=True)`` scans its
+  input for them), on a bounded thread pool running alongside the
+  lookups.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass
+from functools import partial
+
+from get_weather_data.core.config import Config, get_config, set_config
+from get_weather_data.weather.ghcn import ensure_ghcn_year
+from get_weather_data.weather.gsod import ensure_gsod_year
+
+logger = logging.getLogger("get_weather_data")
+
+# Default concurrent year builds; each holds a download and a build
+DEFAULT_PREFETCH_JOBS = 4
+
+
+@dataclass
+class YearPrefetch:
+    """Outcome of warming one GHCN year.
+
+    Attributes:
+        year: Calendar year.
+        seconds: Wall time spent on the year.
+        built: Whether the year was downloaded and built (False when a
+            usable copy was already cached).
+        error: Why the year failed, or None on success.
+    """
+
+    year: int
+    seconds: float
+    built: bool
+    error: str | None = None
+
+
+# Called as (outcome, completed count, total) after each year finishes
+PrefetchProgress = Callable[[YearPrefetch, int, int], None]
+
+
+def parse_years(spec: str) -> list[int]:
+    """Parse a year list such as "2000-2024" or "1999,2005-2007".
+
+    Args:
+        spec: Comma-separated years and inclusive year ranges.
+
+    Returns:
+        Sorted distinct years.
+
+    Raises:
+        ValueError: If a part is not a year or a range is reversed.
+    """
+    years: set[int] = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, sep, last = part.partition("-")
+        try:
+            start = int(first)
+            end = int(last) if sep else start
+        except ValueError:
+            raise ValueError(f"Invalid year or range: {part!r}") from None
+        if end < start:
+            raise ValueError(f"Year range {part!r} is reversed")
+        years.update(range(start, end + 1))
+    if not years:
+        raise ValueError(f"No years in {spec!r}")
+    return sorted(years)
+
+
+def _init_worker(config: Config) -> None:
+    """Give a worker process the parent's configuration."""
+    set_config(config)
+
+
+def _warm_year(year: int) -> YearPrefetch:
+    """Ensure one year is cached, timing it and capturing any failure."""
+    started = time.perf_counter()
+    try:
+        built = ensure_ghcn_year(year)
+    except Exception as exc:
+        return YearPrefetch(year, time.perf_counter() - started, False, str(exc))
+    return YearPrefetch(year, time.perf_counter() - started, built)
+
+
+def prefetch_ghcn_years(
+    years: Iterable[int],
+    jobs: int | None = None,
+    progress: PrefetchProgress | None = None,
+) -> list[YearPrefetch]:
+    """Download and build GHCN years concurrently.
+
+    Years that are already cached (and fresh) return immediately. A
+    failing year is reported in its outcome and does not stop the rest.
+
+    Args:
+        years: Calendar years to warm.
+        jobs: Years built at once, each in its own worker process
+            (default: ``DEFAULT_PREFETCH_JOBS``). 1 builds in this
+            process, one year after another.
+        progress: Called after each year finishes.
+
+    Returns:
+        One outcome per distinct year, sorted by year.
+
+    Raises:
+        ValueError: If jobs is less than 1.
+    """
+    wanted = sorted(set(years))
+    if jobs is None:
+        jobs = DEFAULT_PREFETCH_JOBS
+    if jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+    jobs = min(jobs, len(wanted)) or 1
+
+    outcomes: list[YearPrefetch] = []
+
+    def record(outcome: YearPrefetch) -> None:
+        outcomes.append(outcome)
+        if outcome.error:
+            logger.warning(f"GHCN {outcome.year} failed: {outcome.error}")
+        else:
+            logger.info(
+                f"GHCN {outcome.year} "
+                f"{'built' if outcome.built else 'cached'} in {outcome.seconds:.1f}s"
+            )
+        if progress is not None:
+            progress(outcome, len(outcomes), len(wanted))
+
+    if jobs == 1:
+        for year in wanted:
+            record(_warm_year(year))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(get_config(),)
+        ) as pool:
+            futures = [pool.submit(_warm_year, year) for year in wanted]
+            for future in as_completed(futures):
+                record(future.result())
+    return sorted(outcomes, key=lambda outcome: outcome.year)
+
+
+class BackgroundPrefetch:
+    """Fetch GHCN years and GSOD station-years on a bounded thread pool.
+
+    Work is queued in the order ``add`` sees it and each year or
+    station-year is fetched once. A lookup that reaches a year or
+    station-year still being fetched waits for that fetch instead of
+    starting a second one. Failures are logged and counted; the
+    lookup that needs the data retries it as usual.
+    """
+
+    def __init__(self, jobs: int | None = None) -> None:
+        """Start an idle pool.
+
+        Args:
+            jobs: Fetches at once (default: ``DEFAULT_PREFETCH_JOBS``).
+
+        Raises:
+            ValueError: If jobs is less than 1.
+        """
+        if jobs is None:
+            jobs = DEFAULT_PREFETCH_JOBS
+        if jobs < 1:
+            raise ValueError(f"jobs must be at least 1, got {jobs}")
+        self._pool = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="prefetch")
+        self._lock = threading.Lock()
+        self._queued: set[tuple[str, int]] = set()
+        self._futures: list[Future[None]] = []
+        self.completed = 0
+        self.failed = 0
+
+    def add(self, station_years: Iterable[tuple[str, str, int]]) -> int:
+        """Queue fetches for station-years not seen before.
+
+        Args:
+            station_years: (station_id, station_type, year) triples, as
+                returned by ``WeatherLookup.station_years``.
+
+        Returns:
+            Number of fetches newly queued.
+        """
+        added = 0
+        for station_id, station_type, year in station_years:
+            if station_type == "GHCND":
+                # One file per year covers every GHCN station
+                key = ("GHCND", year)
+                task = partial(ensure_ghcn_year, year)
+            elif station_type == "USAF-WBAN":
+                key = (station_id, year)
+                task = partial(ensure_gsod_year, station_id, year)
+            else:
+                continue
+            with self._lock:
+                if key in self._queued:
+                    continue
+                self._queued.add(key)
+            future = self._pool.submit(self._run, key, task)
+            with self._lock:
+                self._futures.append(future)
+            added += 1
+        return added
+
+    def _run(self, key: tuple[str, int], task: Callable[[], object]) -> None:
+        try:
+            task()
+        except Exception as exc:
+            logger.debug(f"Prefetch of {key} failed: {exc}")
+            with self._lock:
+                self.failed += 1
+        else:
+            with self._lock:
+                self.completed += 1
+
+    @property
+    def queued(self) -> int:
+        """Number of distinct fetches queued so far."""
+        with self._lock:
+            return len(self._queued)
+
+    def wait(self) -> None:
+        """Block until every fetch queued so far has finished."""
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.result()  # _run never raises
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the pool, dropping fetches that have not started.
+
+        Args:
+            wait: Wait for fetches already running to finish.
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,188 @@
+"""Persistent, content-addressed cache of WeatherLookup results.
+
+Enabled with ``Config(result_cache=True)``. Each day's result is stored
+in a SQLite file under ``config.results_cache_dir``, keyed by a hash of
+everything that determines it: the resolved ZIP code, coordinates and
+candidate stations, the date, the requested elements and the lookup's
+units and flags. Re-running a batch over the same inputs then answers
+from the cache without touching the station data.
+
+Expiry follows ``year_is_immutable``: complete results for final years
+never expire; results for the current and previous year (whose data is
+still accumulating) expire after ``config.cache_max_age_days``, as do
+results missing a requested value (a station file may have failed to
+download).
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from datetime import date
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from get_weather_data.core.cache import year_is_immutable
+from get_weather_data.core.config import get_config
+from get_weather_data.weather.results import WeatherResult
+
+logger = logging.getLogger("get_weather_data")
+
+# Bump when lookup semantics change so old entries stop matching.
+RESULT_CACHE_VERSION = 1
+
+_SECONDS_PER_DAY = 86400
+
+
+class ResultCacheInfo(NamedTuple):
+    """Hit/miss statistics of a ResultCache (lru_cache-style fields)."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+def result_key(*parts: Any) -> str:
+    """Content address of a lookup.
+
+    Args:
+        *parts: JSON-serializable values that determine the result.
+
+    Returns:
+        Hex SHA-256 of the canonical JSON of the parts.
+    """
+    payload = json.dumps(
+        [RESULT_CACHE_VERSION, *parts], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _encode(result: WeatherResult) -> str:
+    data = asdict(result)
+    data["date"] = result.date.isoformat()
+    if result.weather_types is not None:
+        data["weather_types"] = sorted(result.weather_types)
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _decode(text: str) -> WeatherResult:
+    data = json.loads(text)
+    data["date"] = date.fromisoformat(data["date"])
+    if data.get("weather_types") is not None:
+        data["weather_types"] = set(data["weather_types"])
+    return WeatherResult(**data)
+
+
+class ResultCache:
+    """SQLite-backed result store, safe to share across threads.
+
+    Several processes may open the same file; SQLite serializes their
+    writes.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Open (creating if needed) a result cache.
+
+        Args:
+            path: SQLite file. Defaults to ``results.sqlite`` in
+                ``config.results_cache_dir``.
+        """
+        self.path = (
+            get_config().results_cache_dir / "results.sqlite" if path is None else path
+        )
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> WeatherResult | None:
+        """Look up a stored result.
+
+        Args:
+            key: Content address from :func:`result_key`.
+
+        Returns:
+            The stored result, or None on a miss (including an expired
+            entry).
+        """
+        with self._lock:
+            row = (
+                self._connection()
+                .execute("SELECT value, expires FROM results WHERE key = ?", (key,))
+                .fetchone()
+            )
+            if row is None or (row[1] is not None and row[1] <= time.time()):
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _decode(row[0])
+
+    def put(self, key: str, result: WeatherResult, complete: bool = True) -> None:
+        """Store a result, with an expiry set by its year.
+
+        Args:
+            key: Content address from :func:`result_key`.
+            result: The lookup's result.
+            complete: Whether every requested value was found; partial
+                results always expire.
+        """
+        expires = None
+        if not complete or not year_is_immutable(result.date.year):
+            max_age = get_config().cache_max_age_days * _SECONDS_PER_DAY
+            expires = time.time() + max_age
+        value = _encode(result)
+        with self._lock:
+            conn = self._connection()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, value, expires) "
+                    "VALUES (?, ?, ?)",
+                    (key, value, expires),
+                )
+                conn.commit()
+            except sqlite3.OperationalError as exc:
+                # A locked or read-only cache must not fail the lookup
+                logger.debug("Could not store result %s: %s", key, exc)
+
+    def info(self) -> ResultCacheInfo:
+        """Hit/miss counts of this instance and the stored entry count.
+
+        Returns:
+            Statistics in ``functools.lru_cache`` form (unbounded).
+        """
+        with self._lock:
+            size = self._connection().execute("SELECT COUNT(*) FROM results")
+            currsize = size.fetchone()[0]
+        return ResultCacheInfo(self.hits, self.misses, None, currsize)
+
+    def clear(self) -> None:
+        """Delete every stored result and reset the statistics."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM results")
+            conn.commit()
+            self.hits = self.misses = 0
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
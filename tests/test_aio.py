@@ -0,0 +1,235 @@
+"""Tests for the asyncio interface (AsyncWeather, async CDO client)."""
+
+import asyncio
+import threading
+from datetime import date
+
+import pytest
+import respx
+from httpx import Response
+
+from get_weather_data import aio as aio_module
+from get_weather_data.aio import AsyncWeather
+from get_weather_data.api.noaa import CDO_BASE_URL, AsyncNOAAClient, NOAAClient
+from get_weather_data.core.config import Config, set_config
+from get_weather_data.core.database import INDEX_VERSION, Database
+from get_weather_data.core.distance import Station
+from get_weather_data.core.singleflight import AsyncSingleFlight
+from get_weather_data.main import Weather
+from get_weather_data.weather import gsod as gsod_module
+from get_weather_data.weather import lookup as lookup_module
+from get_weather_data.weather.online import AsyncOnlineLookup, OnlineLookup
+
+DAY = date(2024, 1, 15)
+STATION = "GHCND:USW00094728"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config(tmp_path, monkeypatch):
+    monkeypatch.delenv("NCDC_TOKEN", raising=False)
+    set_config(Config(ncdc_token=None, data_dir=tmp_path, cache_dir=tmp_path))
+    lookup_module.clear_value_caches()
+    yield
+    lookup_module.clear_value_caches()
+
+
+@pytest.fixture
+def local_db(tmp_path):
+    """Point the isolated config at a one-ZIP database.
+
+    Passing database_path to Weather would replace the isolated config.
+    """
+    db = Database(tmp_path / "city.sqlite")
+    db.init_schema()
+    db.insert_zipcode("10001", "New York", "NY", 40.7484, -73.9967)
+    db.insert_station(
+        Station(id="GHCN1", name="GHCN STATION", lat=40.78, lon=-73.97, type="GHCND")
+    )
+    db.insert_station(
+        Station(
+            id="725030-14732",
+            name="GSOD STATION",
+            lat=40.78,
+            lon=-73.88,
+            type="USAF-WBAN",
+        )
+    )
+    db.set_closest_stations_bulk({"10001": [("GHCN1", 4000), ("725030-14732", 9000)]})
+    db.set_meta("index_version", str(INDEX_VERSION))
+    db.close()
+    set_config(
+        Config(
+            ncdc_token=None,
+            data_dir=tmp_path,
+            cache_dir=tmp_path,
+            _database_path=db.path,
+        )
+    )
+
+
+class TestAsyncSingleFlight:
+    def test_concurrent_calls_share_one_fetch(self):
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def main():
+            flights = AsyncSingleFlight()
+            results = await asyncio.gather(*(flights.run("k", fetch) for _ in range(5)))
+            assert len(flights) == 0
+            # Nothing is cached: a later call fetches again
+            await flights.run("k", fetch)
+            return results
+
+        assert asyncio.run(main()) == ["value"] * 5
+        assert calls == 2
+
+    def test_error_reaches_every_waiter(self):
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("down")
+
+        async def main():
+            flights = AsyncSingleFlight()
+            return await asyncio.gather(
+                flights.run("k", fail), flights.run("k", fail), return_exceptions=True
+            )
+
+        assert [str(e) for e in asyncio.run(main())] == ["down", "down"]
+
+
+@pytest.mark.usefixtures("local_db")
+class TestAsyncWeatherLocal:
+    def test_matches_sync_and_builds_year_once(self, monkeypatch):
+        monkeypatch.setattr(
+            lookup_module,
+            "get_ghcn_data",
+            lambda station_id, target_date: {"TMAX": -16.0, "PRCP": 0.0},
+        )
+        monkeypatch.setattr(
+            lookup_module, "get_gsod_data", lambda station_id, target_date: {}
+        )
+        monkeypatch.setattr(aio_module, "pending_gsod_download", lambda s, y: None)
+        builds = []
+
+        def slow_build(year):
+            builds.append(year)
+            threading.Event().wait(0.2)
+            return True
+
+        monkeypatch.setattr(aio_module, "ensure_ghcn_year", slow_build)
+
+        async def main():
+            async with AsyncWeather() as weather:
+                return await asyncio.gather(
+                    *(weather.get("10001", "2024-01-15") for _ in range(5))
+                )
+
+        results = asyncio.run(main())
+        assert builds == [2024]
+        expected = Weather().get("10001", DAY)
+        assert results == [expected] * 5
+        assert expected.tmax == pytest.approx(-1.6)
+
+    @respx.mock
+    def test_gsod_file_downloaded_async(self, monkeypatch):
+        monkeypatch.setattr(aio_module, "ensure_ghcn_year", lambda year: False)
+        monkeypatch.setattr(
+            lookup_module, "get_ghcn_data", lambda station_id, target_date: {}
+        )
+        monkeypatch.setattr(
+            lookup_module, "get_gsod_data", lambda station_id, target_date: {}
+        )
+        url = gsod_module._gsod_url("725030-14732", 2024)
+        route = respx.get(url).mock(return_value=Response(200, content=b"gsod"))
+        checked_on = []
+
+        def pending(station_id, year):
+            checked_on.append(threading.current_thread())
+            return gsod_module.pending_gsod_download(station_id, year)
+
+        monkeypatch.setattr(aio_module, "pending_gsod_download", pending)
+
+        async def main():
+            weather = AsyncWeather()
+            try:
+                await asyncio.gather(
+                    weather.get("10001", "2024-01-01"),
+                    weather.get("10001", DAY),
+                )
+            finally:
+                await weather.aclose()
+
+        asyncio.run(main())
+        path = gsod_module._get_gsod_file_path("725030-14732", 2024)
+        assert path.read_bytes() == b"gsod"
+        assert route.call_count == 1
+        # The cache check stats files, so it stays off the event loop
+        assert checked_on
+        assert threading.main_thread() not in checked_on
+
+
+def _stations_payload() -> dict:
+    station = {
+        "id": STATION,
+        "name": "NY CITY CENTRAL PARK",
+        "latitude": 40.78,
+        "longitude": -73.97,
+        "elevation": 40.0,
+    }
+    return {"metadata": {"resultset": {"count": 1}}, "results": [station]}
+
+
+def _data_payload(day: str) -> dict:
+    record = {"date": day, "datatype": "TMAX", "station": STATION, "value": -16}
+    return {"metadata": {"resultset": {"count": 1}}, "results": [record]}
+
+
+class TestAsyncOnline:
+    @respx.mock
+    def test_matches_sync_lookup(self):
+        respx.get(f"{CDO_BASE_URL}/stations").mock(
+            return_value=Response(200, json=_stations_payload())
+        )
+        data = respx.get(f"{CDO_BASE_URL}/data").mock(
+            side_effect=lambda request: Response(
+                200, json=_data_payload(request.url.params["startdate"] + "T00:00:00")
+            )
+        )
+        options = {
+            "zip_coordinates_loader": lambda: {"10001": (40.7484, -73.9967)},
+            "explain": True,
+        }
+        client_options = {
+            "token": "test-token",
+            "retry_delay": 0.0,
+            "min_request_interval": 0.0,
+        }
+
+        async def main():
+            lookup = AsyncOnlineLookup(
+                client=AsyncNOAAClient(**client_options), **options
+            )
+            try:
+                return await lookup.get_weather_range(
+                    "10001", date(2023, 12, 31), date(2024, 1, 1)
+                )
+            finally:
+                await lookup.aclose()
+
+        results = asyncio.run(main())
+        # One request per year chunk, sent concurrently
+        assert data.call_count == 2
+        sync = OnlineLookup(client=NOAAClient(**client_options), **options)
+        assert results == sync.get_weather_range(
+            "10001", date(2023, 12, 31), date(2024, 1, 1)
+        )
+        assert [r.tmax for r in results] == [-1.6, -1.6]
+
+    def test_missing_token_raises(self):
+        with pytest.raises(ValueError, match="NCDC token"):
+            AsyncWeather(online=True)
@@ -1,7 +1,7 @@
 """Tests for batch CSV processing: error isolation, streaming, lat/lon."""
 
 import csv
-from datetime import date
+from datetime import date, timedelta
 
 import pytest
 
@@ -9,6 +9,7 @@ from get_weather_data.core.database import INDEX_VERSION, Database
 from get_weather_data.core.distance import Station
 from get_weather_data.weather import batch as batch_module
 from get_weather_data.weather import lookup as lookup_module
+from get_weather_data.weather import prefetch as prefetch_module
 from get_weather_data.weather.batch import process_csv
 
 DAY = date(2024, 1, 15)
@@ -30,8 +31,7 @@ def city_db(tmp_path) -> Database:
 @pytest.fixture(autouse=True)
 def _mock_data(monkeypatch):
     """Serve fixed GHCN data; keep GSOD out of the way."""
-    lookup_module._cached_ghcn_data.cache_clear()
-    lookup_module._cached_gsod_data.cache_clear()
+    lookup_module.clear_value_caches()
     monkeypatch.setattr(
         lookup_module,
         "get_ghcn_data",
@@ -40,6 +40,17 @@ def _mock_data(monkeypatch):
     monkeypatch.setattr(
         lookup_module, "get_gsod_data", lambda station_id, target_date: {}
     )
+    monkeypatch.setattr(lookup_module, "get_ghcn_data_range", _fixed_range)
+    monkeypatch.setattr(
+        lookup_module, "get_gsod_data_range", lambda station_id, start, end: {}
+    )
+
+
+def _fixed_range(station_id, start, end):
+    days = (end - start).days + 1
+    return {
+        start + timedelta(days=i): {"TMAX": -16.0, "PRCP": 0.0} for i in range(days)
+    }
 
 
 def _write_csv(path, rows: list[dict], fieldnames: list[str]) -> None:
@@ -84,10 +95,10 @@ class TestErrorIsolation:
         assert rows[3]["weather_error"] == ""
 
     def test_lookup_exception_recorded(self, city_db, tmp_path, monkeypatch):
-        def boom(station_id, target_date):
+        def boom(station_id, start, end):
             raise RuntimeError("download exploded")
 
-        monkeypatch.setattr(lookup_module, "get_ghcn_data", boom)
+        monkeypatch.setattr(lookup_module, "get_ghcn_data_range", boom)
         _write_csv(
             tmp_path / "in.csv",
             [{"zip": "10001", "date": "2024-01-15"}],
@@ -101,10 +112,8 @@ class TestErrorIsolation:
             parallel=False,
         )
         rows = _read_csv(tmp_path / "out.csv")
-        # the lookup itself absorbs station-level fetch problems, so a
-        # crash here means the error column captured it OR the lookup
-        # returned an empty result; either way the job survived
         assert len(rows) == 1
+        assert rows[0]["weather_error"] == "download exploded"
 
     def test_zero_written_not_blank(self, city_db, tmp_path):
         _write_csv(
@@ -131,15 +140,14 @@ class TestStreaming:
     ):
         monkeypatch.setattr(batch_module, "CHUNK_SIZE", 2)
         calls = {"n": 0}
-        real_get = lookup_module.get_ghcn_data
 
-        def flaky(station_id, target_date):
-            calls["n"] += 1
-            if calls["n"] > 2:
+        def flaky(station_id, start, end):
+            calls["n"] += 1  # one range read per chunk (same station-year)
+            if calls["n"] > 1:
                 raise KeyboardInterrupt  # simulate a hard crash mid-run
-            return {"TMAX": -16.0}
+            return _fixed_range(station_id, start, end)
 
-        monkeypatch.setattr(lookup_module, "get_ghcn_data", flaky)
+        monkeypatch.setattr(lookup_module, "get_ghcn_data_range", flaky)
         _write_csv(
             tmp_path / "in.csv",
             [{"zip": "10001", "date": f"2024-01-{15 + i:02d}"} for i in range(4)],
@@ -155,7 +163,6 @@ class TestStreaming:
             )
         rows = _read_csv(tmp_path / "out.csv")
         assert len(rows) == 2  # first chunk landed before the crash
-        monkeypatch.setattr(lookup_module, "get_ghcn_data", real_get)
 
 
 class TestLatLonColumns:
@@ -228,3 +235,154 @@ class TestParallel:
         assert _read_csv(tmp_path / "serial.csv") == _read_csv(
             tmp_path / "parallel.csv"
         )
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_flush_unit_is_chunk_size(self, city_db, tmp_path, monkeypatch, executor):
+        monkeypatch.setattr(batch_module, "CHUNK_SIZE", 2)
+        sizes = []
+        shards = batch_module._shards
+
+        def spy(chunk, n):
+            sizes.append(len(chunk))
+            return shards(chunk, n)
+
+        monkeypatch.setattr(batch_module, "_shards", spy)
+        rows_in = [{"zip": "10001", "date": f"2024-01-{d:02d}"} for d in range(1, 13)]
+        _write_csv(tmp_path / "in.csv", rows_in, ["zip", "date"])
+        process_csv(
+            tmp_path / "in.csv",
+            tmp_path / "out.csv",
+            date_column="date",
+            db=city_db,
+            parallel=True,
+            max_workers=3,
+            executor=executor,
+        )
+        assert sizes == [2] * 6
+
+    def test_process_pool_matches_serial(self, city_db, tmp_path, monkeypatch):
+        monkeypatch.setattr(batch_module, "CHUNK_SIZE", 7)
+        rows_in = [{"zip": "10001", "date": f"2024-01-{d:02d}"} for d in range(1, 20)]
+        rows_in[5] = {"zip": "", "date": "2024-01-06"}
+        _write_csv(tmp_path / "in.csv", rows_in, ["zip", "date"])
+        process_csv(
+            tmp_path / "in.csv",
+            tmp_path / "serial.csv",
+            date_column="date",
+            db=city_db,
+            parallel=False,
+        )
+        count = process_csv(
+            tmp_path / "in.csv",
+            tmp_path / "process.csv",
+            date_column="date",
+            db=city_db,
+            max_workers=3,
+            executor="process",
+        )
+        assert count == 19
+        rows = _read_csv(tmp_path / "process.csv")
+        assert [r["date"] for r in rows] == [r["date"] for r in rows_in]
+        assert rows[5]["weather_error"] == "missing location"
+        assert rows == _read_csv(tmp_path / "serial.csv")
+
+    def test_unknown_executor(self, city_db, tmp_path):
+        _write_csv(tmp_path / "in.csv", [], ["zip", "date"])
+        with pytest.raises(ValueError, match="executor"):
+            process_csv(
+                tmp_path / "in.csv",
+                tmp_path / "out.csv",
+                db=city_db,
+                executor="fiber",  # type: ignore[arg-type]
+            )
+
+
+class TestPlanner:
+    """Rows are grouped by station-year and scattered back in order."""
+
+    def test_station_year_read_once(self, city_db, tmp_path, monkeypatch):
+        reads = []
+
+        def counting(station_id, start, end):
+            reads.append((station_id, start, end))
+            # raw GHCN tenths: 100 -> 10.0 C on the span's first day
+            return {start: {"TMAX": 100.0}, end: {"TMAX": 50.0}}
+
+        monkeypatch.setattr(lookup_module, "get_ghcn_data_range", counting)
+        dates = ["2023-03-01", "2024-05-01", "2023-07-01", "2024-01-01"]
+        _write_csv(
+            tmp_path / "in.csv",
+            [{"zip": "10001", "date": d} for d in dates],
+            ["zip", "date"],
+        )
+        process_csv(
+            tmp_path / "in.csv",
+            tmp_path / "out.csv",
+            date_column="date",
+            db=city_db,
+            parallel=False,
+        )
+        assert sorted(reads) == [
+            ("GHCN1", date(2023, 3, 1), date(2023, 7, 1)),
+            ("GHCN1", date(2024, 1, 1), date(2024, 5, 1)),
+        ]
+        rows = _read_csv(tmp_path / "out.csv")
+        assert [r["date"] for r in rows] == dates
+        assert [r["tmax"] for r in rows] == ["10.0", "5.0", "5.0", "10.0"]
+
+
+class TestPrefetch:
+    """The input scan fetches each needed year/station-year once."""
+
+    def test_scan_queues_station_years(self, city_db, tmp_path, monkeypatch):
+        city_db.insert_station(
+            Station(id="GSOD1", name="GSOD", lat=40.7, lon=-74.0, type="USAF-WBAN")
+        )
+        city_db.set_closest_stations_bulk({"10001": [("GHCN1", 4000), ("GSOD1", 6000)]})
+        fetched = []
+        monkeypatch.setattr(
+            prefetch_module, "ensure_ghcn_year", lambda year: fetched.append(year)
+        )
+        monkeypatch.setattr(
+            prefetch_module,
+            "ensure_gsod_year",
+            lambda station_id, year: fetched.append((station_id, year)),
+        )
+
+        class Draining(prefetch_module.BackgroundPrefetch):
+            def close(self, wait=True):
+                # Let every queued fetch run before the pool shuts down
+                self.wait()
+                super().close(wait)
+
+        monkeypatch.setattr(batch_module, "BackgroundPrefetch", Draining)
+        dates = ["2023-03-01", "2024-05-01", "2023-07-01", "bad"]
+        _write_csv(
+            tmp_path / "in.csv",
+            [{"zip": "10001", "date": d} for d in dates],
+            ["zip", "date"],
+        )
+        process_csv(
+            tmp_path / "in.csv",
+            tmp_path / "out.csv",
+            date_column="date",
+            db=city_db,
+            prefetch=True,
+            prefetch_jobs=1,
+        )
+        # The scan stops once the job is done, so it may not get far
+        expected = [2023, ("GSOD1", 2023), 2024, ("GSOD1", 2024)]
+        assert fetched == expected[: len(fetched)]
+        rows = _read_csv(tmp_path / "out.csv")
+        assert [r["tmax"] for r in rows[:3]] == ["-1.6"] * 3
+
+    def test_invalid_prefetch_jobs(self, city_db, tmp_path):
+        _write_csv(tmp_path / "in.csv", [], ["zip", "date"])
+        with pytest.raises(ValueError, match="prefetch_jobs"):
+            process_csv(
+                tmp_path / "in.csv",
+                tmp_path / "out.csv",
+                db=city_db,
+                prefetch=True,
+                prefetch_jobs=0,
+            )
@@ -0,0 +1,154 @@
+"""Tests for the persistent CDO response cache and request counts."""
+
+import asyncio
+import threading
+from datetime import date
+
+import pytest
+import respx
+from httpx import Response
+
+from get_weather_data.api import noaa as noaa_module
+from get_weather_data.api.cdo_cache import CDOCache, response_key
+from get_weather_data.api.noaa import CDO_BASE_URL, AsyncNOAAClient, NOAAClient
+from get_weather_data.core.config import Config, set_config
+
+DATA_URL = f"{CDO_BASE_URL}/data"
+STATION = "GHCND:USW00094728"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config(tmp_path, monkeypatch):
+    monkeypatch.delenv("NCDC_TOKEN", raising=False)
+    set_config(Config(ncdc_token=None, data_dir=tmp_path, cache_dir=tmp_path))
+    # Each test starts with fresh per-token limiters
+    monkeypatch.setattr(noaa_module, "_limiters", {})
+    yield
+    set_config(Config(ncdc_token=None, data_dir=tmp_path, cache_dir=tmp_path))
+
+
+@pytest.fixture
+def store(tmp_path) -> CDOCache:
+    return CDOCache(tmp_path / "responses.sqlite")
+
+
+def _client(**kwargs) -> NOAAClient:
+    kwargs.setdefault("token", "test-token")
+    kwargs.setdefault("retry_delay", 0.0)
+    kwargs.setdefault("min_request_interval", 0.0)
+    return NOAAClient(**kwargs)
+
+
+def _payload() -> dict:
+    record = {
+        "date": "2020-01-15T00:00:00",
+        "datatype": "TMAX",
+        "station": STATION,
+        "value": 39,
+    }
+    return {"metadata": {"resultset": {"count": 1}}, "results": [record]}
+
+
+class TestCDOCache:
+    def test_round_trip(self, store):
+        store.put("k", [{"value": 1}], date(2000, 1, 31))
+        assert store.get("k") == [{"value": 1}]
+        assert store.get("other") is None
+        assert (store.hits, store.misses) == (1, 1)
+
+    def test_key_normalizes_params(self):
+        first = response_key(
+            "data", {"stationid": ["B", "A"], "startdate": "2020-01-01", "limit": 1000}
+        )
+        second = response_key(
+            "data", {"startdate": "2020-01-01", "stationid": ["A", "B"], "offset": 1}
+        )
+        assert first == second
+        assert first != response_key("stations", {"stationid": ["A", "B"]})
+
+    def test_final_year_never_expires(self, store):
+        set_config(Config(ncdc_token=None, cache_max_age_days=0))
+        store.put("old", [], date(2000, 12, 31))
+        assert store.get("old") == []
+
+    def test_recent_response_expires(self, store):
+        set_config(Config(ncdc_token=None, cache_max_age_days=0))
+        store.put("recent", [], date.today())
+        assert store.get("recent") is None
+
+    def test_requests_counted_per_token(self, store):
+        store.count_request("a")
+        store.count_request("a")
+        store.count_request("b")
+        assert store.requests_today("a") == 2
+        assert store.requests_today() == 3
+        store.clear()
+        assert store.requests_today("a") == 2
+
+
+class TestClientCaching:
+    @respx.mock
+    def test_repeat_query_costs_no_request(self):
+        route = respx.get(DATA_URL).mock(return_value=Response(200, json=_payload()))
+        first = _client().get_data_for_stations(
+            [STATION], date(2020, 1, 1), date(2020, 12, 31)
+        )
+        # A new client (a restarted process) answers from disk
+        client = _client()
+        again = client.get_data_for_stations(
+            [STATION], date(2020, 1, 1), date(2020, 12, 31)
+        )
+        assert again == first
+        assert route.call_count == 1
+        assert client.requests_today() == 1
+
+    def test_quota_carries_across_runs(self):
+        cache = CDOCache()
+        for _ in range(3):
+            cache.count_request("test-token")
+        client = _client(min_request_interval=0.5)
+        assert client.limiter.used_today == 3
+
+    @respx.mock
+    def test_async_client_keeps_sqlite_off_the_loop(self):
+        respx.get(DATA_URL).mock(return_value=Response(200, json=_payload()))
+        threads = []
+        client = AsyncNOAAClient(
+            token="test-token", retry_delay=0.0, min_request_interval=0.0
+        )
+        for name in ("get", "put", "count_request"):
+            method = getattr(client.cache, name)
+
+            def spy(*args, _method=method):
+                threads.append(threading.current_thread())
+                return _method(*args)
+
+            setattr(client.cache, name, spy)
+
+        async def main():
+            try:
+                return await client.get_data_for_stations(
+                    [STATION], date(2020, 1, 1), date(2020, 1, 31)
+                )
+            finally:
+                await client.aclose()
+
+        assert len(asyncio.run(main())) == 1
+        assert len(threads) == 3
+        assert threading.main_thread() not in threads
+        assert client.requests_today() == 1
+
+    @respx.mock
+    def test_disabled_by_config(self, tmp_path):
+        set_config(
+            Config(
+                ncdc_token=None, data_dir=tmp_path, cache_dir=tmp_path, cdo_cache=False
+            )
+        )
+        route = respx.get(DATA_URL).mock(return_value=Response(200, json=_payload()))
+        client = _client()
+        for _ in range(2):
+            client.get_data_for_stations([STATION], date(2020, 1, 1), date(2020, 1, 31))
+        assert client.cache is None
+        assert route.call_count == 2
+        assert client.requests_today() == 2
@@ -164,6 +164,39 @@ class TestCliCommands:
         assert "ghcn" in result.output
         assert "2.0 MB" in result.output
 
+    def test_cache_info_shows_cdo_requests(self, monkeypatch, tmp_path):
+        from get_weather_data.api.cdo_cache import CDOCache
+
+        set_config(Config(ncdc_token=None, data_dir=tmp_path, cache_dir=tmp_path))
+        monkeypatch.setattr(cache_module, "cache_info", list)
+        store = CDOCache()
+        store.count_request("token")
+        store.close()
+        result = CliRunner().invoke(cli, ["cache", "info"])
+        assert result.exit_code == 0
+        assert "CDO requests today (UTC): 1 of 10,000" in result.output
+
+    def test_cache_warm(self, monkeypatch):
+        from get_weather_data.weather.prefetch import YearPrefetch
+
+        class Warm(_FakeWeather):
+            def prefetch(self, years, jobs=None, progress=None):
+                outcomes = [YearPrefetch(y, 1.5, y == 2001) for y in years]
+                for i, outcome in enumerate(outcomes, 1):
+                    progress(outcome, i, len(outcomes))
+                return outcomes
+
+        monkeypatch.setattr(cli_module, "Weather", Warm)
+        result = CliRunner().invoke(cli, ["cache", "warm", "--years", "2000-2001"])
+        assert result.exit_code == 0
+        assert "[2/2] 2001 built" in result.output
+        assert "cached" in result.output
+
+    def test_cache_warm_bad_years(self):
+        result = CliRunner().invoke(cli, ["cache", "warm", "--years", "20x"])
+        assert result.exit_code == 1
+        assert "Invalid year" in result.output
+
     def test_cache_clear(self, monkeypatch):
         called = {}
 
@@ -217,14 +250,14 @@ class TestCli:
         assert "--online" in result.output
 
     @respx.mock
-    def test_get_online(self, monkeypatch):
+    def test_get_online(self, monkeypatch, tmp_path):
         """Test online get against a mocked CDO API."""
         monkeypatch.setenv("NCDC_TOKEN", "test-token")
         monkeypatch.setattr(
             "get_weather_data.weather.online._default_zip_coordinates",
             lambda: {"10001": (40.7484, -73.9967)},
         )
-        set_config(Config())
+        set_config(Config(cache_dir=tmp_path))
         station = "GHCND:USW00094728"
         respx.get(f"{CDO_BASE_URL}/stations").mock(
             return_value=Response(
@@ -38,8 +38,7 @@ def city_db(tmp_path) -> Database:
 
 @pytest.fixture(autouse=True)
 def _mock_data(monkeypatch):
-    lookup_module._cached_ghcn_data.cache_clear()
-    lookup_module._cached_gsod_data.cache_clear()
+    lookup_module.clear_value_caches()
     monkeypatch.setattr(
         lookup_module,
         "get_ghcn_data",
@@ -48,6 +47,14 @@ def _mock_data(monkeypatch):
     monkeypatch.setattr(
         lookup_module, "get_gsod_data", lambda station_id, target_date: {}
     )
+    monkeypatch.setattr(
+        lookup_module,
+        "get_ghcn_data_range",
+        lambda station_id, start, end: {start: {"TMAX": -16.0, "PRCP": 0.0}},
+    )
+    monkeypatch.setattr(
+        lookup_module, "get_gsod_data_range", lambda station_id, start, end: {}
+    )
 
 
 def _write_csv(path, rows, fieldnames):
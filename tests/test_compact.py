@@ -0,0 +1,113 @@
+"""Tests for the compact array-backed station tables."""
+
+import pytest
+
+from get_weather_data.core.compact import (
+    ClosestTable,
+    SortedKeys,
+    StationTable,
+    ZipcodeTable,
+    map_tables,
+    read_table_stamp,
+    write_tables,
+)
+
+
+class TestSortedKeys:
+    def test_index_and_getitem(self):
+        keys = SortedKeys.build(["10001", "02134", "9", "10001"])
+        assert len(keys) == 3
+        assert [keys[i] for i in range(len(keys))] == ["02134", "10001", "9"]
+        assert keys.index("10001") == 1
+        assert keys.index("9") == 2
+        assert keys.index("1000") == -1
+        assert keys.index("100011") == -1
+
+    def test_empty(self):
+        keys = SortedKeys.build([])
+        assert len(keys) == 0
+        assert keys.index("10001") == -1
+
+
+class TestTables:
+    def test_closest_matches_dict(self):
+        rows = [
+            ("10001", "USW00094728", 4000),
+            ("10001", "USC00305801", 1200),
+            ("10001", "USW00014732", 9000),
+            ("02134", "USW00014739", 8000),
+            ("02134", "USC00305801", 300000),
+        ]
+        table = ClosestTable.from_rows(rows)
+        assert table.get("10001") == [
+            ("USC00305801", 1200),
+            ("USW00094728", 4000),
+            ("USW00014732", 9000),
+        ]
+        assert table.get("02134") == [
+            ("USW00014739", 8000),
+            ("USC00305801", 300000),
+        ]
+        assert table.get("99999") == []
+        # Shared station ids are stored once
+        assert len(table.station_ids) == 4
+
+    def test_closest_rejects_oversized_distance(self):
+        with pytest.raises(ValueError, match="out of range"):
+            ClosestTable.from_rows([("10001", "X", 2**31)])
+
+    def test_station_and_zipcode_tables(self):
+        stations = StationTable.from_rows(
+            [
+                ("USW00094728", "NY CITY CNTRL PARK", "GHCND"),
+                ("725030-14732", "LA GUARDIA", "USAF-WBAN"),
+                ("USC00000001", None, "GHCND"),
+                ("USC00000002", "", "GHCND"),
+            ]
+        )
+        assert stations.get("725030-14732") == ("LA GUARDIA", "USAF-WBAN")
+        assert stations.get("USW00094728") == ("NY CITY CNTRL PARK", "GHCND")
+        # A NULL name stays None, as the dict cache returned
+        assert stations.get("USC00000001") == (None, "GHCND")
+        assert stations.get("USC00000002") == ("", "GHCND")
+        assert stations.get("NOPE") is None
+
+        zipcodes = ZipcodeTable.from_rows(
+            [("10001", 40.75, -73.99), ("00000", None, None)]
+        )
+        assert zipcodes.get("10001") == (40.75, -73.99)
+        assert zipcodes.get("00000") is None
+        assert len(zipcodes) == 1
+
+
+class TestMappedTables:
+    def test_round_trip(self, tmp_path):
+        stations = StationTable.from_rows(
+            [
+                ("USW00094728", "NY CITY CNTRL PARK", "GHCND"),
+                ("X", "Y", None),
+                ("Z", None, "GHCND"),
+            ]
+        )
+        zipcodes = ZipcodeTable.from_rows([("10001", 40.75, -73.99)])
+        closest = ClosestTable.from_rows(
+            [("10001", "USW00094728", 4000), ("10001", "X", 10)]
+        )
+        path = tmp_path / "w.tables"
+        write_tables(path, stations, zipcodes, closest, (7, 3, 1, 2))
+
+        assert read_table_stamp(path) == (7, 3, 1, 2)
+        mapped_stations, mapped_zipcodes, mapped_closest = map_tables(path)
+        assert mapped_stations.get("USW00094728") == stations.get("USW00094728")
+        assert mapped_stations.get("X") == ("Y", None)
+        assert mapped_stations.get("Z") == (None, "GHCND")
+        assert mapped_zipcodes.get("10001") == (40.75, -73.99)
+        assert mapped_closest.get("10001") == [("X", 10), ("USW00094728", 4000)]
+        assert mapped_closest.nbytes == closest.nbytes
+
+    def test_unreadable_file(self, tmp_path):
+        path = tmp_path / "w.tables"
+        path.write_bytes(b"not a tables file")
+        assert read_table_stamp(path) is None
+        with pytest.raises(ValueError, match="not a readable"):
+            map_tables(path)
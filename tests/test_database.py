@@ -102,3 +102,98 @@ class TestDatabase:
         assert len(closest) == 2
         assert closest[0] == ("USC00011084", 100)
         assert closest[1] == ("USW00013894", 50000)
+
+    def test_get_station_ids(self, temp_db, sample_stations):
+        """Test listing station IDs by type."""
+        temp_db.insert_stations_bulk(sample_stations)
+
+        assert temp_db.get_station_ids("GHCND") == {"USC00011084", "USC00016988"}
+        assert len(temp_db.get_station_ids()) == 3
+
+    def test_station_index_reused_until_insert(self, temp_db, sample_stations):
+        """The spatial index is built once and dropped on station inserts."""
+        temp_db.insert_stations_bulk(sample_stations)
+
+        index = temp_db.get_station_index("GHCND")
+        assert temp_db.get_station_index("GHCND") is index
+        assert {s.id for s in index.stations} == {"USC00011084", "USC00016988"}
+
+        temp_db.insert_station(
+            Station(id="NEW1", name="NEW", lat=31.0, lon=-87.0, type="GHCND")
+        )
+        rebuilt = temp_db.get_station_index("GHCND")
+        assert rebuilt is not index
+        assert "NEW1" in {s.id for s in rebuilt.stations}
+
+    def test_lazy_lookups_match_preloaded(self, temp_db, sample_stations):
+        """preload=False answers by key without loading whole tables."""
+        temp_db.insert_stations_bulk(sample_stations)
+        temp_db.insert_zipcode("36420", "Brewton", "AL", 31.0581, -87.0547)
+        temp_db.set_closest_stations_bulk(
+            {"36420": [("USW00013894", 50000), ("USC00011084", 100)]}
+        )
+
+        lazy = Database(temp_db.path, preload=False)
+        assert lazy.get_zipcode("36420") == (31.0581, -87.0547)
+        assert lazy.get_zipcode("99999") is None
+        assert lazy.get_closest_stations("36420") == [
+            ("USC00011084", 100),
+            ("USW00013894", 50000),
+        ]
+        assert lazy.get_station_info("USC00011084") == ("BREWTON", "GHCND")
+        assert lazy.get_station_info("NOPE") is None
+        assert lazy._station_cache is None
+        assert lazy._zipcode_cache is None
+        assert lazy._closest_cache is None
+
+        preloaded = Database(temp_db.path)
+        assert preloaded.get_closest_stations("36420") == lazy.get_closest_stations(
+            "36420"
+        )
+
+    def test_lazy_cache_sees_inserts(self, temp_db):
+        """A per-key miss is not served stale after an insert."""
+        lazy = Database(temp_db.path, preload=False)
+        assert lazy.get_zipcode("36420") is None
+        lazy.insert_zipcode("36420", "Brewton", "AL", 31.0581, -87.0547)
+        assert lazy.get_zipcode("36420") == (31.0581, -87.0547)
+
+    def test_saved_tables_are_mapped_until_changed(self, temp_db, sample_stations):
+        """Processes share the file save_compact_tables writes."""
+        temp_db.insert_stations_bulk(sample_stations)
+        temp_db.insert_zipcode("36420", "Brewton", "AL", 31.0581, -87.0547)
+        temp_db.set_closest_stations_bulk({"36420": [("USC00011084", 100)]})
+        path = temp_db.save_compact_tables()
+        assert path.exists()
+
+        fresh = Database(temp_db.path)
+        assert fresh.get_closest_stations("36420") == [("USC00011084", 100)]
+        assert isinstance(fresh._closest_cache._distances, memoryview)
+        assert fresh.get_station_info("USC00011084") == ("BREWTON", "GHCND")
+
+        fresh.insert_zipcode("10001", "New York", "NY", 40.75, -73.99)
+        assert not path.exists()
+        assert fresh.get_zipcode("10001") == (40.75, -73.99)
+
+    def test_stale_tables_ignored(self, temp_db, sample_stations):
+        """A tables file that no longer matches the row counts is skipped."""
+        temp_db.insert_stations_bulk(sample_stations[:1])
+        temp_db.save_compact_tables()
+        Database(temp_db.path).execute_many(
+            "INSERT INTO stations (id, name, type) VALUES (?, ?, ?)",
+            [("X1", "X", "GHCND")],
+        )
+        assert Database(temp_db.path).get_station_info("X1") == ("X", "GHCND")
+
+    def test_same_count_update_ignored(self, temp_db, sample_stations):
+        """A rewrite that keeps every row count still stales the file."""
+        temp_db.insert_stations_bulk(sample_stations)
+        temp_db.save_compact_tables()
+        temp_db.close()
+        assert Database(temp_db.path).compact_tables_current()
+        Database(temp_db.path).execute_many(
+            "UPDATE stations SET name = ? WHERE id = ?", [("RENAMED", "USC00011084")]
+        )
+        assert not Database(temp_db.path).compact_tables_current()
+        info = Database(temp_db.path).get_station_info("USC00011084")
+        assert info == ("RENAMED", "GHCND")
@@ -2,7 +2,10 @@
 
 import random
 
+import pytest
+
 from get_weather_data.core.distance import (
+    KDTREE_AVAILABLE,
     Station,
     StationIndex,
     _find_closest_brute,
@@ -76,6 +79,46 @@ class TestKDTreeRanking:
         assert [sd.station.id for sd in results] == ["NEAR"]
 
 
+@pytest.mark.skipif(not KDTREE_AVAILABLE, reason="needs numpy and scipy")
+class TestFindClosestMany:
+    """The batch query returns what per-point find_closest would."""
+
+    def test_matches_find_closest(self):
+        rng = random.Random(7)  # noqa: S311 - deterministic test fixture
+        stations = [
+            _station(f"S{i}", rng.uniform(25.0, 49.0), rng.uniform(-124.0, -67.0))
+            for i in range(300)
+        ]
+        index = StationIndex(stations)
+        lats = [rng.uniform(25.0, 49.0) for _ in range(50)]
+        lons = [rng.uniform(-124.0, -67.0) for _ in range(50)]
+        indices, distances = index.find_closest_many(lats, lons, n=4)
+        assert indices.shape == distances.shape == (50, 4)
+        for row, (lat, lon) in enumerate(zip(lats, lons, strict=True)):
+            expected = index.find_closest(lat, lon, n=4)
+            assert [index.stations[i].id for i in indices[row]] == [
+                sd.station.id for sd in expected
+            ]
+            assert distances[row].tolist() == [sd.distance_meters for sd in expected]
+
+    def test_max_distance_marks_slots(self):
+        index = StationIndex(
+            [_station("NEAR", 40.76, -73.99), _station("FAR", 42.0, -74.0)]
+        )
+        indices, distances = index.find_closest_many(
+            [40.75], [-73.99], n=5, max_distance_km=10
+        )
+        assert indices.shape == (1, 2)
+        assert index.stations[indices[0, 0]].id == "NEAR"
+        assert indices[0, 1] == -1
+        assert distances[0, 1] == -1
+
+    def test_single_station_index(self):
+        index = StationIndex([_station("ONLY", 40.0, -75.0)])
+        indices, _ = index.find_closest_many([41.0, 39.0], [-75.0, -74.0], n=3)
+        assert indices.tolist() == [[0], [0]]
+
+
 class TestMetersDistance:
     """Sanity checks for the equirectangular approximation."""
 
@@ -1,11 +1,22 @@
-"""Tests for download_with_retry."""
+"""Tests for download_with_retry, backoff and the pooled downloader."""
+
+import importlib
+import threading
 
 import httpx
 import pytest
 import respx
 from httpx import Response
 
-from get_weather_data.core.download import download_with_retry
+from get_weather_data.core.download import (
+    backoff_delay,
+    download_many,
+    download_with_retry,
+    get_client,
+)
+
+# The package re-exports the download() function under the module's name
+download_module = importlib.import_module("get_weather_data.core.download")
 
 URL = "https://example.com/file.gz"
 
@@ -51,3 +62,79 @@ class TestDownloadWithRetry:
     def test_transport_error_returns_none(self, tmp_path):
         respx.get(URL).mock(side_effect=httpx.ConnectError("boom"))
         assert download_with_retry(URL, tmp_path / "f.gz", max_retries=2) is None
+
+
+class TestBackoff:
+    def test_exponential_jittered_and_capped(self):
+        for attempt, full in [(0, 5.0), (1, 10.0), (2, 20.0), (10, 60.0)]:
+            delays = {backoff_delay(attempt) for _ in range(20)}
+            assert all(full / 2 <= d <= full for d in delays)
+            assert len(delays) > 1
+
+
+class TestPooledDownloads:
+    def test_client_is_shared(self):
+        assert get_client() is get_client()
+
+    @respx.mock
+    def test_download_many_in_order(self, tmp_path):
+        urls = [f"https://example.com/{i}.gz" for i in range(6)]
+        for i, url in enumerate(urls):
+            respx.get(url).mock(
+                return_value=Response(404 if i == 2 else 200, content=b"%d" % i)
+            )
+        paths = download_many(
+            [(url, tmp_path / f"{i}.gz") for i, url in enumerate(urls)], max_workers=3
+        )
+        assert paths[2] is None
+        assert [p.read_bytes() for p in paths if p is not None] == [
+            b"0",
+            b"1",
+            b"3",
+            b"4",
+            b"5",
+        ]
+
+    @respx.mock
+    def test_per_host_limit(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(download_module, "PER_HOST_LIMIT", 2)
+        active = peak = 0
+        guard = threading.Lock()
+
+        def slow(request):
+            nonlocal active, peak
+            with guard:
+                active += 1
+                peak = max(peak, active)
+            threading.Event().wait(0.05)  # time.sleep is patched out
+            with guard:
+                active -= 1
+            return Response(200, content=b"x")
+
+        respx.get(url__regex=r"https://limited\.example/").mock(side_effect=slow)
+        paths = download_many(
+            [(f"https://limited.example/{i}", tmp_path / f"{i}") for i in range(8)],
+            max_workers=8,
+        )
+        assert all(paths)
+        assert peak == 2
+
+    def test_custom_fetch(self, tmp_path):
+        seen = []
+        guard = threading.Lock()
+
+        def fetch(name):
+            with guard:
+                seen.append(name)
+            return None if name == "b" else tmp_path / name
+
+        assert download_many("abc", max_workers=2, fetch=fetch) == [
+            tmp_path / "a",
+            None,
+            tmp_path / "c",
+        ]
+        assert sorted(seen) == ["a", "b", "c"]
+
+    def test_rejects_bad_workers(self):
+        with pytest.raises(ValueError, match="max_workers"):
+            download_many([("https://example.com/x", "x")], max_workers=0)
@@ -33,8 +33,10 @@ class TestResultsToFrame:
     def test_columns_and_types(self, city_db, monkeypatch):
         monkeypatch.setattr(
             lookup_module,
-            "get_ghcn_data",
-            lambda station_id, target_date: {"TMAX": -16.0, "PRCP": 0.0},
+            "get_ghcn_data_range",
+            lambda station_id, start, end: {
+                date(2024, 1, d): {"TMAX": -16.0, "PRCP": 0.0} for d in (15, 16, 17)
+            },
         )
         lookup = WeatherLookup(db=city_db, use_cache=False, use_gsod=False)
         results = lookup.get_weather_range("10001", DAY, date(2024, 1, 17))
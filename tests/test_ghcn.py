@@ -2,6 +2,7 @@
 
 import csv
 import gzip
+import http.server
 import io
 import sqlite3
 import threading
@@ -12,6 +13,8 @@ import respx
 from httpx import Response
 
 from get_weather_data.core.config import Config, set_config
+from get_weather_data.core.database import Database
+from get_weather_data.core.distance import Station
 from get_weather_data.weather import ghcn
 
 
@@ -20,10 +23,11 @@ def _isolated_config(tmp_path, monkeypatch):
     """Point caches at a temp dir and reset module-level pools."""
     monkeypatch.delenv("NCDC_TOKEN", raising=False)
     set_config(Config(ncdc_token=None, data_dir=tmp_path, cache_dir=tmp_path))
-    ghcn._year_locks.clear()
+    ghcn._columnar_years.clear()
     if hasattr(ghcn._connections, "pool"):
         del ghcn._connections.pool
     yield
+    ghcn._columnar_years.clear()
     if hasattr(ghcn._connections, "pool"):
         del ghcn._connections.pool
 
@@ -171,8 +175,318 @@ class TestReadOnlyPool:
         )
         ghcn.get_ghcn_data("USW00094728", date(2010, 1, 15))
         pool = ghcn._connections.pool
-        conn = pool[2010]
+        _identity, conn = pool[ghcn._get_ghcn_db_path(2010)]
         ghcn.get_ghcn_data("USW00094728", date(2010, 1, 16))
-        assert ghcn._connections.pool[2010] is conn
+        assert ghcn._connections.pool[ghcn._get_ghcn_db_path(2010)][1] is conn
         with pytest.raises(sqlite3.OperationalError):
             conn.execute("CREATE TABLE nope (x)")
+
+
+@pytest.mark.parametrize("engine", ["sqlite", "columnar"])
+@respx.mock
+def test_rebuilt_year_is_reopened(engine, tmp_path):
+    set_config(
+        Config(
+            ncdc_token=None,
+            data_dir=tmp_path,
+            cache_dir=tmp_path,
+            ghcn_engine=engine,
+            cache_max_age_days=0,  # every read finds the current year stale
+        )
+    )
+    day = date.today().replace(month=1, day=1)
+    archives = [
+        Response(
+            200,
+            content=_year_gz_bytes(
+                [("USW1", f"{day:%Y%m%d}", "TMAX", value, "", "", "W", "")]
+            ),
+        )
+        for value in ("10", "20")
+    ]
+    respx.get(ghcn.GHCN_BY_YEAR_URL.format(year=day.year)).mock(side_effect=archives)
+    assert ghcn.get_ghcn_data("USW1", day)["TMAX"] == 10.0
+    # The rebuild replaced the store the first read opened
+    assert ghcn.get_ghcn_data("USW1", day)["TMAX"] == 20.0
+
+
+class TestColumnarEngine:
+    """The columnar store answers exactly like the SQLite table."""
+
+    @pytest.fixture(autouse=True)
+    def _columnar(self, tmp_path):
+        set_config(
+            Config(
+                ncdc_token=None,
+                data_dir=tmp_path,
+                cache_dir=tmp_path,
+                ghcn_engine="columnar",
+            )
+        )
+
+    @respx.mock
+    def test_values_flags_and_zero(self):
+        respx.get(ghcn.GHCN_BY_YEAR_URL.format(year=2016)).mock(
+            return_value=Response(
+                200,
+                content=_year_gz_bytes(
+                    [
+                        # deliberately unsorted, with another station between
+                        ("USW1", "20160116", "TMAX", "5", "", "", "W", ""),
+                        ("USW2", "20160115", "TMAX", "99", "", "", "W", ""),
+                        ("USW1", "20160115", "TMIN", "-40", "", "G", "W", ""),
+                        ("USW1", "20160115", "TMAX", "-10", "", "", "W", ""),
+                        ("USW1", "20160115", "PRCP", "0", "", "", "W", ""),
+                        ("USW1", "20160115", "SNOW", "-9999", "", "", "W", ""),
+                        ("USW1", "20160115", "WT01", "1", "", "", "W", ""),
+                    ]
+                ),
+            )
+        )
+        day = date(2016, 1, 15)
+        values = ghcn.get_ghcn_data("USW1", day)
+        assert values["TMAX"] == -10.0
+        assert values["PRCP"] == 0.0
+        assert values["TMIN"] is None  # failed QC
+        assert values["SNOW"] is None  # missing sentinel
+        assert ghcn.get_ghcn_flags("USW1", day) == {
+            "TMAX": "",
+            "TMIN": "G",
+            "PRCP": "",
+        }
+        assert ghcn.get_ghcn_weather_types("USW1", day) == {"fog"}
+        assert ghcn.get_ghcn_data("USW1", date(2016, 1, 16))["TMAX"] == 5.0
+        assert ghcn.get_ghcn_data("USW2", day)["TMAX"] == 99.0
+        assert ghcn.get_ghcn_data("NOPE", day)["TMAX"] is None
+
+        path = ghcn._get_ghcn_db_path(2016)
+        assert path.suffix == ".cols"
+        assert not (path.parent / "2016.csv.gz").exists()
+
+    @respx.mock
+    def test_store_shared_across_threads(self):
+        respx.get(ghcn.GHCN_BY_YEAR_URL.format(year=2010)).mock(
+            return_value=Response(200, content=_year_gz_bytes(ROWS))
+        )
+        ghcn.get_ghcn_data("USW00094728", date(2010, 1, 15))
+        _identity, store = ghcn._columnar_years[ghcn._get_ghcn_db_path(2010)]
+
+        seen: list[object] = []
+        thread = threading.Thread(
+            target=lambda: seen.append(
+                ghcn.get_ghcn_data("USW00094728", date(2010, 1, 15))["TMAX"]
+            )
+        )
+        thread.start()
+        thread.join()
+        assert seen == [-10.0]
+        assert ghcn._columnar_years[ghcn._get_ghcn_db_path(2010)][1] is store
+
+    def test_unknown_engine_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="ghcn_engine"):
+            Config(data_dir=tmp_path, cache_dir=tmp_path, ghcn_engine="parquet")  # type: ignore[arg-type]
+
+
+class TestFilteredIngest:
+    """Filtered builds keep only station-DB stations and read elements."""
+
+    ROWS = [
+        ("USW1", "20170115", "TMAX", "-10", "", "", "W", ""),
+        ("USW1", "20170115", "WT03", "1", "", "", "W", ""),
+        ("USW1", "20170115", "EVAP", "12", "", "", "W", ""),  # never read
+        ("FOREIGN1", "20170115", "TMAX", "300", "", "", "W", ""),  # not in DB
+    ]
+
+    @pytest.fixture(autouse=True)
+    def _filtered(self, tmp_path):
+        set_config(
+            Config(
+                ncdc_token=None,
+                data_dir=tmp_path,
+                cache_dir=tmp_path,
+                ghcn_filtered_ingest=True,
+            )
+        )
+
+    def _seed_stations(self, tmp_path):
+        db = Database(tmp_path / "weather.db")
+        db.init_schema()
+        db.insert_station(
+            Station(id="USW1", name="KEPT", lat=40.0, lon=-74.0, type="GHCND")
+        )
+        db.close()
+
+    @respx.mock
+    def test_drops_unknown_stations_and_elements(self, tmp_path):
+        self._seed_stations(tmp_path)
+        respx.get(ghcn.GHCN_BY_YEAR_URL.format(year=2017)).mock(
+            return_value=Response(200, content=_year_gz_bytes(self.ROWS))
+        )
+        day = date(2017, 1, 15)
+        assert ghcn.get_ghcn_data("USW1", day)["TMAX"] == -10.0
+        assert ghcn.get_ghcn_weather_types("USW1", day) == {"thunder"}
+        assert ghcn.get_ghcn_data("FOREIGN1", day)["TMAX"] is None
+
+        db_path = ghcn._get_ghcn_db_path(2017)
+        assert db_path.name.startswith("ghcn_2017-filtered-")
+        conn = sqlite3.connect(db_path)
+        stored = conn.execute("SELECT id, element FROM ghcn_2017").fetchall()
+        conn.close()
+        assert sorted(stored) == [("USW1", "TMAX"), ("USW1", "WT03")]
+
+    @respx.mock
+    def test_new_stations_rebuild_filtered_year(self, tmp_path):
+        self._seed_stations(tmp_path)
+        respx.get(ghcn.GHCN_BY_YEAR_URL.format(year=2017)).mock(
+            return_value=Response(200, content=_year_gz_bytes(self.ROWS))
+        )
+        day = date(2017, 1, 15)
+        assert ghcn.get_ghcn_data("FOREIGN1", day)["TMAX"] is None
+        first = ghcn._get_ghcn_db_path(2017)
+
+        db = Database(tmp_path / "weather.db")
+        db.insert_station(
+            Station(id="FOREIGN1", name="ADDED", lat=41.0, lon=-74.0, type="GHCND")
+        )
+        db.close()
+        assert ghcn.get_ghcn_data("FOREIGN1", day)["TMAX"] == 300.0
+        assert ghcn._get_ghcn_db_path(2017) != first
+        assert not first.exists()
+
+    @respx.mock
+    def test_reads_reuse_located_store(self, tmp_path, monkeypatch):
+        self._seed_stations(tmp_path)
+        respx.get(ghcn.GHCN_BY_YEAR_URL.format(year=2017)).mock(
+            return_value=Response(200, content=_year_gz_bytes(self.ROWS))
+        )
+        day = date(2017, 1, 15)
+        assert ghcn.get_ghcn_data("USW1", day)["TMAX"] == -10.0
+        checks = []
+        station_filter = ghcn._station_filter
+        monkeypatch.setattr(
+            ghcn, "_station_filter", lambda: checks.append(1) or station_filter()
+        )
+        for _ in range(3):
+            assert ghcn.get_ghcn_data("USW1", day)["TMAX"] == -10.0
+        assert checks == []
+
+    @respx.mock
+    def test_without_station_db_builds_unfiltered(self):
+        respx.get(ghcn.GHCN_BY_YEAR_URL.format(year=2017)).mock(
+            return_value=Response(200, content=_year_gz_bytes(self.ROWS))
+        )
+        values = ghcn.get_ghcn_data("FOREIGN1", date(2017, 1, 15))
+        assert values["TMAX"] == 300.0
+
+
+class TestRangeReads:
+    """A station's span comes back in one read, on either engine."""
+
+    SPAN_ROWS = [
+        ("USW1", "20180101", "TMAX", "10", "", "", "W", ""),
+        ("USW1", "20180102", "TMAX", "20", "", "G", "W", ""),
+        ("USW1", "20180102", "WT01", "1", "", "", "W", ""),
+        ("USW1", "20180104", "TMAX", "40", "", "", "W", ""),
+        ("USW2", "20180102", "TMAX", "99", "", "", "W", ""),
+    ]
+
+    @pytest.fixture(params=["sqlite", "columnar"])
+    def engine(self, request, tmp_path):
+        set_config(
+            Config(
+                ncdc_token=None,
+                data_dir=tmp_path,
+                cache_dir=tmp_path,
+                ghcn_engine=request.param,
+            )
+        )
+        return request.param
+
+    @respx.mock
+    def test_span(self, engine):
+        respx.get(ghcn.GHCN_BY_YEAR_URL.format(year=2018)).mock(
+            return_value=Response(200, content=_year_gz_bytes(self.SPAN_ROWS))
+        )
+        start, end = date(2018, 1, 2), date(2018, 1, 4)
+        series = ghcn.get_ghcn_data_range("USW1", start, end, elements=["TMAX"])
+        # Jan 1 is outside the span; Jan 2 is QC-flagged; Jan 3 is absent
+        assert series == {
+            date(2018, 1, 2): {"TMAX": None},
+            date(2018, 1, 4): {"TMAX": 40.0},
+        }
+        flags = ghcn.get_ghcn_flags_range("USW1", start, end, elements=["TMAX"])
+        assert flags == {
+            date(2018, 1, 2): {"TMAX": "G"},
+            date(2018, 1, 4): {"TMAX": ""},
+        }
+        assert ghcn.get_ghcn_weather_types_range("USW1", start, end) == {
+            date(2018, 1, 2): {"fog"}
+        }
+
+
+class _ArchiveHandler(http.server.BaseHTTPRequestHandler):
+    """Serves ``payload`` in small flushed pieces, like a slow network."""
+
+    payload = b""
+    truncate = False
+    requests = 0
+
+    def do_GET(self):
+        type(self).requests += 1
+        body = self.payload[: len(self.payload) // 2] if self.truncate else self.payload
+        self.send_response(200)
+        self.send_header("Content-Type", "application/gzip")
+        self.send_header("Content-Length", str(len(self.payload)))
+        self.end_headers()
+        for i in range(0, len(body), 7):
+            self.wfile.write(body[i : i + 7])
+            self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestStreamingIngest:
+    """Years build straight from the HTTP stream, with no archive on disk."""
+
+    @pytest.fixture
+    def server(self, monkeypatch):
+        _ArchiveHandler.requests = 0
+        _ArchiveHandler.truncate = False
+        httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _ArchiveHandler)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        host, port = httpd.server_address
+        monkeypatch.setattr(
+            ghcn, "GHCN_BY_YEAR_URL", f"http://{host}:{port}/{{year}}.csv.gz"
+        )
+        yield _ArchiveHandler
+        httpd.shutdown()
+        httpd.server_close()
+
+    def test_builds_from_stream(self, server, tmp_path):
+        # Two gzip members, as concatenated archives arrive
+        server.payload = _year_gz_bytes(ROWS[:1]) + _year_gz_bytes(ROWS[1:])
+        values = ghcn.get_ghcn_data("USW00094728", date(2010, 1, 15))
+        assert values["TMAX"] == -10.0
+        assert values["PRCP"] == 0.0
+        assert server.requests == 1
+        assert list(tmp_path.rglob("*.csv.gz")) == []
+
+    def test_truncated_stream_retried_then_fails(self, server, monkeypatch):
+        server.payload = _year_gz_bytes(ROWS * 50)
+        server.truncate = True
+        sleeps = []
+        monkeypatch.setattr(ghcn.time, "sleep", sleeps.append)
+        monkeypatch.setattr(ghcn, "backoff_delay", lambda attempt: attempt + 0.5)
+        with pytest.raises(RuntimeError, match="Failed to download"):
+            ghcn.get_ghcn_data("USW00094728", date(2010, 1, 15))
+        assert server.requests == ghcn.STREAM_RETRIES
+        assert sleeps == [i + 0.5 for i in range(ghcn.STREAM_RETRIES - 1)]
+        assert not ghcn._get_ghcn_db_path(2010).exists()
+        assert list(ghcn._get_ghcn_db_path(2010).parent.glob("*.tmp-*")) == []
+
+    def test_gunzip_lines_byte_by_byte(self):
+        data = _year_gz_bytes(ROWS)
+        lines = list(ghcn._gunzip_lines(data[i : i + 1] for i in range(len(data))))
+        assert list(csv.reader(lines)) == [list(r) for r in ROWS]
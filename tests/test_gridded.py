@@ -8,11 +8,14 @@ import pytest
 pytest.importorskip("xarray")
 import xarray as xr
 
+from get_weather_data.core.config import Config, set_config
+from get_weather_data.weather.grid_cache import GridCache
 from get_weather_data.weather.gridded import (
     GRID_VARS,
     OPENDAP_URL,
     GriddedLookup,
     _iter_months,
+    _nearest_indices,
     in_conus,
 )
 
@@ -20,6 +23,13 @@ LAT = np.array([40.0, 40.5, 41.0])
 LON = np.array([-74.0, -73.5, -73.0])
 
 
+@pytest.fixture(autouse=True)
+def _isolated_config(tmp_path):
+    set_config(Config(ncdc_token=None, data_dir=tmp_path, cache_dir=tmp_path))
+    yield
+    set_config(Config(ncdc_token=None, data_dir=tmp_path, cache_dir=tmp_path))
+
+
 def _month_dataset(year: int, month: int) -> xr.Dataset:
     """A small nClimGrid-shaped month where tmax encodes the cell + day."""
     if month == 12:
@@ -65,6 +75,13 @@ class TestHelpers:
         months = list(_iter_months(date(2023, 11, 5), date(2024, 2, 3)))
         assert months == [(2023, 11), (2023, 12), (2024, 1), (2024, 2)]
 
+    @pytest.mark.parametrize("axis", [LAT, LAT[::-1]])
+    def test_nearest_indices_match_sel(self, axis):
+        values = np.array([39.0, 40.2, 40.25, 40.75, 40.9, 42.0])
+        cells = xr.DataArray(np.arange(axis.size), coords={"lat": axis}, dims="lat")
+        expected = cells.sel(lat=xr.DataArray(values, dims="point"), method="nearest")
+        assert _nearest_indices(axis, values).tolist() == expected.values.tolist()
+
 
 class TestGriddedLookup:
     def test_selects_nearest_cell(self):
@@ -94,6 +111,15 @@ class TestGriddedLookup:
         assert results[0].tmax == 100 + 10 + 31  # Jan 31
         assert results[1].tmax == 100 + 10 + 1  # Feb 1
 
+    def test_end_before_start_is_empty(self):
+        lookup = _lookup(dataset_opener=lambda y, m: pytest.fail("grid opened"))
+        start, end = date(2024, 1, 16), date(2024, 1, 15)
+        assert lookup.get_weather_range((40.4, -73.6), start, end) == []
+        assert lookup.get_weather_many([(40.4, -73.6), "10001"], start, end) == [
+            [],
+            [],
+        ]
+
     def test_out_of_conus_returns_bare(self):
         result = _lookup().get_weather((61.2, -149.9), date(2024, 1, 15))  # Anchorage
         assert result.tmax is None
@@ -123,5 +149,109 @@ class TestGriddedLookup:
         assert result.tmax is None
 
 
+class TestGriddedMany:
+    def test_matches_single_point_lookups(self):
+        lookup = _lookup()
+        locations = [(40.4, -73.6), "10001", (40.9, -74.2), (61.2, -149.9), "99999"]
+        start, end = date(2024, 1, 30), date(2024, 2, 2)
+        results = lookup.get_weather_many(locations, start, end)
+        assert results == [
+            lookup.get_weather_range(location, start, end) for location in locations
+        ]
+        assert [r.tmax for r in results[2]] == [230, 231, 201, 202]  # i=2, j=0
+        assert results[3][0].tmax is None  # outside CONUS
+
+    def test_each_month_opened_once(self):
+        opened = []
+
+        def opener(year, month):
+            opened.append((year, month))
+            return _month_dataset(year, month)
+
+        points = [(40.0 + 0.1 * i, -74.0 + 0.1 * i) for i in range(10)]
+        results = _lookup(dataset_opener=opener).get_weather_many(
+            points, date(2024, 1, 31), date(2024, 2, 1)
+        )
+        assert opened == [(2024, 1), (2024, 2)]
+        assert len(results) == 10
+        assert results[9][1].tmax == 100 * 2 + 10 * 2 + 1
+
+
+class TestGridCache:
+    @staticmethod
+    def _counting_opener(opened: list):
+        def opener(year, month):
+            opened.append((year, month))
+            return _month_dataset(year, month)
+
+        return opener
+
+    def test_repeat_query_read_from_disk(self, tmp_path):
+        opened = []
+        lookup = _lookup(
+            dataset_opener=self._counting_opener(opened),
+            cache=GridCache(tmp_path / "grid"),
+        )
+        start, end = date(2020, 1, 30), date(2020, 2, 2)
+        first = lookup.get_weather_range((40.4, -73.6), start, end)
+        assert opened == [(2020, 1), (2020, 2)]
+        # Offline: the opener is no longer needed for cached cells
+        offline = _lookup(dataset_opener=lambda y, m: None, cache=lookup.cache)
+        assert offline.get_weather_range((40.4, -73.6), start, end) == first
+        assert [r.tmax for r in first] == [140, 141, 111, 112]
+
+    def test_new_cells_merged_into_month(self, tmp_path):
+        opened = []
+        cache = GridCache(tmp_path / "grid")
+        lookup = _lookup(dataset_opener=self._counting_opener(opened), cache=cache)
+        day = date(2020, 1, 15)
+        lookup.get_weather((40.4, -73.6), day)
+        lookup.get_weather((40.9, -74.2), day, ["TMAX"])
+        assert len(opened) == 2
+        results = lookup.get_weather_many([(40.4, -73.6), (40.9, -74.2)], day, day)
+        assert len(opened) == 2
+        assert [r[0].tmax for r in results] == [125, 215]
+        # Every grid variable is stored, chunked for point time series
+        cells = xr.open_dataset(tmp_path / "grid" / "ncdd-202001-cells.nc")
+        with cells:
+            assert set(GRID_VARS.values()) <= set(cells.data_vars)
+            assert cells["tmax"].encoding["chunksizes"] == (2, 31)
+
+    def test_recent_month_expires(self, tmp_path):
+        set_config(Config(ncdc_token=None, cache_dir=tmp_path, cache_max_age_days=0))
+        opened = []
+        lookup = _lookup(
+            dataset_opener=self._counting_opener(opened),
+            cache=GridCache(tmp_path / "grid"),
+        )
+        day = date.today().replace(day=1)
+        lookup.get_weather((40.4, -73.6), day)
+        lookup.get_weather((40.4, -73.6), day)
+        assert len(opened) == 2
+
+    def test_refetched_month_keeps_stored_cells(self, tmp_path):
+        set_config(Config(ncdc_token=None, cache_dir=tmp_path, cache_max_age_days=0))
+        opened = []
+        lookup = _lookup(
+            dataset_opener=self._counting_opener(opened),
+            cache=GridCache(tmp_path / "grid"),
+        )
+        day = date.today().replace(day=1)
+        lookup.get_weather((40.4, -73.6), day)
+        lookup.get_weather((40.9, -74.2), day)
+        assert len(opened) == 2
+        # The second refetch rewrote the month with the first cell too
+        cells = lookup.cache.load(day.year, day.month, include_expired=True)
+        found = cells.locate(np.array([1, 2]), np.array([1, 0]))
+        assert cells.rows.size == 2
+        assert cells.values["tmax"][found, 0].tolist() == [111, 201]
+
+    def test_default_opener_only(self, tmp_path):
+        assert _lookup().cache is None
+        assert GriddedLookup().cache.path == tmp_path / "nclimgrid"
+        set_config(Config(ncdc_token=None, cache_dir=tmp_path, grid_cache=False))
+        assert GriddedLookup().cache is None
+
+
 def test_grid_vars_cover_core_elements():
     assert set(GRID_VARS) == {"TMAX", "TMIN", "TAVG", "PRCP"}
@@ -1,29 +1,43 @@
 """Tests for the GSOD CSV parser and unit conversion."""
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
 import pytest
 
+from get_weather_data.core.config import Config, set_config
 from get_weather_data.weather import gsod as gsod_module
-from get_weather_data.weather.gsod import get_gsod_data
+from get_weather_data.weather.gsod import (
+    clear_gsod_year_cache,
+    get_gsod_data,
+    get_gsod_data_range,
+    get_gsod_weather_types,
+    gsod_year_cache_info,
+)
 from get_weather_data.weather.units import KNOTS_TO_MS
 
 DAY = date(2024, 1, 15)
 
-HEADER = "STATION,DATE,TEMP,DEWP,SLP,STP,VISIB,WDSP,MXSPD,GUST,MAX,MIN,PRCP,SNDP\n"
+HEADER = (
+    "STATION,DATE,TEMP,DEWP,SLP,STP,VISIB,WDSP,MXSPD,GUST,MAX,MIN,PRCP,SNDP,FRSHTT\n"
+)
 # TEMP 50F, DEWP 41F, SLP 1013.2, STP 987.6, VISIB 10, WDSP 10kn, MXSPD 999.9(missing),
 # GUST 20kn, MAX 68F, MIN 32F, PRCP 0.50, SNDP 999.9(missing)
 ROW = (
     "725030,2024-01-15,50.0,41.0,1013.2,987.6,10.0,10.0,999.9,20.0,"
-    "68.0,32.0,0.50,999.9\n"
+    "68.0,32.0,0.50,999.9,010000\n"
 )
 OTHER = (
-    "725030,2024-01-16,60.0,50.0,1010.0,985.0,9.0,8.0,12.0,15.0,70.0,40.0,0.00,0.0\n"
+    "725030,2024-01-16,60.0,50.0,1010.0,985.0,9.0,8.0,12.0,15.0,"
+    "70.0,40.0,0.00,0.0,000000\n"
 )
 
 
 @pytest.fixture
 def gsod_file(tmp_path, monkeypatch):
+    clear_gsod_year_cache()
     path = tmp_path / "725030.csv"
     path.write_text(HEADER + ROW + OTHER)
     monkeypatch.setattr(gsod_module, "_ensure_gsod_file", lambda sid, yr: path)
@@ -62,3 +76,106 @@ class TestGetGsodData:
         monkeypatch.setattr(gsod_module, "_ensure_gsod_file", lambda sid, yr: None)
         data = get_gsod_data("725030", DAY)
         assert all(v is None for v in data.values())
+
+
+class TestGetGsodDataRange:
+    def test_span(self, gsod_file):
+        series = get_gsod_data_range("725030", DAY, date(2024, 1, 20))
+        assert sorted(series) == [DAY, date(2024, 1, 16)]
+        assert series[DAY] == get_gsod_data("725030", DAY)
+        assert series[date(2024, 1, 16)]["max_temp"] == pytest.approx(
+            (70.0 - 32) * 5 / 9
+        )
+
+    def test_outside_span(self, gsod_file):
+        assert get_gsod_data_range("725030", date(2024, 2, 1), date(2024, 2, 5)) == {}
+
+
+class TestParsedYearCache:
+    def test_file_parsed_once(self, gsod_file):
+        get_gsod_data("725030", DAY)
+        get_gsod_data("725030", date(2024, 1, 16), convert_units=False)
+        assert get_gsod_weather_types("725030", DAY) == {"rain"}
+        get_gsod_data_range("725030", DAY, date(2024, 1, 20))
+        info = gsod_year_cache_info()
+        assert info.misses == 1
+        assert info.hits == 3
+
+    def test_rewritten_file_is_reparsed(self, gsod_file):
+        assert get_gsod_data("725030", date(2024, 1, 16))["temp"] is not None
+        gsod_file.write_text(HEADER + ROW)
+        stat = gsod_file.stat()
+        os.utime(gsod_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert get_gsod_data("725030", date(2024, 1, 16))["temp"] is None
+
+    def test_other_process_maps_saved_parse(self, gsod_file, monkeypatch):
+        before = get_gsod_data("725030", DAY)
+        assert gsod_file.with_suffix(".days").exists()
+        # A fresh process starts with an empty cache and must not reparse.
+        clear_gsod_year_cache()
+
+        def parse(*args):
+            raise AssertionError("reparsed")
+
+        monkeypatch.setattr(gsod_module._GsodYear, "parse", parse)
+        assert get_gsod_data("725030", DAY) == before
+        assert get_gsod_weather_types("725030", DAY) == {"rain"}
+
+    def test_saved_parse_of_old_file_is_ignored(self, gsod_file):
+        get_gsod_data("725030", date(2024, 1, 16))
+        clear_gsod_year_cache()
+        gsod_file.write_text(HEADER + ROW)
+        stat = gsod_file.stat()
+        os.utime(gsod_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert get_gsod_data("725030", date(2024, 1, 16))["temp"] is None
+
+    def test_read_only_cache_still_parses(self, gsod_file, monkeypatch):
+        monkeypatch.setattr(gsod_module._GsodYear, "save", lambda *args: False)
+        assert get_gsod_data("725030", DAY)["temp"] == pytest.approx(10.0)
+        assert not gsod_file.with_suffix(".days").exists()
+
+
+class TestConcurrentFetch:
+    def test_one_download_for_concurrent_misses(self, tmp_path, monkeypatch):
+        set_config(Config(ncdc_token=None, data_dir=tmp_path, cache_dir=tmp_path))
+        clear_gsod_year_cache()
+        calls = []
+
+        def slow_download(url, path):
+            calls.append(url)
+            threading.Event().wait(0.1)
+            path.write_text(HEADER + ROW)
+            return path
+
+        monkeypatch.setattr(gsod_module, "download_with_retry", slow_download)
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(
+                pool.map(lambda _: get_gsod_data("725030-14732", DAY), range(6))
+            )
+        assert len(calls) == 1
+        assert all(r == results[0] for r in results)
+        assert results[0]["temp"] == pytest.approx(10.0)
+
+    def test_bulk_and_single_callers_share_downloads(self, tmp_path, monkeypatch):
+        set_config(Config(ncdc_token=None, data_dir=tmp_path, cache_dir=tmp_path))
+        clear_gsod_year_cache()
+        calls = []
+
+        def slow_download(url, path):
+            calls.append(url)
+            threading.Event().wait(0.1)
+            path.write_text(HEADER + ROW)
+            return path
+
+        monkeypatch.setattr(gsod_module, "download_with_retry", slow_download)
+        wanted = [("725030-14732", 2023), ("725030-14732", 2024)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            bulk = [
+                pool.submit(gsod_module.ensure_gsod_files, wanted) for _ in range(3)
+            ]
+            single = pool.submit(get_gsod_data, "725030-14732", DAY)
+            results = [future.result() for future in bulk]
+        assert len(calls) == 2
+        assert all(r == results[0] for r in results)
+        assert None not in results[0].values()
+        assert single.result()["temp"] == pytest.approx(10.0)
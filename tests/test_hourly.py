@@ -1,6 +1,8 @@
 """Tests for hourly ISD-Lite parsing, lookup, and output."""
 
 import gzip
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime
 
 import pytest
@@ -105,6 +107,46 @@ class TestEnsureIsdFile:
         respx.get(url).mock(return_value=Response(404))
         assert isd_module._ensure_isd_file("000000-00000", 2023) is None
 
+    @respx.mock
+    def test_bulk_fetches_only_missing(self):
+        cached = isd_module._get_isd_file_path("725030-14732", 2021)
+        cached.parent.mkdir(parents=True)
+        cached.write_bytes(b"")
+        ok = isd_module.ISD_LITE_URL.format(year=2022, station_id="725030-14732")
+        gone = isd_module.ISD_LITE_URL.format(year=2023, station_id="725030-14732")
+        ok_route = respx.get(ok).mock(return_value=Response(200, content=b"x"))
+        respx.get(gone).mock(return_value=Response(404))
+
+        files = isd_module.ensure_isd_files(
+            [("725030-14732", y) for y in (2021, 2022, 2023, 2022)]
+        )
+
+        assert files == {
+            ("725030-14732", 2021): cached,
+            ("725030-14732", 2022): isd_module._get_isd_file_path("725030-14732", 2022),
+            ("725030-14732", 2023): None,
+        }
+        assert ok_route.call_count == 1
+
+    def test_bulk_callers_share_downloads(self, monkeypatch):
+        calls = []
+
+        def slow_download(url, path):
+            calls.append(url)
+            threading.Event().wait(0.1)
+            path.write_bytes(b"x")
+            return path
+
+        monkeypatch.setattr(isd_module, "download_with_retry", slow_download)
+        wanted = [("725030-14732", 2022), ("725030-14732", 2023)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(lambda _: isd_module.ensure_isd_files(wanted), range(4))
+            )
+        assert len(calls) == 2
+        assert all(r == results[0] for r in results)
+        assert None not in results[0].values()
+
 
 @pytest.fixture
 def city_db(tmp_path) -> Database:
@@ -4,10 +4,12 @@ from datetime import date
 
 import pytest
 
+from get_weather_data.core.config import Config, set_config
 from get_weather_data.core.database import INDEX_VERSION, Database
 from get_weather_data.core.distance import Station
 from get_weather_data.weather import lookup as lookup_module
 from get_weather_data.weather.lookup import WeatherLookup
+from get_weather_data.weather.result_cache import ResultCache
 
 DAY = date(2024, 1, 15)
 
@@ -211,3 +213,191 @@ class TestLocationInput:
         result = _lookup(city_db).get_weather("99999", DAY)
         assert result.zipcode == "99999"
         assert result.station_id is None
+
+
+class TestRange:
+    """Ranges read each station once, with the same per-day fallback."""
+
+    def test_one_read_per_station(self, city_db, monkeypatch):
+        calls: list[tuple] = []
+
+        def ghcn_range(station_id, start, end):
+            calls.append(("ghcn", station_id, start, end))
+            # the GHCN station misses Jan 16 entirely
+            return {
+                date(2024, 1, 15): {"TMAX": -16.0},
+                date(2024, 1, 17): {"TMAX": 10.0},
+            }
+
+        def gsod_range(station_id, start, end):
+            calls.append(("gsod", station_id, start, end))
+            return {date(2024, 1, 16): {"max_temp": 2.0}}
+
+        monkeypatch.setattr(lookup_module, "get_ghcn_data_range", ghcn_range)
+        monkeypatch.setattr(lookup_module, "get_gsod_data_range", gsod_range)
+
+        results = _lookup(city_db).get_weather_range(
+            "10001", DAY, date(2024, 1, 17), elements=["TMAX"]
+        )
+
+        assert [r.tmax for r in results] == [
+            pytest.approx(-1.6),
+            pytest.approx(2.0),
+            pytest.approx(1.0),
+        ]
+        assert [r.station_id for r in results] == [
+            "GHCN1",
+            "725030-14732",
+            "GHCN1",
+        ]
+        assert calls == [
+            ("ghcn", "GHCN1", DAY, date(2024, 1, 17)),
+            ("gsod", "725030-14732", DAY, date(2024, 1, 17)),
+        ]
+
+    def test_matches_point_lookups(self, city_db, monkeypatch):
+        per_day = {
+            date(2024, 1, 15): {"TMAX": -16.0, "PRCP": 0.0},
+            date(2024, 1, 16): {"TMAX": 5.0},
+        }
+        monkeypatch.setattr(
+            lookup_module,
+            "get_ghcn_data",
+            lambda station_id, target_date: dict(per_day.get(target_date, {})),
+        )
+        monkeypatch.setattr(
+            lookup_module,
+            "get_ghcn_data_range",
+            lambda station_id, start, end: per_day,
+        )
+        lookup = _lookup(city_db, use_gsod=False, explain=True)
+        ranged = lookup.get_weather_range("10001", DAY, date(2024, 1, 16))
+        single = [lookup.get_weather("10001", day) for day in per_day]
+        assert ranged == single
+
+    def test_unknown_zip(self, city_db):
+        results = _lookup(city_db).get_weather_range("99999", DAY, date(2024, 1, 16))
+        assert [r.zipcode for r in results] == ["99999", "99999"]
+        assert all(r.station_id is None for r in results)
+
+
+class TestBatch:
+    """Batches read each station-year once and answer in input order."""
+
+    def test_matches_point_lookups(self, city_db, monkeypatch):
+        per_day = {
+            date(2023, 6, 1): {"TMAX": 250.0},
+            DAY: {"TMAX": -16.0, "PRCP": 0.0},
+            date(2024, 1, 16): {"TMAX": 5.0},
+        }
+        reads: list[tuple] = []
+
+        def ghcn_range(station_id, start, end):
+            reads.append((station_id, start, end))
+            return {d: v for d, v in per_day.items() if start <= d <= end}
+
+        monkeypatch.setattr(
+            lookup_module,
+            "get_ghcn_data",
+            lambda station_id, target_date: dict(per_day.get(target_date, {})),
+        )
+        monkeypatch.setattr(lookup_module, "get_ghcn_data_range", ghcn_range)
+        lookup = _lookup(city_db, use_gsod=False, explain=True)
+        queries = [
+            ("10001", date(2024, 1, 16)),
+            ((40.75, -74.0), date(2023, 6, 1)),
+            ("10001", DAY),
+            ("10001", date(2023, 6, 1)),
+        ]
+        batch = lookup.get_weather_batch(queries)
+        assert batch == [lookup.get_weather(loc, day) for loc, day in queries]
+        assert sorted(reads) == [
+            ("GHCN1", date(2023, 6, 1), date(2023, 6, 1)),
+            ("GHCN1", DAY, date(2024, 1, 16)),
+        ]
+
+    def test_bad_location_isolated(self, city_db, monkeypatch):
+        _mock_ghcn(monkeypatch, {"TMAX": -16.0})
+        monkeypatch.setattr(
+            lookup_module,
+            "get_ghcn_data_range",
+            lambda station_id, start, end: {start: {"TMAX": -16.0}},
+        )
+        results = _lookup(city_db, use_gsod=False).get_weather_batch(
+            [("not a place", DAY), ("99999", DAY), ("10001", DAY)]
+        )
+        assert isinstance(results[0], ValueError)
+        assert results[1].station_id is None
+        assert results[2].tmax == pytest.approx(-1.6)
+
+    def test_failed_read_not_repeated(self, city_db, monkeypatch):
+        reads = []
+
+        def failing_range(station_id, start, end):
+            reads.append(station_id)
+            raise RuntimeError("Failed to download GHCN data for 2024")
+
+        monkeypatch.setattr(lookup_module, "get_ghcn_data_range", failing_range)
+        days = [date(2024, 1, d) for d in range(1, 6)]
+        results = _lookup(city_db, use_gsod=False).get_weather_batch(
+            [("10001", day) for day in days]
+        )
+        assert reads == ["GHCN1"]
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    def test_station_years_in_first_touch_order(self, city_db):
+        queries = [
+            ("10001", date(2023, 5, 1)),
+            ("not a place", DAY),
+            ("10001", DAY),
+            ("10001", date(2023, 9, 1)),
+        ]
+        lookup = _lookup(city_db)
+        assert lookup.station_years(queries) == [
+            ("GHCN1", "GHCND", 2023),
+            ("GHCN1", "GHCND", 2024),
+        ]
+        assert _lookup(city_db, use_ghcn=False).station_years(queries) == [
+            ("725030-14732", "USAF-WBAN", 2023),
+            ("725030-14732", "USAF-WBAN", 2024),
+        ]
+        assert len(lookup.station_years(queries, stations=2)) == 4
+
+
+class TestResultCache:
+    """Stored results answer repeat lookups without reading station data."""
+
+    def test_repeat_lookup_is_a_hit(self, city_db, monkeypatch, tmp_path):
+        calls: list[date] = []
+
+        def ghcn(station_id, target_date):
+            calls.append(target_date)
+            return {"TMAX": -16.0, "PRCP": 0.0}
+
+        monkeypatch.setattr(lookup_module, "get_ghcn_data", ghcn)
+        store = ResultCache(tmp_path / "results.sqlite")
+        first = _lookup(city_db, use_gsod=False, result_cache=store)
+        result = first.get_weather("10001", date(2020, 1, 15), ["TMAX"])
+
+        # A fresh lookup (e.g. tomorrow's run) reuses the stored result
+        second = _lookup(city_db, use_gsod=False, result_cache=ResultCache(store.path))
+        assert second.get_weather("10001", date(2020, 1, 15), ["TMAX"]) == result
+        assert len(calls) == 1
+        info = second.cache_info()["results"]
+        assert (info.hits, info.misses, info.currsize) == (1, 0, 1)
+
+        # Different settings are a different key
+        imperial = _lookup(
+            city_db, use_gsod=False, units="imperial", result_cache=store
+        )
+        imperial.get_weather("10001", date(2020, 1, 15), ["TMAX"])
+        assert len(calls) == 2
+
+    def test_enabled_from_config(self, city_db, monkeypatch, tmp_path):
+        set_config(Config(cache_dir=tmp_path / "cache", result_cache=True))
+        try:
+            lookup = _lookup(city_db)
+            assert lookup.result_cache is not None
+            assert lookup.result_cache.path.parent == tmp_path / "cache" / "results"
+        finally:
+            set_config(Config())
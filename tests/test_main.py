@@ -152,6 +152,8 @@ class TestSetupAndProcess:
         w.setup()
         assert calls == ["ghcn", "isd", "zip", "index"]
         assert w.db.get_meta("index_version") is not None
+        assert w.db.station_indexes_current()
+        assert w.db.compact_tables_current()
 
     def test_process_csv_forwards(self, tmp_path, monkeypatch):
         import get_weather_data.main as main_module
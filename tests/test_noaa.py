@@ -1,5 +1,7 @@
 """Tests for the NOAA CDO v2 client and online lookup (all mocked)."""
 
+import threading
+import time
 from datetime import date
 
 import pytest
@@ -8,12 +10,15 @@ from httpx import Response
 
 from get_weather_data.api.noaa import (
     CDO_BASE_URL,
+    CDORateLimiter,
     NOAAAPIError,
     NOAAClient,
     StationInfo,
 )
+from get_weather_data.core import ratelimit as ratelimit_module
 from get_weather_data.core.config import Config, set_config
 from get_weather_data.main import Weather
+from get_weather_data.weather import online as online_module
 from get_weather_data.weather.online import OnlineLookup
 
 DATA_URL = f"{CDO_BASE_URL}/data"
@@ -155,6 +160,50 @@ class TestNOAAClientPagination:
         second = route.calls[1].request.url
         assert second.params["offset"] == "1001"
 
+    @respx.mock
+    def test_later_pages_fetched_concurrently(self):
+        def page(request):
+            offset = int(request.url.params["offset"])
+            # Slow enough that pages fetched one by one would take 0.6 s
+            threading.Event().wait(0.1)
+            size = 1000 if offset < 5001 else 200
+            rows = [_record("TMAX", float(offset + i)) for i in range(size)]
+            return Response(200, json=_data_payload(rows, count=5200))
+
+        route = respx.get(DATA_URL).mock(side_effect=page)
+        started = time.monotonic()
+        records = _client().get_data("10001", date(2024, 1, 15), date(2024, 1, 15))
+        elapsed = time.monotonic() - started
+        assert route.call_count == 6
+        assert [r["value"] for r in records] == [float(v) for v in range(1, 5201)]
+        assert elapsed < 0.45
+
+
+class TestRateLimiter:
+    """Per-token pacing and the daily quota."""
+
+    def test_requests_spaced_at_rate(self, monkeypatch):
+        monkeypatch.setattr(ratelimit_module.time, "monotonic", lambda: 100.0)
+        limiter = CDORateLimiter(per_second=5)
+        delays = [limiter.reserve() for _ in range(4)]
+        assert delays == pytest.approx([0.0, 0.2, 0.4, 0.6])
+
+    def test_daily_quota(self):
+        limiter = CDORateLimiter(per_second=0, per_day=2)
+        limiter.reserve()
+        limiter.reserve()
+        assert limiter.used_today == 2
+        with pytest.raises(NOAAAPIError, match="daily quota"):
+            limiter.reserve()
+
+    def test_clients_with_one_token_share_a_limiter(self):
+        assert _client().limiter is _client().limiter
+        assert _client().limiter is not _client(token="other-token").limiter
+
+    def test_max_concurrency_validated(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            _client(max_concurrency=0)
+
 
 class TestNOAAClientStation:
     """Station metadata endpoint."""
@@ -335,10 +384,72 @@ class TestOnlineLookup:
         )
         self._lookup().get_weather_range("10001", date(2023, 12, 30), date(2024, 1, 2))
         assert data_route.call_count == 2
-        first = data_route.calls[0].request.url.params
-        second = data_route.calls[1].request.url.params
-        assert first["enddate"] == "2023-12-31"
-        assert second["startdate"] == "2024-01-01"
+        # The chunks are requested concurrently, so in either order
+        spans = sorted(
+            (call.request.url.params["startdate"], call.request.url.params["enddate"])
+            for call in data_route.calls
+        )
+        assert spans == [("2023-12-30", "2023-12-31"), ("2024-01-01", "2024-01-02")]
+
+    def _many_lookup(self) -> OnlineLookup:
+        zips = {"10001": (40.7484, -73.9967), "10011": (40.7418, -74.0002)}
+        return self._lookup(zip_coordinates_loader=lambda: zips)
+
+    @respx.mock
+    def test_many_shares_one_data_request(self):
+        near = self._station_entry(STATION, "NY CITY CENTRAL PARK", 40.78, -73.97)
+        far = self._station_entry(
+            "GHCND:USW00014732", "LAGUARDIA AIRPORT", 40.78, -73.88
+        )
+        stations_route = self._mock_stations([near, far])
+        data_route = respx.get(DATA_URL).mock(
+            return_value=Response(
+                200,
+                json=_data_payload(
+                    [
+                        _record("TMAX", -10),
+                        _record("SNOW", 25, station="GHCND:USW00014732"),
+                    ]
+                ),
+            )
+        )
+        lookup = self._many_lookup()
+        results = lookup.get_weather_many(
+            ["10001", "10011", "99999"], date(2024, 1, 15), date(2024, 1, 15)
+        )
+        # One search per ZIP, but both share a single /data request
+        assert stations_route.call_count == 2
+        assert data_route.call_count == 1
+        assert [r[0].tmax for r in results] == [-1.0, -1.0, None]
+        assert [r[0].snow for r in results] == [25, 25, None]
+        assert results[2][0].zipcode == "99999"
+        assert results[0] == lookup.get_weather_range(
+            "10001", date(2024, 1, 15), date(2024, 1, 15)
+        )
+
+    @respx.mock
+    def test_many_packs_station_ids(self, monkeypatch):
+        monkeypatch.setattr(online_module, "MAX_STATIONS_PER_REQUEST", 1)
+        near = self._station_entry(STATION, "NY CITY CENTRAL PARK", 40.78, -73.97)
+        far = self._station_entry(
+            "GHCND:USW00014732", "LAGUARDIA AIRPORT", 40.78, -73.88
+        )
+        self._mock_stations([near, far])
+        data_route = respx.get(DATA_URL).mock(
+            side_effect=lambda request: Response(
+                200,
+                json=_data_payload(
+                    [_record("TMAX", -10, station=request.url.params["stationid"])]
+                ),
+            )
+        )
+        results = self._many_lookup().get_weather_many(
+            ["10001", "10011"], date(2024, 1, 15), date(2024, 1, 15)
+        )
+        assert data_route.call_count == 2
+        sent = sorted(call.request.url.params["stationid"] for call in data_route.calls)
+        assert sent == ["GHCND:USW00014732", STATION]
+        assert [r[0].station_id for r in results] == ["USW00094728"] * 2
 
 
 class TestOnlineRobustness:
@@ -405,9 +516,9 @@ class TestOnlineRobustness:
         lookup.get_weather((40.7502, -73.9901), date(2024, 3, 1))
         assert stations_route.call_count == 1
 
-    def test_info_raises_in_online_mode(self, monkeypatch):
+    def test_info_raises_in_online_mode(self, monkeypatch, tmp_path):
         monkeypatch.setenv("NCDC_TOKEN", "test-token")
-        set_config(Config())
+        set_config(Config(cache_dir=tmp_path))
         weather = Weather(online=True)
         with pytest.raises(RuntimeError, match="online=True"):
             weather.info()
@@ -417,9 +528,9 @@ class TestWeatherOnline:
     """End-to-end through the Weather facade."""
 
     @respx.mock
-    def test_get_online(self, monkeypatch):
+    def test_get_online(self, monkeypatch, tmp_path):
         monkeypatch.setenv("NCDC_TOKEN", "test-token")
-        set_config(Config())
+        set_config(Config(cache_dir=tmp_path))
         respx.get(f"{CDO_BASE_URL}/stations").mock(
             return_value=Response(
                 200,
@@ -454,7 +565,7 @@ class TestWeatherOnline:
 
     def test_process_csv_online_raises(self, monkeypatch, tmp_path):
         monkeypatch.setenv("NCDC_TOKEN", "test-token")
-        set_config(Config())
+        set_config(Config(cache_dir=tmp_path))
         weather = Weather(online=True)
         with pytest.raises(ValueError, match="local database"):
             weather.process_csv(tmp_path / "in.csv", tmp_path / "out.csv")
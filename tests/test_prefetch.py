@@ -0,0 +1,127 @@
+"""Tests for warming the yearly GHCN cache."""
+
+import csv
+import gzip
+import io
+from datetime import date
+
+import pytest
+
+from get_weather_data.core.config import Config, get_config, set_config
+from get_weather_data.main import Weather
+from get_weather_data.weather import ghcn, prefetch
+from get_weather_data.weather.prefetch import (
+    BackgroundPrefetch,
+    parse_years,
+    prefetch_ghcn_years,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config(tmp_path, monkeypatch):
+    monkeypatch.delenv("NCDC_TOKEN", raising=False)
+    set_config(Config(ncdc_token=None, data_dir=tmp_path, cache_dir=tmp_path))
+    ghcn._columnar_years.clear()
+    yield
+    ghcn._columnar_years.clear()
+    if hasattr(ghcn._connections, "pool"):
+        del ghcn._connections.pool
+
+
+def _place_archive(year: int, station_id: str) -> None:
+    """Leave a year archive in the cache so the build needs no network."""
+    buf = io.StringIO()
+    csv.writer(buf).writerow([station_id, f"{year}0115", "TMAX", "25", "", "", "W", ""])
+    path = get_config().ghcn_cache_dir / f"{year}.csv.gz"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(gzip.compress(buf.getvalue().encode()))
+
+
+class TestParseYears:
+    def test_ranges_and_singles(self):
+        assert parse_years("2003-2005, 1999,2004") == [1999, 2003, 2004, 2005]
+
+    @pytest.mark.parametrize("spec", ["20x0", "2005-2003", " , "])
+    def test_invalid(self, spec):
+        with pytest.raises(ValueError, match=r"ear|No years"):
+            parse_years(spec)
+
+
+class TestPrefetch:
+    def test_in_process_reports_each_year(self, monkeypatch):
+        def fake_ensure(year):
+            if year == 2002:
+                raise RuntimeError("Failed to download GHCN data for 2002")
+            return year == 2001
+
+        monkeypatch.setattr(prefetch, "ensure_ghcn_year", fake_ensure)
+        seen: list[tuple[int, int, int]] = []
+
+        outcomes = prefetch_ghcn_years(
+            [2002, 2000, 2001, 2001],
+            jobs=1,
+            progress=lambda o, done, total: seen.append((o.year, done, total)),
+        )
+
+        assert [(o.year, o.built, o.error is None) for o in outcomes] == [
+            (2000, False, True),
+            (2001, True, True),
+            (2002, False, False),
+        ]
+        assert "2002" in (outcomes[2].error or "")
+        assert seen == [(2000, 1, 3), (2001, 2, 3), (2002, 3, 3)]
+
+    def test_worker_processes_build_years(self):
+        for year in (2010, 2011):
+            _place_archive(year, f"USW{year}")
+
+        outcomes = prefetch_ghcn_years([2010, 2011], jobs=2)
+
+        assert [(o.year, o.built, o.error) for o in outcomes] == [
+            (2010, True, None),
+            (2011, True, None),
+        ]
+        assert ghcn.get_ghcn_data("USW2011", date(2011, 1, 15))["TMAX"] == 25.0
+        # Second pass finds both years cached
+        again = prefetch_ghcn_years([2010, 2011], jobs=2)
+        assert [o.built for o in again] == [False, False]
+
+    def test_rejects_bad_jobs(self):
+        with pytest.raises(ValueError, match="jobs"):
+            prefetch_ghcn_years([2010], jobs=0)
+
+    def test_weather_prefetch_offline_only(self, monkeypatch):
+        monkeypatch.setenv("NCDC_TOKEN", "test-token")
+        set_config(Config())
+        with pytest.raises(ValueError, match="online"):
+            Weather(online=True).prefetch([2010])
+
+
+class TestBackgroundPrefetch:
+    def test_each_fetch_queued_once(self, monkeypatch):
+        fetched = []
+        monkeypatch.setattr(prefetch, "ensure_ghcn_year", fetched.append)
+
+        def fail_gsod(station_id, year):
+            raise RuntimeError("offline")
+
+        monkeypatch.setattr(prefetch, "ensure_gsod_year", fail_gsod)
+        prefetcher = BackgroundPrefetch(jobs=2)
+        added = prefetcher.add(
+            [
+                ("USW1", "GHCND", 2020),
+                ("USW2", "GHCND", 2020),
+                ("725030-14732", "USAF-WBAN", 2020),
+                ("725030-14732", "USAF-WBAN", 2020),
+                ("X", "OTHER", 2020),
+            ]
+        )
+        prefetcher.wait()
+        prefetcher.close()
+        assert added == 2
+        assert fetched == [2020]
+        assert (prefetcher.queued, prefetcher.completed, prefetcher.failed) == (
+            2,
+            1,
+            1,
+        )
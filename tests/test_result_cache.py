@@ -0,0 +1,61 @@
+"""Tests for the persistent lookup result cache."""
+
+from datetime import date
+
+import pytest
+
+from get_weather_data.core.config import Config, set_config
+from get_weather_data.weather.result_cache import ResultCache, result_key
+from get_weather_data.weather.results import WeatherResult
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config(tmp_path):
+    set_config(Config(ncdc_token=None, data_dir=tmp_path, cache_dir=tmp_path))
+    yield
+    set_config(Config())
+
+
+@pytest.fixture
+def store(tmp_path) -> ResultCache:
+    return ResultCache(tmp_path / "results.sqlite")
+
+
+def _result(day: date, **values) -> WeatherResult:
+    return WeatherResult(date=day, zipcode="10001", station_id="GHCN1", **values)
+
+
+class TestResultCache:
+    def test_round_trip(self, store):
+        result = _result(
+            date(2020, 1, 15),
+            tmax=-1.6,
+            flags={"tmax": ""},
+            weather_types={"fog", "rain"},
+        )
+        store.put("k", result)
+        assert store.get("k") == result
+        assert store.get("other") is None
+        assert store.info() == (1, 1, None, 1)
+
+    def test_key_is_canonical(self):
+        assert result_key({"a": 1, "b": 2}) == result_key({"b": 2, "a": 1})
+        assert result_key(["TMAX", "PRCP"]) != result_key(["PRCP", "TMAX"])
+
+    def test_final_year_never_expires(self, store):
+        set_config(Config(ncdc_token=None, cache_max_age_days=0))
+        store.put("old", _result(date(2000, 7, 1), tmax=30.0))
+        assert store.get("old") is not None
+
+    def test_recent_and_partial_results_expire(self, store):
+        set_config(Config(ncdc_token=None, cache_max_age_days=0))
+        store.put("recent", _result(date.today(), tmax=30.0))
+        store.put("partial", _result(date(2000, 7, 1)), complete=False)
+        assert store.get("recent") is None
+        assert store.get("partial") is None
+
+    def test_clear(self, store):
+        store.put("k", _result(date(2000, 7, 1)))
+        store.get("k")
+        store.clear()
+        assert store.info() == (0, 0, None, 0)
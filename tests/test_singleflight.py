@@ -0,0 +1,62 @@
+"""Tests for coalescing concurrent calls (SingleFlight)."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from get_weather_data.core.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_fetch():
+    flights = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        threading.Event().wait(0.1)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(flights.do, "k", fetch) for _ in range(5)]
+        results = [f.result() for f in futures]
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert len(flights) == 0
+
+
+def test_later_call_fetches_again():
+    flights = SingleFlight()
+    assert flights.do("k", lambda: 1) == 1
+    assert flights.do("k", lambda: 2) == 2
+
+
+def test_distinct_keys_do_not_wait_on_each_other():
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def blocked():
+        release.wait(5)
+        return "a"
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        slow = pool.submit(flights.do, "a", blocked)
+        assert flights.do("b", lambda: "b") == "b"
+        release.set()
+        assert slow.result() == "a"
+
+
+def test_error_reaches_every_waiter():
+    flights = SingleFlight()
+    gate = threading.Event()
+
+    def fail():
+        gate.wait(0.1)
+        raise RuntimeError("down")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(flights.do, "k", fail) for _ in range(3)]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="down"):
+                future.result()
+    assert len(flights) == 0
@@ -0,0 +1,126 @@
+"""Tests for the persisted, memory-mapped station grid index."""
+
+import random
+
+import pytest
+
+from get_weather_data.core.database import Database
+from get_weather_data.core.distance import (
+    KDTREE_AVAILABLE,
+    Station,
+    StationIndex,
+    _find_closest_brute,
+)
+from get_weather_data.core.station_grid import StationGrid, write_station_grid
+
+
+def _stations(n: int, seed: int = 3) -> list[Station]:
+    rng = random.Random(seed)  # noqa: S311 - deterministic test fixture
+    return [
+        Station(
+            id=f"USW{i:08d}",
+            name=f"STATION {i}",
+            lat=rng.uniform(25.0, 49.0),
+            lon=rng.uniform(-124.0, -67.0),
+            type="GHCND",
+            state="NY" if i % 2 else "",
+            elevation=None if i % 3 else float(i),
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def grid(tmp_path):
+    stations = _stations(400)
+    path = tmp_path / "w.GHCND.stations"
+    assert write_station_grid(path, stations, "GHCND") == 400
+    return StationGrid(path), stations
+
+
+class TestStationGrid:
+    def test_matches_brute_force(self, grid):
+        index, stations = grid
+        rng = random.Random(11)  # noqa: S311 - deterministic test fixture
+        for _ in range(40):
+            lat, lon = rng.uniform(20.0, 52.0), rng.uniform(-130.0, -60.0)
+            got = index.find_closest(lat, lon, n=6)
+            expected = _find_closest_brute(lat, lon, stations, 6, None)
+            assert [sd.distance_meters for sd in got] == [
+                sd.distance_meters for sd in expected
+            ]
+            assert {sd.station.id for sd in got} == {sd.station.id for sd in expected}
+
+    def test_far_query_still_finds_stations(self, grid):
+        index, _ = grid
+        assert len(index.find_closest(-40.0, 150.0, n=3)) == 3
+
+    def test_max_distance(self, grid):
+        index, stations = grid
+        got = index.find_closest(40.0, -100.0, n=50, max_distance_km=150)
+        expected = _find_closest_brute(40.0, -100.0, stations, 50, 150)
+        assert [sd.station.id for sd in got] == [sd.station.id for sd in expected]
+
+    def test_round_trips_station_fields(self, grid):
+        index, stations = grid
+        assert len(index) == 400
+        by_id = {s.id: s for s in index.stations}
+        assert by_id == {s.id: s for s in stations}
+
+    @pytest.mark.skipif(not KDTREE_AVAILABLE, reason="needs numpy and scipy")
+    def test_batch_matches_station_index(self, grid):
+        index, stations = grid
+        points = [(40.0 + i / 10, -90.0 - i / 5) for i in range(30)]
+        assert index.closest_pairs(points, 4) == StationIndex(stations).closest_pairs(
+            points, 4
+        )
+
+
+class TestDatabaseStationIndex:
+    def test_saved_index_is_mapped_until_stations_change(
+        self, temp_db: Database, sample_stations
+    ):
+        temp_db.insert_stations_bulk(sample_stations)
+        assert temp_db.save_station_indexes() == {"GHCND": 2, "USAF-WBAN": 1}
+
+        fresh = Database(temp_db.path)
+        mapped = fresh.get_station_index("GHCND")
+        assert isinstance(mapped, StationGrid)
+        assert [sd.station.id for sd in mapped.find_closest(31.0, -87.0, n=1)] == [
+            "USC00011084"
+        ]
+
+        fresh.insert_station(
+            Station(id="NEW1", name="NEW", lat=31.0, lon=-87.0, type="GHCND")
+        )
+        assert not fresh.station_index_path("GHCND").exists()
+        assert isinstance(fresh.get_station_index("GHCND"), StationIndex)
+
+    def test_same_count_update_ignored(self, temp_db: Database, sample_stations):
+        temp_db.insert_stations_bulk(sample_stations)
+        temp_db.save_station_indexes()
+        temp_db.close()
+        reopened = Database(temp_db.path)
+        assert isinstance(reopened.get_station_index("GHCND"), StationGrid)
+        reopened.close()
+        # A re-import moves a station without changing the row count
+        Database(temp_db.path).execute_many(
+            "UPDATE stations SET lat = ?, lon = ? WHERE id = ?",
+            [(45.0, -100.0, "USC00011084")],
+        )
+        index = Database(temp_db.path).get_station_index("GHCND")
+        assert isinstance(index, StationIndex)
+        closest = index.find_closest(45.0, -100.0, n=1)
+        assert [sd.station.id for sd in closest] == ["USC00011084"]
+
+    def test_stale_file_ignored(self, temp_db: Database, sample_stations):
+        temp_db.insert_stations_bulk(sample_stations[:1])
+        temp_db.save_station_indexes()
+        # Another process adds stations without going through this Database
+        Database(temp_db.path).execute_many(
+            "INSERT INTO stations (id, name, lat, lon, type) VALUES (?, ?, ?, ?, ?)",
+            [("X1", "X", 31.0, -87.0, "GHCND")],
+        )
+        index = Database(temp_db.path).get_station_index("GHCND")
+        assert isinstance(index, StationIndex)
+        assert "X1" in {s.id for s in index.stations}
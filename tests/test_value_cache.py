@@ -0,0 +1,120 @@
+"""Tests for the byte-budgeted value cache."""
+
+from datetime import date
+
+import pytest
+
+from get_weather_data.core.config import DEFAULT_VALUE_CACHE_BYTES, Config, set_config
+from get_weather_data.core.value_cache import ValueCache
+from get_weather_data.weather import lookup as lookup_module
+
+
+def _unit_size(key, value) -> int:
+    return 10
+
+
+class TestValueCache:
+    def test_lru_evicts_least_recent_within_budget(self):
+        cache = ValueCache(30, "lru", sizeof=_unit_size)
+        for key in "abc":
+            cache.put(key, key.upper())
+        assert cache.get("a") == "A"
+        cache.put("d", "D")
+        assert cache.get("b") is None
+        assert [cache.get(k) for k in "acd"] == ["A", "C", "D"]
+        info = cache.info()
+        assert (info.currsize, info.bytes, info.evictions) == (3, 30, 1)
+        assert info.hit_rate == pytest.approx(4 / 5)
+
+    def test_lfu_keeps_frequent_entries(self):
+        cache = ValueCache(30, "lfu", sizeof=_unit_size)
+        for key in "abc":
+            cache.put(key, key)
+        for _ in range(3):
+            cache.get("a")
+        cache.get("c")
+        cache.put("d", "d")  # evicts b (used least)
+        cache.put("e", "e")  # evicts d (one use, older than c's two)
+        assert cache.get("b") is None
+        assert cache.get("d") is None
+        assert [cache.get(k) for k in "ace"] == ["a", "c", "e"]
+
+    def test_zero_budget_and_oversized_values_not_stored(self):
+        cache = ValueCache(0)
+        cache.put("a", {"TMAX": 1.0})
+        assert cache.get("a") is None
+        cache = ValueCache(15, sizeof=lambda k, v: len(v))
+        cache.put("big", "x" * 20)
+        assert len(cache) == 0
+
+    def test_replacing_a_key_updates_bytes(self):
+        cache = ValueCache(100, sizeof=lambda k, v: len(v))
+        cache.put("a", "xx")
+        cache.put("a", "xxxx")
+        assert cache.info().bytes == 4
+        cache.clear()
+        assert cache.info() == (0, 0, None, 0, 0, 100, 0)
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError, match="policy"):
+            ValueCache(10, "fifo")  # type: ignore[arg-type]
+
+
+class TestLookupPartitions:
+    def test_partitions_follow_config(self, tmp_path, monkeypatch):
+        set_config(
+            Config(
+                data_dir=tmp_path,
+                cache_dir=tmp_path,
+                value_cache_bytes={"ghcn": 1 << 20, "gsod": 0},
+                value_cache_policy="lfu",
+            )
+        )
+        lookup_module.clear_value_caches()
+        calls = []
+        monkeypatch.setattr(
+            lookup_module,
+            "get_ghcn_data",
+            lambda station_id, target_date: calls.append(station_id) or {},
+        )
+        monkeypatch.setattr(
+            lookup_module, "get_gsod_data", lambda station_id, target_date: {}
+        )
+        try:
+            day = date(2020, 1, 1)
+            for _ in range(2):
+                lookup_module._cached_ghcn_data("GHCN1", day)
+                lookup_module._cached_gsod_data("725030-14732", day)
+            assert calls == ["GHCN1"]
+            ghcn = lookup_module._value_cache("ghcn")
+            assert (ghcn.policy, ghcn.max_bytes) == ("lfu", 1 << 20)
+            assert ghcn.info().hits == 1
+            # No budget for GSOD: every lookup is a miss
+            assert lookup_module._value_cache("gsod").info().hits == 0
+        finally:
+            set_config(Config())
+            lookup_module.clear_value_caches()
+
+    def test_omitted_source_keeps_default(self, tmp_path):
+        config = Config(
+            data_dir=tmp_path, cache_dir=tmp_path, value_cache_bytes={"ghcn": 0}
+        )
+        assert config.value_cache_bytes == {
+            "ghcn": 0,
+            "gsod": DEFAULT_VALUE_CACHE_BYTES["gsod"],
+        }
+
+    @pytest.mark.parametrize(
+        ("budgets", "match"),
+        [
+            ({"ghnc": 1 << 20}, "Unknown value_cache_bytes source"),
+            ({"gsod": -1}, ">= 0"),
+        ],
+    )
+    def test_config_rejects_bad_budgets(self, tmp_path, budgets, match):
+        with pytest.raises(ValueError, match=match):
+            Config(data_dir=tmp_path, cache_dir=tmp_path, value_cache_bytes=budgets)
+
+    def test_config_rejects_unknown_policy(self, tmp_path):
+        with pytest.raises(ValueError, match="value_cache_policy"):
+            Config(data_dir=tmp_path, cache_dir=tmp_path, value_cache_policy="mru")  # type: ignore[arg-type]
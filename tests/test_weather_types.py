@@ -57,7 +57,6 @@ def _isolated_ghcn(tmp_path, monkeypatch):
     """Point GHCN caches at a temp dir and reset module-level pools."""
     monkeypatch.delenv("NCDC_TOKEN", raising=False)
     set_config(Config(ncdc_token=None, data_dir=tmp_path, cache_dir=tmp_path))
-    ghcn._year_locks.clear()
     if hasattr(ghcn._connections, "pool"):
         del ghcn._connections.pool
     yield